@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Measure checkpoint size: full DialogueState vs compact representation.
+
+For every flow of a config (the banking example by default) a mid-flow state
+is built: the flow on the stack, its collect slots filled, every step but the
+last executed, plus the transient fields a turn leaves behind (commands,
+pending responses). Channel values are serialized with LangGraph's default
+serializer as written by a checkpointer, with and without
+CompactCheckpointSaver's rewriting, and the bytes per checkpoint reported.
+The step orders compact checkpoints refer to are stored once per flow version,
+outside the checkpoints; their size is reported separately.
+
+Usage:
+    uv run python scripts/benchmark_checkpoint_size.py
+    uv run python scripts/benchmark_checkpoint_size.py --config examples/ecommerce/domain
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from langchain_core.messages import HumanMessage  # noqa: E402
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer  # noqa: E402
+
+from soni.compiler.plan import _flatten_inline_steps  # noqa: E402
+from soni.config.loader import ConfigLoader  # noqa: E402
+from soni.config.models import CollectStepConfig, FlowConfig  # noqa: E402
+from soni.core.state import create_empty_state  # noqa: E402
+from soni.runtime.checkpoint import StepIndex, compact_values  # noqa: E402
+
+DEFAULT_CONFIG = Path(__file__).parent.parent / "examples" / "banking" / "domain"
+
+
+def mid_flow_values(flow_name: str, flow: FlowConfig) -> dict[str, Any]:
+    """Channel values of a thread paused on the last step of ``flow_name``."""
+    steps = _flatten_inline_steps(list(flow.steps))
+    flow_id = f"{flow_name}_3f2b9c1e"
+    slots = {
+        step.slot: f"value for {step.slot}" for step in steps if isinstance(step, CollectStepConfig)
+    }
+
+    values: dict[str, Any] = dict(create_empty_state())
+    values.update(
+        {
+            "user_message": "yes, go ahead",
+            "messages": [HumanMessage(content=f"message {i}", id=f"msg-{i}") for i in range(6)],
+            "flow_stack": [
+                {
+                    "flow_id": flow_id,
+                    "flow_name": flow_name,
+                    "flow_state": "active",
+                    "current_step": steps[-1].step,
+                    "step_index": len(steps) - 1,
+                }
+            ],
+            "flow_slots": {flow_id: slots},
+            "_executed_steps": {flow_id: {step.step for step in steps[:-1]}},
+            "commands": [
+                {"type": "set_slot", "slot": name, "value": value} for name, value in slots.items()
+            ],
+            "_pending_responses": ["Got it.", "Anything else?"],
+            "_branch_target": None,
+            "_loop_flag": None,
+            "_flow_changed": None,
+        }
+    )
+    return values
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG, help="Config path")
+    args = parser.parse_args()
+
+    config = ConfigLoader.load(args.config)
+    serde = JsonPlusSerializer()
+    step_index = StepIndex(config)
+
+    totals = [0, 0]
+    print(f"{'flow':<28} {'steps':>5} {'full':>8} {'compact':>8} {'saved':>7}")
+    for flow_name, flow in config.flows.items():
+        if not flow.steps:
+            continue
+        values = mid_flow_values(flow_name, flow)
+        full = len(serde.dumps_typed(values)[1])
+        compact = len(serde.dumps_typed(compact_values(values, step_index))[1])
+        totals[0] += full
+        totals[1] += compact
+        steps = len(_flatten_inline_steps(list(flow.steps)))
+        print(f"{flow_name:<28} {steps:>5} {full:>8} {compact:>8} {1 - compact / full:>6.1%}")
+
+    print(f"{'total':<28} {'':>5} {totals[0]:>8} {totals[1]:>8} {1 - totals[1] / totals[0]:>6.1%}")
+
+    orders = sum(
+        len(serde.dumps_typed({"order": list(step_index.order(name) or ())})[1])
+        for name in config.flows
+    )
+    print(f"\nstep order records (stored once per flow version): {orders} bytes")
+
+
+if __name__ == "__main__":
+    main()
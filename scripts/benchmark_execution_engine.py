@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark orchestrator overhead: subgraph engine vs direct engine.
+
+Runs orchestrator_node (no NLU, no checkpointer) over a flow of say/set
+steps plus a while loop and reports the mean time per turn for each
+execution engine. Node functions are identical in both runs, so the
+difference is the per-iteration cost of the nested LangGraph astream.
+
+Usage:
+    uv run python scripts/benchmark_execution_engine.py
+    uv run python scripts/benchmark_execution_engine.py --turns 2000 --steps 20
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from soni.config.models import (  # noqa: E402
+    FlowConfig,
+    SayStepConfig,
+    SetStepConfig,
+    Settings,
+    SoniConfig,
+    WhileStepConfig,
+)
+from soni.core.message_sink import BufferedMessageSink  # noqa: E402
+from soni.core.state import create_empty_state  # noqa: E402
+from soni.dm.builder import compile_flows  # noqa: E402
+from soni.dm.nodes.orchestrator import orchestrator_node  # noqa: E402
+from soni.flow.manager import FlowManager  # noqa: E402
+from soni.runtime.context import RuntimeContext  # noqa: E402
+
+
+def build_config(engine: str, linear_steps: int) -> SoniConfig:
+    """A flow with ``linear_steps`` say/set steps, a while guard and a final say."""
+    steps: list = []
+    for i in range(linear_steps):
+        if i % 2:
+            steps.append(SayStepConfig(step=f"say_{i}", message=f"Step {i}: {{total}}"))
+        else:
+            steps.append(SetStepConfig(step=f"set_{i}", slots={"total": i}))
+    steps.append(
+        WhileStepConfig(
+            step="loop",
+            condition="total < 0",
+            do=[SetStepConfig(step="never", slots={"total": 0})],
+            exit_to="done",
+        )
+    )
+    steps.append(SayStepConfig(step="done", message="Done {total}", rephrase=False))
+    return SoniConfig(
+        settings=Settings(execution_engine=engine),
+        flows={"bench": FlowConfig(description="Benchmark flow", steps=steps)},
+    )
+
+
+async def run(engine: str, turns: int, linear_steps: int) -> float:
+    """Return mean seconds per turn for an engine."""
+    config = build_config(engine, linear_steps)
+    flow_manager = FlowManager()
+    context = RuntimeContext(
+        config=config,
+        flow_manager=flow_manager,
+        subgraph_registry=compile_flows(config),
+        message_sink=BufferedMessageSink(),
+        nlu_provider=MagicMock(),
+        slot_extractor=MagicMock(),
+        action_registry=MagicMock(),
+    )
+    runtime = MagicMock()
+    runtime.context = context
+
+    base_state = create_empty_state()
+    base_state["commands"] = [{"type": "start_flow", "flow_name": "bench"}]
+
+    # Warm-up
+    for _ in range(10):
+        await orchestrator_node(dict(base_state), runtime)  # type: ignore[arg-type]
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        await orchestrator_node(dict(base_state), runtime)  # type: ignore[arg-type]
+    return (time.perf_counter() - start) / turns
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=500, help="Turns per engine")
+    parser.add_argument("--steps", type=int, default=10, help="Linear say/set steps in the flow")
+    args = parser.parse_args()
+
+    results = {
+        engine: await run(engine, args.turns, args.steps) for engine in ("subgraph", "direct")
+    }
+
+    print(f"Flow: {args.steps} say/set steps + while guard + say ({args.turns} turns)")
+    for engine, seconds in results.items():
+        print(f"  {engine:<9} {seconds * 1000:8.3f} ms/turn")
+    print(f"  speedup   {results['subgraph'] / results['direct']:8.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
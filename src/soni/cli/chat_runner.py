@@ -9,8 +9,6 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from langgraph.checkpoint.base import BaseCheckpointSaver
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from rich.console import Console
 from rich.prompt import Prompt
 
@@ -20,6 +18,7 @@ from soni.core.dspy_service import DSPyBootstrapper
 from soni.core.errors import ConfigError
 from soni.core.message_sink import MessageSink
 from soni.runtime.loop import RuntimeLoop
+from soni.runtime.persistence import open_checkpointer
 
 BANNER_ART = r"""
   ___  ___  _ __  _
@@ -69,7 +68,7 @@ class ChatRunner:
         self.console = Console()
         self.runtime: RuntimeLoop | None = None
         self.thread_id = config.thread_id or f"cli_{uuid.uuid4().hex[:6]}"
-        self.async_checkpointer_cm: AbstractAsyncContextManager[AsyncSqliteSaver] | None = None
+        self.async_checkpointer_cm: AbstractAsyncContextManager[BaseCheckpointSaver] | None = None
         self._running = False
 
     async def setup(self) -> None:
@@ -117,14 +116,8 @@ class ChatRunner:
 
         # 4. Setup Persistence
         persistence_cfg = soni_config.settings.persistence
-        checkpointer: BaseCheckpointSaver | None = None
-
-        if persistence_cfg.backend == "sqlite":
-            self.async_checkpointer_cm = AsyncSqliteSaver.from_conn_string(persistence_cfg.path)
-            if self.async_checkpointer_cm is not None:
-                checkpointer = await self.async_checkpointer_cm.__aenter__()
-        else:
-            checkpointer = MemorySaver()
+        self.async_checkpointer_cm = open_checkpointer(persistence_cfg)
+        checkpointer = await self.async_checkpointer_cm.__aenter__()
 
         # 5. Initialize Runtime
         # Use default registry to pick up actions registered via decorators
@@ -0,0 +1,48 @@
+"""Compile-profile command: per-flow compile time and graph size."""
+
+from pathlib import Path
+
+import typer
+
+from soni.config.loader import ConfigLoader
+
+app = typer.Typer(help="Profile flow compilation (cold start)")
+
+
+@app.callback(invoke_without_command=True)
+def compile_profile(
+    config: Path = typer.Option(
+        "soni.yaml", "--config", "-c", help="Path to soni.yaml or config directory"
+    ),
+    top: int = typer.Option(0, "--top", "-n", help="Only show the N slowest flows (0 = all)"),
+    workers: int = typer.Option(
+        0, "--workers", "-w", help="Also time a build with N worker processes (0 = skip)"
+    ),
+) -> None:
+    """Report compile time, node count and edge count for every flow."""
+    from soni.compiler.profile import profile_flow_compilation, profile_process_pool
+
+    try:
+        soni_config = ConfigLoader.load(config)
+    except Exception as e:
+        typer.echo(f"Invalid config: {e}", err=True)
+        raise typer.Exit(1)
+
+    profiles = profile_flow_compilation(soni_config)
+    shown = profiles[:top] if top > 0 else profiles
+
+    width = max([len("Flow"), *(len(p.flow_name) for p in shown)])
+    typer.echo(f"{'Flow':<{width}}  {'Time (ms)':>10}  {'Nodes':>6}  {'Edges':>6}")
+    for p in shown:
+        typer.echo(f"{p.flow_name:<{width}}  {p.seconds * 1000:>10.2f}  {p.nodes:>6}  {p.edges:>6}")
+
+    total = sum(p.seconds for p in profiles)
+    typer.echo(f"\n{len(profiles)} flows, total: {total * 1000:.2f} ms")
+
+    if workers > 0:
+        pool = profile_process_pool(soni_config, workers)
+        typer.echo(
+            f"sequential: {pool.sequential_seconds * 1000:.2f} ms, "
+            f"{pool.workers} worker processes: {pool.parallel_seconds * 1000:.2f} ms "
+            f"(speedup {pool.speedup:.2f}x)"
+        )
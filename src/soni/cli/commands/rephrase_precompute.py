@@ -0,0 +1,89 @@
+"""Rephrase-precompute command: rephrase slot-free say messages offline."""
+
+import asyncio
+from pathlib import Path
+
+import typer
+
+from soni.config.loader import ConfigLoader
+
+app = typer.Typer(help="Precompute rephrasings of static messages")
+
+
+@app.callback(invoke_without_command=True)
+def rephrase_precompute(
+    config: Path = typer.Option(..., "--config", "-c", help="Path to soni.yaml", exists=True),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output JSON (default: settings.rephrase_cache.precomputed_path)",
+    ),
+    tone: str | None = typer.Option(
+        None, "--tone", help="Tone to rephrase with (default: settings.rephrase_tone)"
+    ),
+    concurrency: int = typer.Option(4, "--concurrency", min=1, help="Parallel LM requests"),
+) -> None:
+    """Rephrase every say message without slots and save the results.
+
+    Point settings.rephrase_cache.precomputed_path at the output so these
+    messages never call the LM at runtime. Existing entries in the output
+    file are kept unless recomputed (run once per tone).
+    """
+    from soni.core.dspy_service import DSPyBootstrapper
+    from soni.du import ResponseRephraser
+    from soni.du.rephrase_cache import read_precomputed, save_precomputed, static_templates
+
+    try:
+        soni_config = ConfigLoader.load(config)
+    except Exception as e:
+        typer.echo(f"Invalid config: {e}", err=True)
+        raise typer.Exit(1)
+
+    settings = soni_config.settings
+    output_path = output or (
+        Path(settings.rephrase_cache.precomputed_path)
+        if settings.rephrase_cache.precomputed_path
+        else Path("rephrase_cache.json")
+    )
+    effective_tone = tone or settings.rephrase_tone
+    if effective_tone not in ("friendly", "professional", "formal"):
+        typer.echo(f"Unknown tone: {effective_tone}", err=True)
+        raise typer.Exit(1)
+
+    templates = static_templates(soni_config)
+    if not templates:
+        typer.echo("No slot-free say messages to rephrase.")
+        return
+
+    bootstrapper = DSPyBootstrapper(soni_config)
+    bootstrapper.configure()
+    rephraser = ResponseRephraser.create_with_best_model(lm=bootstrapper.module_lm("rephraser"))
+    rephraser.tone = effective_tone
+
+    async def run() -> dict[str, str]:
+        results: dict[str, str] = {}
+        inputs = [(template, "") for template in templates]
+        async for item in rephraser.abatch(inputs, max_concurrency=concurrency):
+            template = templates[item.index]
+            if item.ok and item.result:
+                results[template] = str(item.result)
+            else:
+                typer.echo(f"Failed: {template!r}: {item.error}", err=True)
+        return results
+
+    rephrased = asyncio.run(run())
+
+    entries = {
+        (message, entry_tone): response
+        for message, entry_tone, response in (
+            read_precomputed(output_path) if output_path.exists() else []
+        )
+    }
+    for template, response in rephrased.items():
+        entries[(template, effective_tone)] = response
+    save_precomputed(output_path, [(m, t, r) for (m, t), r in entries.items()])
+
+    typer.echo(
+        f"Rephrased {len(rephrased)}/{len(templates)} messages ({effective_tone}) -> {output_path}"
+    )
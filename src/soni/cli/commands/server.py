@@ -17,6 +17,9 @@ def start_server(
     host: str = typer.Option("0.0.0.0", "--host", "-h"),
     port: int = typer.Option(8000, "--port", "-p"),
     reload: bool = typer.Option(False, "--reload"),
+    watch: bool = typer.Option(
+        False, "--watch", help="Hot-reload flows when the config files change"
+    ),
 ):
     """Start the Soni API server."""
 
@@ -29,6 +32,8 @@ def start_server(
 
     # 2. Set Env Vars for the server process (it loads config from env)
     os.environ["SONI_CONFIG_PATH"] = str(config.absolute())
+    if watch:
+        os.environ["SONI_WATCH_CONFIG"] = "1"
 
     typer.echo(f"🚀 Starting Soni Server on http://{host}:{port}")
     typer.echo(f"   Config: {config}")
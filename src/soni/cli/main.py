@@ -4,7 +4,7 @@ import typer
 from dotenv import load_dotenv
 
 from soni import __version__
-from soni.cli.commands import chat, optimize, server
+from soni.cli.commands import chat, compile_profile, optimize, rephrase_precompute, server
 
 cli = typer.Typer(
     name="soni",
@@ -33,6 +33,8 @@ def main(
 cli.add_typer(chat.app, name="chat")
 cli.add_typer(optimize.app, name="optimize")
 cli.add_typer(server.app, name="server")
+cli.add_typer(compile_profile.app, name="compile-profile")
+cli.add_typer(rephrase_precompute.app, name="rephrase-precompute")
 
 
 if __name__ == "__main__":
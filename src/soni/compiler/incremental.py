@@ -0,0 +1,166 @@
+"""Incremental recompilation for config hot reload.
+
+Each FlowConfig is fingerprinted by a hash of its validated content. On reload
+only added or changed flows are compiled; compiled graphs of unchanged flows
+are carried over to the new registry.
+
+The old registry is read by the caller's thread only: a LazySubgraphRegistry
+is not thread-safe and keeps serving turns on the event loop during a reload.
+``arecompile_changed`` offloads nothing but the compile calls to threads.
+"""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from soni.compiler.registry import CompileFn, LazySubgraphRegistry
+from soni.config.models import FlowConfig, SoniConfig
+
+logger = logging.getLogger(__name__)
+
+
+def flow_fingerprint(flow: FlowConfig) -> str:
+    """Stable content hash of a flow definition."""
+    payload = flow.model_dump_json(exclude_none=True).encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+@dataclass
+class FlowDiff:
+    """Flows added, changed, removed and unchanged between two configs."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    @property
+    def recompile(self) -> list[str]:
+        """Flows that need compiling in the new config."""
+        return [*self.added, *self.changed]
+
+
+def diff_flows(old: SoniConfig, new: SoniConfig) -> FlowDiff:
+    """Compare flow definitions of two configs by fingerprint.
+
+    Switching ``execution_engine`` invalidates every compiled flow, so all
+    flows are reported as changed.
+    """
+    diff = FlowDiff()
+    engine_changed = old.settings.execution_engine != new.settings.execution_engine
+
+    for name, flow in new.flows.items():
+        old_flow = old.flows.get(name)
+        if old_flow is None:
+            diff.added.append(name)
+        elif engine_changed or flow_fingerprint(old_flow) != flow_fingerprint(flow):
+            diff.changed.append(name)
+        else:
+            diff.unchanged.append(name)
+
+    diff.removed = [name for name in old.flows if name not in new.flows]
+    return diff
+
+
+def _reusable(registry: Any, diff: FlowDiff) -> dict[str, Any]:
+    """Compiled flows of ``registry`` that can be carried over unchanged."""
+    if isinstance(registry, LazySubgraphRegistry):
+        return {
+            name: compiled
+            for name in diff.unchanged
+            if (compiled := registry.peek(name)) is not None
+        }
+    return {name: registry[name] for name in diff.unchanged}
+
+
+def _to_compile(
+    new_config: SoniConfig, registry: Any, diff: FlowDiff, reusable: dict[str, Any]
+) -> list[str]:
+    """Flows the new registry needs compiled up front."""
+    if isinstance(registry, LazySubgraphRegistry):
+        # Lazy registries compile changed flows on first use, except prewarmed ones
+        return [
+            name
+            for name in new_config.settings.compilation.prewarm_flows
+            if name in new_config.flows and name not in reusable
+        ]
+    return diff.recompile
+
+
+def _build_registry(
+    new_config: SoniConfig, registry: Any, compiled: dict[str, Any], compile_fn: CompileFn
+) -> Any:
+    """New registry of the same kind as ``registry`` holding ``compiled``."""
+    if isinstance(registry, LazySubgraphRegistry):
+        compilation_cfg = new_config.settings.compilation
+        return LazySubgraphRegistry(
+            new_config,
+            compile_fn,
+            prewarm=compilation_cfg.prewarm_flows,
+            max_compiled=compilation_cfg.max_compiled_flows,
+            preloaded=compiled,
+        )
+    # Keep config order
+    return {name: compiled[name] for name in new_config.flows}
+
+
+def _log_diff(diff: FlowDiff) -> None:
+    logger.info(
+        f"Recompiled flows: added={diff.added} changed={diff.changed} removed={diff.removed}"
+    )
+
+
+def _default_compile_fn() -> CompileFn:
+    from soni.dm.builder import compile_flow
+
+    return compile_flow
+
+
+def recompile_changed(
+    old_config: SoniConfig,
+    new_config: SoniConfig,
+    registry: Any,
+    compile_fn: CompileFn | None = None,
+) -> tuple[Any, FlowDiff]:
+    """Build a registry for ``new_config`` reusing unchanged compiled flows.
+
+    The old registry is left untouched so turns still running against it can
+    finish. Eager registries (dicts) stay eager; a LazySubgraphRegistry is
+    replaced by a new lazy registry seeded with the flows it already holds.
+
+    Returns:
+        The new registry and the flow diff.
+    """
+    compile_fn = compile_fn or _default_compile_fn()
+    diff = diff_flows(old_config, new_config)
+    compiled = _reusable(registry, diff)
+    for name in _to_compile(new_config, registry, diff, compiled):
+        compiled[name] = compile_fn(new_config, name)
+
+    new_registry = _build_registry(new_config, registry, compiled, compile_fn)
+    _log_diff(diff)
+    return new_registry, diff
+
+
+async def arecompile_changed(
+    old_config: SoniConfig,
+    new_config: SoniConfig,
+    registry: Any,
+    compile_fn: CompileFn | None = None,
+) -> tuple[Any, FlowDiff]:
+    """:func:`recompile_changed` that compiles in worker threads.
+
+    The diff and the reads of the old registry happen on the calling (event
+    loop) thread; only the compile calls for changed flows run in threads.
+    """
+    compile_fn = compile_fn or _default_compile_fn()
+    diff = diff_flows(old_config, new_config)
+    compiled = _reusable(registry, diff)
+    for name in _to_compile(new_config, registry, diff, compiled):
+        compiled[name] = await asyncio.to_thread(compile_fn, new_config, name)
+
+    new_registry = _build_registry(new_config, registry, compiled, compile_fn)
+    _log_diff(diff)
+    return new_registry, diff
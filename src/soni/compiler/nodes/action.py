@@ -35,9 +35,9 @@ async def action_node(
     # Get current slots
     slots = fm.get_all_slots(state)
 
-    # Execute action
+    # Execute action (on a copy: slots are shared with the state)
     try:
-        result = await action_registry.execute(config.call, slots)
+        result = await action_registry.execute(config.call, dict(slots))
     except Exception as e:
         logger.error(f"Action execution failed for '{config.call}': {e}", exc_info=True)
         return {
@@ -5,6 +5,7 @@ from typing import Protocol
 from langchain_core.messages import AnyMessage
 
 from soni.config.models import StepConfig
+from soni.core.message_sink import StreamingMessageSink
 from soni.core.types import DialogueState, NodeFunction
 from soni.runtime.context import RuntimeContext
 
@@ -58,6 +59,11 @@ async def rephrase_if_enabled(
     Returns:
         Rephrased message if enabled, original otherwise
 
+    With a StreamingMessageSink the tokens are forwarded to the sink while
+    they are generated; the returned message is still delivered in full
+    through the inform task. Results are served from and stored in the
+    context's RephraseCache when one is configured.
+
     Note:
         DSPy's Module.acall() returns Any even though ResponseRephraser.aforward()
         returns str. We use str() to satisfy mypy and ensure type safety.
@@ -66,10 +72,28 @@ async def rephrase_if_enabled(
     if not rephraser or not rephrase_step:
         return message
 
+    cache = context.rephrase_cache
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.make_key(message, rephraser.tone, state)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
         conversation_context = build_conversation_context(state)
-        # ResponseRephraser.aforward() returns str, but DSPy's acall() is typed as -> Any
-        return await rephraser.acall(template=message, context=conversation_context)  # type: ignore[no-any-return]
+        sink = context.message_sink
+        if isinstance(sink, StreamingMessageSink):
+            rephrased = await rephraser.astream(
+                template=message, context=conversation_context, on_chunk=sink.send_chunk
+            )
+        else:
+            # ResponseRephraser.aforward() returns str, but DSPy's acall() is typed as -> Any
+            rephrased = str(await rephraser.acall(template=message, context=conversation_context))
     except Exception:
-        # On error, fall back to original message
+        # On error, fall back to original message (not cached)
         return message
+
+    if cache is not None and cache_key is not None:
+        cache.set(cache_key, rephrased)
+    return rephrased
@@ -5,7 +5,7 @@ from typing import Any
 from langgraph.runtime import Runtime
 
 from soni.config.models import BranchStepConfig, StepConfig
-from soni.core.expression import evaluate_expression, matches
+from soni.core.expression import compile_expression, compile_pattern
 from soni.core.types import DialogueState, NodeFunction
 from soni.runtime.context import RuntimeContext
 
@@ -36,12 +36,20 @@ class BranchNodeFactory:
             raise ValueError(f"BranchNodeFactory received wrong step type: {type(step).__name__}")
 
         slot_name = step.slot
-        expression = step.evaluate
         cases = step.cases
 
-        if not slot_name and not expression:
+        if not slot_name and not step.evaluate:
             raise ValueError(f"Branch step '{step.step}' must specify 'slot' or 'evaluate'")
 
+        # Compile the expression and case patterns once, at subgraph build time
+        expression = compile_expression(step.evaluate) if step.evaluate else None
+        default_target = cases.get("default")
+        compiled_cases = [
+            (compile_pattern(pattern), target)
+            for pattern, target in cases.items()
+            if pattern != "default"
+        ]
+
         async def branch_node(
             state: DialogueState,
             runtime: Runtime[RuntimeContext],
@@ -53,7 +61,7 @@ class BranchNodeFactory:
             # Determine value to match
             if expression:
                 # Expression mode: evaluate to boolean
-                is_true = evaluate_expression(expression, current_slots)
+                is_true = expression(current_slots)
                 value: Any = is_true
             else:
                 # Slot mode: get slot value (slot_name is guaranteed by validation above)
@@ -61,13 +69,10 @@ class BranchNodeFactory:
                 value = fm.get_slot(state, slot_name)
 
             # Find matching case
-            target = cases.get("default")
-
-            for case_pattern, case_target in cases.items():
-                if case_pattern == "default":
-                    continue
+            target = default_target
 
-                if matches(value, case_pattern):
+            for case_matches, case_target in compiled_cases:
+                if case_matches(value):
                     target = case_target
                     break
 
@@ -5,27 +5,34 @@ from typing import Any
 from langgraph.runtime import Runtime
 
 from soni.config.models import CollectStepConfig, StepConfig
-from soni.core.expression import evaluate_value as interpolate
 from soni.core.pending_task import collect
+from soni.core.template import Template, compile_template
 from soni.core.types import DialogueState, NodeFunction
 from soni.core.validation import validate
 from soni.flow.manager import apply_delta_to_dict
 from soni.runtime.context import RuntimeContext
 
 
+def _error_template(config: CollectStepConfig) -> Template:
+    """Compiled validation error prompt."""
+    return compile_template(config.validation_error_message or f"Invalid value for {config.slot}")
+
+
 async def collect_node(
     state: DialogueState,
     runtime: Runtime[RuntimeContext],
     config: CollectStepConfig,
+    prompt_template: Template | None = None,
+    error_template: Template | None = None,
 ) -> dict[str, Any]:
     """Collect and validate slot value from user.
 
-    Returns PendingTask instead of internal prompt fields.
+    Returns PendingTask instead of internal prompt fields. The factory passes
+    templates compiled at build time; direct callers get them compiled here.
     """
     fm = runtime.context.flow_manager
     slot_name = config.slot
     validator_name = config.validator
-    error_message = config.validation_error_message or f"Invalid value for {slot_name}"
 
     # 1. Already filled? Continue to next step
     existing_value = fm.get_slot(state, slot_name)
@@ -51,12 +58,15 @@ async def collect_node(
 
         # 3. Validate if validator configured
         if validator_name:
-            slots = fm.get_all_slots(state)
+            # Validators are user code: give them a copy of the shared slots
+            slots = dict(fm.get_all_slots(state))
             is_valid = await validate(value, validator_name, slots)
 
             if not is_valid:
                 # Validation failed - re-prompt with error
-                final_error = interpolate(error_message, fm.get_all_slots(state))
+                if error_template is None:
+                    error_template = _error_template(config)
+                final_error = error_template.render(fm.get_all_slots(state))
                 return {
                     "_pending_task": collect(
                         prompt=final_error,
@@ -75,7 +85,9 @@ async def collect_node(
         return updates
 
     # 5. No value provided - need input
-    prompt = interpolate(config.message, fm.get_all_slots(state))
+    if prompt_template is None:
+        prompt_template = compile_template(config.message)
+    prompt = prompt_template.render(fm.get_all_slots(state))
     return {
         "_pending_task": collect(
             prompt=prompt,
@@ -98,8 +110,12 @@ class CollectNodeFactory:
         if not isinstance(step, CollectStepConfig):
             raise ValueError(f"CollectNodeFactory received wrong step type: {type(step).__name__}")
 
+        # Parse prompts once at graph build time
+        prompt_template = compile_template(step.message)
+        error_template = _error_template(step)
+
         async def _node(state: DialogueState, runtime: Runtime[RuntimeContext]) -> dict[str, Any]:
-            return await collect_node(state, runtime, step)
+            return await collect_node(state, runtime, step, prompt_template, error_template)
 
         _node.__name__ = f"collect_{step.step}"
         return _node
@@ -5,24 +5,30 @@ from typing import Any
 from langgraph.runtime import Runtime
 
 from soni.config.models import ConfirmStepConfig, StepConfig
-from soni.core.expression import evaluate_value as interpolate
 from soni.core.pending_task import confirm
+from soni.core.template import Template, compile_template
 from soni.core.types import DialogueState, NodeFunction
 from soni.flow.manager import apply_delta_to_dict
 from soni.runtime.context import RuntimeContext
 
 
+def _prompt_template(config: ConfirmStepConfig) -> Template:
+    """Compiled confirmation prompt."""
+    return compile_template(config.message or f"Please confirm {config.slot}")
+
+
 async def confirm_node(
     state: DialogueState,
     runtime: Runtime[RuntimeContext],
     config: ConfirmStepConfig,
+    prompt_template: Template | None = None,
 ) -> dict[str, Any]:
     """Ask user for confirmation (ADR-002 compliant).
 
-    Returns ConfirmTask instead of internal prompt fields.
+    Returns ConfirmTask instead of internal prompt fields. The factory passes
+    the prompt compiled at build time; direct callers get it compiled here.
     """
     fm = runtime.context.flow_manager
-    slot_name = config.slot
     flow_id = fm.get_active_flow_id(state)
     step_id = config.step
 
@@ -32,6 +38,8 @@ async def confirm_node(
         if step_id in executed:
             return {"_branch_target": None, "_pending_task": None}
 
+    template = prompt_template or _prompt_template(config)
+
     # 1. Check for confirmation response in commands
     commands = state.get("commands") or []
     for cmd in commands:
@@ -65,22 +73,13 @@ async def confirm_node(
             value = cmd["new_value"]
             delta = fm.set_slot(state, slot, value)
 
-            # Build prompt with new value
-            prompt_template = config.message or f"Please confirm {slot_name}"
-            formatted_prompt = prompt_template
-            try:
-                formatted_prompt = prompt_template.format(**{slot_name: value})
-            except KeyError:
-                pass
-
-            # Prepare slots for interpolation with the new value
-            interpolation_slots = fm.get_all_slots(state)
-            interpolation_slots[slot] = value
+            # Build prompt with the new value
+            interpolation_slots = {**fm.get_all_slots(state), slot: value}
 
             result = {
                 "commands": [],
                 "_pending_task": confirm(
-                    prompt=interpolate(formatted_prompt, interpolation_slots),
+                    prompt=template.render(interpolation_slots),
                     options=getattr(config, "options", ["yes", "no"]),
                 ),
             }
@@ -88,18 +87,7 @@ async def confirm_node(
             return result
 
     # 2. Prompt needed - show confirmation message
-    slot_value = fm.get_slot(state, slot_name)
-    prompt_template = config.message or f"Please confirm {slot_name}"
-
-    # Format message with slot value
-    formatted_prompt = prompt_template
-    if slot_value is not None:
-        try:
-            formatted_prompt = prompt_template.format(**{slot_name: slot_value})
-        except KeyError:
-            pass
-
-    prompt = interpolate(formatted_prompt, fm.get_all_slots(state))
+    prompt = template.render(fm.get_all_slots(state))
     return {
         "_pending_task": confirm(
             prompt=prompt,
@@ -121,8 +109,11 @@ class ConfirmNodeFactory:
         if not isinstance(step, ConfirmStepConfig):
             raise ValueError(f"ConfirmNodeFactory received wrong step type: {type(step).__name__}")
 
+        # Parse the prompt once at graph build time
+        prompt_template = _prompt_template(step)
+
         async def _node(state: DialogueState, runtime: Runtime[RuntimeContext]) -> dict[str, Any]:
-            return await confirm_node(state, runtime, step)
+            return await confirm_node(state, runtime, step, prompt_template)
 
         _node.__name__ = f"confirm_{step.step}"
         return _node
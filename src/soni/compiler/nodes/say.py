@@ -5,6 +5,7 @@ from langgraph.runtime import Runtime
 from soni.compiler.nodes.base import rephrase_if_enabled
 from soni.config.models import SayStepConfig, StepConfig
 from soni.core.pending_task import inform
+from soni.core.template import compile_template
 from soni.core.types import DialogueState, NodeFunction
 from soni.runtime.context import RuntimeContext
 
@@ -22,7 +23,7 @@ class SayNodeFactory:
         if not isinstance(step, SayStepConfig):
             raise ValueError(f"SayNodeFactory received wrong step type: {type(step).__name__}")
 
-        message = step.message
+        template = compile_template(step.message)
         step_id = step.step
         rephrase_step = step.rephrase  # M8: Step-level rephrasing flag
 
@@ -42,9 +43,7 @@ class SayNodeFactory:
                     return {"_branch_target": None, "_pending_task": None}
 
             # Interpolate slots
-            from soni.core.expression import evaluate_value as interpolate
-
-            interpolated_message = interpolate(message, fm.get_all_slots(state))
+            interpolated_message = template.render(fm.get_all_slots(state))
 
             # M8: Rephrase if enabled
             try:
@@ -5,7 +5,7 @@ from typing import Any
 from langgraph.runtime import Runtime
 
 from soni.config.models import SetStepConfig, StepConfig
-from soni.core.expression import evaluate_expression, evaluate_value
+from soni.core.expression import compile_expression, evaluate_value
 from soni.core.types import DialogueState, NodeFunction
 from soni.flow.manager import apply_delta_to_dict
 from soni.runtime.context import RuntimeContext
@@ -34,7 +34,7 @@ class SetNodeFactory:
             raise ValueError(f"SetNodeFactory received wrong step type: {type(step).__name__}")
 
         slots_config = step.slots
-        condition = step.condition
+        condition = compile_expression(step.condition) if step.condition else None
         step_id = step.step
 
         async def set_node(
@@ -54,7 +54,7 @@ class SetNodeFactory:
             # Conditional execution
             if condition:
                 current_slots = fm.get_all_slots(state)
-                if not evaluate_expression(condition, current_slots):
+                if not condition(current_slots):
                     # Mark as executed even if condition is false, clear branch target
                     result: dict[str, Any] = {"_branch_target": None, "_pending_task": None}
                     if flow_id:
@@ -63,7 +63,8 @@ class SetNodeFactory:
 
             # Set each slot
             updates: dict[str, Any] = {}
-            current_slots = fm.get_all_slots(state)
+            # Local copy: slot dicts in state are shared (copy-on-write)
+            current_slots = dict(fm.get_all_slots(state))
 
             for slot_name, value_expr in slots_config.items():
                 value = evaluate_value(value_expr, current_slots)
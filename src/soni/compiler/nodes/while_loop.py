@@ -13,7 +13,7 @@ from typing import Any
 from langgraph.runtime import Runtime
 
 from soni.config.models import StepConfig, WhileStepConfig
-from soni.core.expression import evaluate_expression
+from soni.core.expression import compile_expression
 from soni.core.types import DialogueState, NodeFunction
 from soni.runtime.context import RuntimeContext
 
@@ -40,7 +40,7 @@ class WhileNodeFactory:
         if not isinstance(step, WhileStepConfig):
             raise ValueError(f"WhileNodeFactory received wrong step type: {type(step).__name__}")
 
-        condition = step.condition
+        condition = compile_expression(step.condition)
         do_step_names = step.get_do_step_names()
         loop_body_start = do_step_names[0]  # First step in do block
 
@@ -64,7 +64,7 @@ class WhileNodeFactory:
             slots = fm.get_all_slots(state)
 
             # Evaluate loop condition
-            is_true = evaluate_expression(condition, slots)
+            is_true = condition(slots)
 
             if is_true:
                 # Continue looping - route to first step in do block
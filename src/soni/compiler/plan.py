@@ -0,0 +1,236 @@
+"""Flow step plans: the routing table shared by both execution engines.
+
+A FlowPlan is built from the same node functions and routing rules as the
+LangGraph subgraph (see soni.compiler.subgraph), but can also be run directly:
+FlowPlan.astream interprets the plan step by step, yielding the same
+``{node_name: updates}`` events as ``subgraph.astream(stream_mode="updates")``
+without LangGraph channel setup or per-step checkpoint bookkeeping.
+
+Selected with ``settings.execution_engine = "direct"``.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Annotated, Any, get_args, get_origin, get_type_hints
+
+from langgraph.errors import GraphRecursionError
+from langgraph.graph import END
+from langgraph.runtime import Runtime
+
+from soni.compiler.factory import get_factory_for_step
+from soni.config.models import FlowConfig, StepConfig, WhileStepConfig
+from soni.core.errors import GraphBuildError
+from soni.core.types import DialogueState, NodeFunction
+from soni.runtime.context import RuntimeContext
+
+# Same default as LangGraph's recursion_limit for subgraph runs
+DEFAULT_STEP_LIMIT = 25
+
+
+def _flatten_inline_steps(steps: list[StepConfig]) -> list[StepConfig]:
+    """Extract inline step definitions from while loops and flatten into step list.
+
+    This allows while loops to define steps inline:
+
+        - while:
+            step: loop
+            condition: "counter < 3"
+            do:
+              - set:
+                  step: increment
+                  slots: {counter: ...}
+
+    The inline steps are extracted and added to the main step list.
+    """
+    result: list[StepConfig] = []
+
+    for step in steps:
+        result.append(step)
+
+        # Extract inline steps from while loops
+        if isinstance(step, WhileStepConfig):
+            for inline_step in step.get_inline_steps():
+                result.append(inline_step)
+
+    return result
+
+
+def route_next(
+    state: DialogueState | dict[str, Any],
+    default_target: str,
+    step_mapping: dict[str, str],
+    valid_targets: set[str],
+) -> str:
+    """Pick the node to run after a step (or END).
+
+    Blocking pending tasks end the run; otherwise ``_branch_target`` (a step
+    name, or "__end__" for link/call) wins over the default next step.
+    """
+    pending_task = state.get("_pending_task")
+
+    if pending_task:
+        # ADR-002: Only exit if task requires interruption (blocking)
+        # Inform tasks with wait_for_ack=False are non-blocking
+        is_blocking = True
+        if pending_task.get("type") == "inform" and not pending_task.get("wait_for_ack"):
+            is_blocking = False
+
+        if is_blocking:
+            return str(END)
+
+    target = state.get("_branch_target")
+    if target:
+        # Special: __end__ for link/call to exit subgraph early
+        if target == "__end__":
+            return str(END)
+        node_name = step_mapping.get(target, target)
+        if node_name in valid_targets:
+            return node_name
+
+    return default_target
+
+
+def _state_reducers() -> dict[str, Callable[[Any, Any], Any]]:
+    """Reducers declared on DialogueState (keys without one keep the last value)."""
+    reducers: dict[str, Callable[[Any, Any], Any]] = {}
+    for key, hint in get_type_hints(DialogueState, include_extras=True).items():
+        if get_origin(hint) is Annotated:
+            reducer = get_args(hint)[1]
+            if callable(reducer):
+                reducers[key] = reducer
+    return reducers
+
+
+_REDUCERS: dict[str, Callable[[Any, Any], Any]] | None = None
+
+
+def apply_update(state: dict[str, Any], update: dict[str, Any]) -> None:
+    """Apply a node's updates to state in place using DialogueState reducers."""
+    global _REDUCERS
+    if _REDUCERS is None:
+        _REDUCERS = _state_reducers()
+
+    for key, value in update.items():
+        reducer = _REDUCERS.get(key)
+        if reducer is None or key not in state:
+            state[key] = value
+        else:
+            state[key] = reducer(state[key], value)
+
+
+@dataclass(frozen=True)
+class PlanNode:
+    """A compiled step: node function plus its default successor."""
+
+    name: str
+    func: NodeFunction
+    default_next: str
+
+
+class FlowPlan:
+    """Compiled execution plan for one flow."""
+
+    def __init__(self, flow_name: str, nodes: list[PlanNode], step_to_node: dict[str, str]):
+        self.flow_name = flow_name
+        self.nodes = {node.name: node for node in nodes}
+        self.entry: str | None = nodes[0].name if nodes else None
+        self.step_to_node = step_to_node
+        self.valid_targets = {*self.nodes, str(END)}
+
+    def next_node(self, node_name: str, state: DialogueState | dict[str, Any]) -> str:
+        """Node to run after ``node_name`` given the updated state."""
+        default_next = self.nodes[node_name].default_next
+        return route_next(state, default_next, self.step_to_node, self.valid_targets)
+
+    async def astream(
+        self,
+        state: dict[str, Any],
+        runtime: Runtime[RuntimeContext],
+        step_limit: int = DEFAULT_STEP_LIMIT,
+    ) -> AsyncIterator[dict[str, dict[str, Any]]]:
+        """Run the plan, yielding ``{node_name: updates}`` after each step.
+
+        Mirrors ``subgraph.astream(state, stream_mode="updates")``: each node
+        sees the state with all previous updates applied via the DialogueState
+        reducers, and routing uses the same rules as the subgraph edges.
+
+        Raises:
+            GraphRecursionError: If more than ``step_limit`` steps run.
+        """
+        current = dict(state)
+        node_name = self.entry
+        steps = 0
+
+        while node_name is not None and node_name != END:
+            steps += 1
+            if steps > step_limit:
+                raise GraphRecursionError(
+                    f"Flow '{self.flow_name}' exceeded {step_limit} steps without stopping"
+                )
+
+            output = await self.nodes[node_name].func(dict(current), runtime)
+            if not isinstance(output, dict):
+                raise TypeError(
+                    f"Node '{node_name}' returned {type(output).__name__}; "
+                    "the direct engine only supports dict updates"
+                )
+            apply_update(current, output)
+            yield {node_name: output}
+
+            node_name = self.next_node(node_name, current)
+
+
+def build_flow_plan(flow: FlowConfig, flow_name: str = "") -> FlowPlan:
+    """Create node functions for a flow and resolve each node's default successor.
+
+    - Linear flows continue to the next step
+    - The last step in a while ``do`` block loops back to its guard
+    - Branch targets reference step names, translated to node names at runtime
+    """
+    # Flatten inline steps from while loops
+    all_steps = _flatten_inline_steps(list(flow.steps))
+
+    # First pass: create node functions and build step-to-node mapping
+    funcs: list[NodeFunction] = []
+    step_to_node: dict[str, str] = {}  # step name -> node name
+
+    for i, step in enumerate(all_steps):
+        factory = get_factory_for_step(step.type)
+        node_func = factory.create(step, flow.steps, i)
+        if node_func.__name__ in step_to_node.values():
+            raise GraphBuildError(
+                f"Duplicate step '{step.step}' in flow '{flow_name or '<unnamed>'}'"
+            )
+        funcs.append(node_func)
+        step_to_node[step.step] = node_func.__name__
+
+    node_names = [func.__name__ for func in funcs]
+
+    # Collect while loop metadata: last step in do block -> loop back to guard
+    # NOTE: branch targets (case targets) continue sequentially to their natural
+    # next step in the flow, rather than routing to END. Only while loop steps
+    # need special handling for loop-back behavior.
+    loop_back_targets: dict[str, str] = {}  # last do step -> while guard
+    for step in all_steps:
+        if isinstance(step, WhileStepConfig):
+            guard_name = step_to_node[step.step]
+            # Get step names (handles both string refs and inline definitions)
+            do_step_names = step.get_do_step_names()
+            # Last step in do block should loop back to guard
+            last_do_step = do_step_names[-1]
+            if last_do_step in step_to_node:
+                loop_back_targets[step_to_node[last_do_step]] = guard_name
+
+    # Second pass: determine default next step
+    nodes: list[PlanNode] = []
+    for i, (node_name, func) in enumerate(zip(node_names, funcs, strict=True)):
+        if node_name in loop_back_targets:
+            # Last step in while loop - loops back to guard
+            default_next = loop_back_targets[node_name]
+        elif i < len(node_names) - 1:
+            default_next = node_names[i + 1]
+        else:
+            default_next = str(END)
+        nodes.append(PlanNode(name=node_name, func=func, default_next=default_next))
+
+    return FlowPlan(flow_name, nodes, step_to_node)
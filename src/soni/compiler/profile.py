@@ -0,0 +1,115 @@
+"""Compile-time profiling of flow subgraphs.
+
+Used by ``soni compile-profile`` to find the flows that make cold start slow.
+
+:func:`profile_process_pool` measures building flows in a process pool.
+Compiled subgraphs hold node closures and can't be pickled, so workers can
+only resolve each flow's routing table; node functions and the LangGraph
+compile (most of the cost) still run in the calling process. That is why
+startup compiles flows sequentially.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from soni.compiler.factory import get_factory_for_step
+from soni.compiler.plan import FlowPlan, PlanNode, _flatten_inline_steps, build_flow_plan
+from soni.compiler.subgraph import build_flow_subgraph, build_subgraph_from_plan
+from soni.config.models import FlowConfig, SoniConfig
+
+
+@dataclass(frozen=True)
+class FlowCompileProfile:
+    """Compile statistics for one flow."""
+
+    flow_name: str
+    seconds: float
+    nodes: int
+    edges: int
+
+
+def profile_flow_compilation(config: SoniConfig) -> list[FlowCompileProfile]:
+    """Compile each flow sequentially and measure it.
+
+    ``nodes`` counts step nodes; ``edges`` counts the entry edge plus each
+    node's default transition (branch targets are resolved at runtime).
+
+    Returns:
+        Profiles sorted by compile time, slowest first.
+    """
+    profiles = []
+    for flow_name, flow_config in config.flows.items():
+        start = time.perf_counter()
+        plan = build_flow_plan(flow_config, flow_name)
+        build_subgraph_from_plan(plan)
+        seconds = time.perf_counter() - start
+
+        nodes = len(plan.nodes)
+        edges = nodes + (1 if plan.entry is not None else 0)
+        profiles.append(
+            FlowCompileProfile(flow_name=flow_name, seconds=seconds, nodes=nodes, edges=edges)
+        )
+
+    return sorted(profiles, key=lambda p: p.seconds, reverse=True)
+
+
+@dataclass(frozen=True)
+class ParallelCompileProfile:
+    """Wall time of compiling every flow sequentially vs with a process pool."""
+
+    workers: int
+    sequential_seconds: float
+    parallel_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        return self.sequential_seconds / self.parallel_seconds
+
+
+@dataclass(frozen=True)
+class _FlowRoutes:
+    """Routing table of a FlowPlan without node functions (picklable)."""
+
+    flow_name: str
+    default_next: dict[str, str]
+    step_to_node: dict[str, str]
+
+
+def _flow_routes(flow: FlowConfig, flow_name: str) -> _FlowRoutes:
+    plan = build_flow_plan(flow, flow_name)
+    default_next = {node.name: node.default_next for node in plan.nodes.values()}
+    return _FlowRoutes(flow_name, default_next, plan.step_to_node)
+
+
+def _plan_from_routes(flow: FlowConfig, routes: _FlowRoutes) -> FlowPlan:
+    nodes = []
+    for i, step in enumerate(_flatten_inline_steps(list(flow.steps))):
+        func = get_factory_for_step(step.type).create(step, flow.steps, i)
+        nodes.append(PlanNode(func.__name__, func, routes.default_next[func.__name__]))
+    return FlowPlan(routes.flow_name, nodes, routes.step_to_node)
+
+
+def profile_process_pool(config: SoniConfig, workers: int) -> ParallelCompileProfile:
+    """Compile all flows sequentially, then with ``workers`` processes, and time both.
+
+    The parallel time includes starting the pool: workers resolve routing
+    tables, the calling process builds node functions and compiles subgraphs.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    flows = list(config.flows.items())
+
+    start = time.perf_counter()
+    for flow_name, flow in flows:
+        build_flow_subgraph(flow, flow_name)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        routes = pool.map(_flow_routes, [f for _, f in flows], [n for n, _ in flows])
+        for (_, flow), flow_routes in zip(flows, routes, strict=True):
+            build_subgraph_from_plan(_plan_from_routes(flow, flow_routes))
+    parallel = time.perf_counter() - start
+
+    return ParallelCompileProfile(workers, sequential, parallel)
@@ -0,0 +1,114 @@
+"""Lazy SubgraphRegistry that compiles flows on first use.
+
+Eager compilation (compile_flows) makes startup scale with the number of
+flows and keeps every compiled graph alive. LazySubgraphRegistry instead
+compiles a flow the first time the orchestrator asks for it:
+
+- prewarmed ("hot") flows are compiled up front and never evicted
+- other flows live in an LRU cache bounded by ``max_compiled`` (0 = no limit)
+
+The bound is a flow count, not a memory size: compiled graphs differ in
+size with their step count, so memory held by the cache is roughly
+``max_compiled`` times the size of a typical flow's graph. ``soni
+compile-profile`` reports per-flow node counts to help pick the limit.
+"""
+
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from cachetools import LRUCache
+
+from soni.config.models import SoniConfig
+from soni.core.errors import ConfigError
+
+logger = logging.getLogger(__name__)
+
+CompileFn = Callable[[SoniConfig, str], Any]
+
+
+class LazySubgraphRegistry:
+    """SubgraphRegistry compiling flows on demand with a cache of at most ``max_compiled`` flows.
+
+    ``preloaded`` seeds the registry with already compiled flows (e.g. the
+    unchanged flows of a hot-reloaded config) so they aren't compiled again.
+    """
+
+    def __init__(
+        self,
+        config: SoniConfig,
+        compile_fn: CompileFn | None = None,
+        prewarm: Iterable[str] = (),
+        max_compiled: int = 0,
+        preloaded: Mapping[str, Any] | None = None,
+    ) -> None:
+        if compile_fn is None:
+            from soni.dm.builder import compile_flow
+
+            compile_fn = compile_flow
+
+        self._config = config
+        self._compile = compile_fn
+        self._pinned: dict[str, Any] = {}
+        self._cache: LRUCache[str, Any] | dict[str, Any] = (
+            LRUCache(maxsize=max_compiled) if max_compiled > 0 else {}
+        )
+        self.compilations = 0
+        self.hits = 0
+
+        unknown = [name for name in prewarm if name not in config.flows]
+        if unknown:
+            raise ConfigError(f"Cannot prewarm unknown flows: {unknown}")
+        preloaded = preloaded or {}
+        for flow_name in prewarm:
+            compiled = preloaded.get(flow_name)
+            self._pinned[flow_name] = (
+                compiled if compiled is not None else self._compile_flow(flow_name)
+            )
+        for flow_name, compiled in preloaded.items():
+            if flow_name in config.flows and flow_name not in self._pinned:
+                self._cache[flow_name] = compiled
+
+    def _compile_flow(self, flow_name: str) -> Any:
+        logger.debug(f"Compiling flow '{flow_name}'")
+        self.compilations += 1
+        return self._compile(self._config, flow_name)
+
+    def get(self, flow_name: str) -> Any:
+        """Return the compiled flow, compiling it on first use (None if unknown)."""
+        compiled = self._pinned.get(flow_name)
+        if compiled is None:
+            compiled = self._cache.get(flow_name)
+        if compiled is not None:
+            self.hits += 1
+            return compiled
+
+        if flow_name not in self._config.flows:
+            return None
+
+        compiled = self._compile_flow(flow_name)
+        self._cache[flow_name] = compiled
+        return compiled
+
+    def peek(self, flow_name: str) -> Any:
+        """Return the compiled flow if held in memory, without compiling it."""
+        compiled = self._pinned.get(flow_name)
+        if compiled is None:
+            compiled = self._cache.get(flow_name)
+        return compiled
+
+    def __contains__(self, flow_name: object) -> bool:
+        return flow_name in self._config.flows
+
+    @property
+    def compiled(self) -> list[str]:
+        """Names of flows currently held compiled in memory."""
+        return [*self._pinned, *self._cache]
+
+    def stats(self) -> dict[str, int]:
+        """Return compilation/hit counters and current size."""
+        return {
+            "compilations": self.compilations,
+            "hits": self.hits,
+            "size": len(self._pinned) + len(self._cache),
+        }
@@ -1,71 +1,178 @@
 """Config loader for YAML configuration files."""
 
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from soni.__version__ import __version__
+from soni.config import models
 from soni.config.models import SoniConfig
 
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader is several times faster; fall back to the pure Python one
+_YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Directory for the compiled-config cache (unset = no caching)
+CACHE_DIR_ENV = "SONI_CONFIG_CACHE_DIR"
+
+
+def _load_yaml(path: Path) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)  # noqa: S506 - safe loader
+
 
 class ConfigLoader:
     """Load SoniConfig from YAML files."""
 
     @staticmethod
-    def load(path: Path | str) -> SoniConfig:
+    def load(path: Path | str, cache_dir: Path | str | None = None) -> SoniConfig:
         """Load configuration from YAML file.
 
+        When a cache directory is given (or SONI_CONFIG_CACHE_DIR is set), the
+        validated config is pickled there keyed by the content of every YAML
+        file read, so later processes skip YAML parsing and validation.
+
         Args:
             path: Path to config directory or soni.yaml file
+            cache_dir: Directory for the compiled-config cache
 
         Returns:
             Parsed SoniConfig instance
         """
-        config_path = Path(path)
+        files = ConfigLoader.config_files(path)
 
-        data: dict[str, Any] = {"flows": {}, "settings": {}}
+        cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+        cache_file = Path(cache_dir) / f"{_cache_key(files)}.pickle" if cache_dir else None
+        if cache_file is not None:
+            cached = _read_cache(cache_file)
+            if cached is not None:
+                return cached
+
+        config: SoniConfig = SoniConfig.model_validate(_read_data(Path(path), files))
+
+        if cache_file is not None:
+            _write_cache(cache_file, config)
+        return config
+
+    @staticmethod
+    def config_files(path: Path | str) -> list[Path]:
+        """YAML files that make up the config at ``path``.
+
+        A directory resolves to its soni.yaml (or config.yaml) master file if
+        present, otherwise to all of its ``*.yaml`` files in sorted order.
+
+        Raises:
+            FileNotFoundError: If no config file exists.
+        """
+        config_path = Path(path)
 
         # Handle directory
         if config_path.is_dir():
-            yaml_file = config_path / "soni.yaml"
-            if not yaml_file.exists():
-                yaml_file = config_path / "config.yaml"
-
-            # If explicit master file exists, use it
-            if yaml_file.exists():
-                with open(yaml_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
-            else:
-                # Merge all .yaml files in directory
-                files = sorted(config_path.glob("*.yaml"))
-                if not files:
-                    raise FileNotFoundError(f"No config files found in {config_path}")
-
-                for fpath in files:
-                    with open(fpath, encoding="utf-8") as f:
-                        chunk = yaml.safe_load(f) or {}
-
-                        # Merge flows
-                        if "flows" in chunk and isinstance(chunk["flows"], dict):
-                            data["flows"].update(chunk["flows"])
-
-                        # Merge settings
-                        if "settings" in chunk and isinstance(chunk["settings"], dict):
-                            data["settings"].update(chunk["settings"])
-
-                        # Overwrite other top-level keys (e.g. version)
-                        for k, v in chunk.items():
-                            if k not in ("flows", "settings"):
-                                data[k] = v
-
-        else:
-            # Handle single file
-            yaml_file = config_path
-            if not yaml_file.exists():
-                raise FileNotFoundError(f"Config file not found: {yaml_file}")
-
-            with open(yaml_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-
-        config: SoniConfig = SoniConfig.model_validate(data)
-        return config
+            for name in ("soni.yaml", "config.yaml"):
+                # If explicit master file exists, use it
+                if (config_path / name).exists():
+                    return [config_path / name]
+
+            files = sorted(config_path.glob("*.yaml"))
+            if not files:
+                raise FileNotFoundError(f"No config files found in {config_path}")
+            return files
+
+        # Handle single file
+        if not config_path.exists():
+            raise FileNotFoundError(f"Config file not found: {config_path}")
+        return [config_path]
+
+
+def _read_data(config_path: Path, files: list[Path]) -> dict[str, Any]:
+    """Parse and merge the YAML files into raw config data."""
+    if not config_path.is_dir() or files[0].name in ("soni.yaml", "config.yaml"):
+        data: dict[str, Any] = _load_yaml(files[0]) or {}
+        return data
+
+    # Merge all .yaml files in directory
+    data = {"flows": {}, "settings": {}}
+    for fpath in files:
+        chunk = _load_yaml(fpath) or {}
+
+        # Merge flows
+        if "flows" in chunk and isinstance(chunk["flows"], dict):
+            data["flows"].update(chunk["flows"])
+
+        # Merge settings
+        if "settings" in chunk and isinstance(chunk["settings"], dict):
+            data["settings"].update(chunk["settings"])
+
+        # Overwrite other top-level keys (e.g. version)
+        for k, v in chunk.items():
+            if k not in ("flows", "settings"):
+                data[k] = v
+
+    return data
+
+
+@lru_cache(maxsize=1)
+def _models_digest() -> bytes:
+    """Hash of the config models' source, so editing a model invalidates the cache."""
+    try:
+        source = Path(models.__file__).read_bytes()
+    except OSError:
+        # No source on disk (e.g. zipped install): the version still keys the cache
+        source = b""
+    return hashlib.sha256(source).digest()
+
+
+def _cache_key(files: list[Path]) -> str:
+    """Hash of the soni version, the config models and the path and content of every file."""
+    digest = hashlib.sha256(__version__.encode())
+    digest.update(_models_digest())
+    for fpath in files:
+        digest.update(b"\x00")
+        digest.update(str(fpath.resolve()).encode())
+        digest.update(b"\x00")
+        digest.update(fpath.read_bytes())
+    return digest.hexdigest()[:32]
+
+
+def _read_cache(cache_file: Path) -> SoniConfig | None:
+    """Load a cached config; unreadable or stale entries count as misses."""
+    try:
+        with open(cache_file, "rb") as f:
+            config = pickle.load(f)  # noqa: S301 - written by this process owner
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable config cache {cache_file}: {e}")
+        return None
+
+    if not isinstance(config, SoniConfig):
+        return None
+    logger.debug(f"Loaded config from cache {cache_file}")
+    return config
+
+
+def _write_cache(cache_file: Path, config: SoniConfig) -> None:
+    """Write the cache atomically so concurrent workers never read partial files."""
+    tmp_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except Exception as e:
+        # Caching is an optimization: never fail loading because of it
+        # (OSError, or a pickling error for unpicklable config values)
+        logger.warning(f"Could not write config cache {cache_file}: {e}")
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
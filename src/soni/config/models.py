@@ -173,6 +173,53 @@ class LLMConfig(BaseModel):
     )
     model: str = Field(default="gpt-4o-mini", description="Model identifier")
     api_key: str | None = Field(default=None, description="API key (optional)")
+    max_concurrent_requests: int = Field(
+        default=0, ge=0, description="Max LM requests in flight (0 = unlimited)"
+    )
+    requests_per_minute: float = Field(
+        default=0, ge=0, description="Token-bucket request rate limit (0 = unlimited)"
+    )
+    rate_limit_burst: int | None = Field(
+        default=None,
+        ge=1,
+        description="Requests allowed in a burst (default: max_concurrent_requests or 1)",
+    )
+    max_retries: int = Field(
+        default=3, ge=0, description="Retries on rate limit, timeout and connection errors"
+    )
+    retry_base_delay: float = Field(
+        default=0.5, gt=0, description="Initial backoff in seconds (doubles per retry, jittered)"
+    )
+    retry_max_delay: float = Field(default=20.0, gt=0, description="Maximum backoff in seconds")
+    timeout_seconds: float | None = Field(
+        default=None, gt=0, description="Per-request timeout (None = provider default)"
+    )
+    max_connections: int | None = Field(
+        default=None, ge=1, description="HTTP connection pool size (None = client default)"
+    )
+    max_keepalive_connections: int | None = Field(
+        default=None, ge=0, description="Idle connections kept open for reuse"
+    )
+
+
+# NLU modules that can run on their own LM
+NLUModuleName = Literal["command_generator", "slot_extractor", "rephraser"]
+
+
+class ModuleLLMConfig(BaseModel):
+    """Per-module LLM overrides.
+
+    Fields set here override ``settings.llm`` for that module only (e.g. just
+    ``model``); modules left unset use the global LM.
+    """
+
+    command_generator: LLMConfig | None = Field(
+        default=None, description="LLM for Pass 1 command generation"
+    )
+    slot_extractor: LLMConfig | None = Field(
+        default=None, description="LLM for Pass 2 slot extraction"
+    )
+    rephraser: LLMConfig | None = Field(default=None, description="LLM for response rephrasing")
 
 
 class PersistenceConfig(BaseModel):
@@ -181,8 +228,135 @@ class PersistenceConfig(BaseModel):
     backend: Literal["memory", "sqlite", "postgres"] = Field(
         default="memory", description="Persistence backend type"
     )
-    path: str = Field(default=":memory:", description="File path or connection string")
-    cleanup_interval: int = Field(default=3600, description="Cleanup interval in seconds")
+    path: str = Field(
+        default=":memory:",
+        description="SQLite file path, or Postgres connection string for the postgres backend",
+    )
+    cleanup_interval: int = Field(
+        default=3600, description="Seconds between idle-thread cleanup runs"
+    )
+    thread_ttl: float = Field(
+        default=0,
+        ge=0,
+        description="Seconds a thread may stay idle before its checkpoints are deleted (0 = never)",
+    )
+    cleanup_batch_size: int = Field(
+        default=100, ge=1, description="Threads checked and deleted per cleanup batch"
+    )
+    cleanup_batch_pause: float = Field(
+        default=0.1, ge=0, description="Seconds to pause between cleanup batches"
+    )
+    compact_checkpoints: bool = Field(
+        default=False,
+        description="Drop transient fields and store executed steps as bitsets in checkpoints",
+    )
+    pool_min_size: int = Field(
+        default=1, ge=0, description="Postgres: connections kept open in the pool"
+    )
+    pool_max_size: int = Field(default=10, ge=1, description="Postgres: maximum pool connections")
+    pool_timeout: float = Field(
+        default=30.0, gt=0, description="Postgres: seconds to wait for a pooled connection"
+    )
+    prepare_threshold: int | None = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Postgres: executions before a statement is server-side prepared "
+            "(0 = immediately, None = never, e.g. behind PgBouncer)"
+        ),
+    )
+    setup: bool = Field(
+        default=True, description="Postgres: create or migrate checkpoint tables on startup"
+    )
+    interrupt_index_size: int = Field(
+        default=10_000,
+        ge=0,
+        description=(
+            "Threads whose interrupt status is cached in memory (0 disables); "
+            "always disabled for the shared postgres backend"
+        ),
+    )
+
+
+class NLUCacheConfig(BaseModel):
+    """Configuration for the CommandGenerator result cache."""
+
+    enabled: bool = Field(default=False, description="Cache NLU results for repeated messages")
+    max_size: int = Field(default=1024, ge=1, description="Maximum cached entries (LRU)")
+    ttl_seconds: float = Field(default=3600, gt=0, description="Entry time-to-live in seconds")
+
+
+class RephraseCacheConfig(BaseModel):
+    """Configuration for the ResponseRephraser result cache."""
+
+    enabled: bool = Field(default=False, description="Cache rephrased responses")
+    max_size: int = Field(default=1024, ge=1, description="Maximum cached entries (LRU)")
+    ttl_seconds: float = Field(default=3600, gt=0, description="Entry time-to-live in seconds")
+    context_aware: bool = Field(
+        default=False,
+        description="Key entries by a coarse conversation bucket (opening vs ongoing)",
+    )
+    precomputed_path: str | None = Field(
+        default=None,
+        description="JSON file from 'soni rephrase-precompute' served without calling the LM",
+    )
+
+
+class HistoryConfig(BaseModel):
+    """Retention policy for the conversation history kept in dialogue state."""
+
+    max_messages: int = Field(
+        default=0,
+        ge=0,
+        description="Messages kept in state; older ones are dropped on write (0 = keep all)",
+    )
+    nlu_window: int = Field(default=10, ge=1, description="Most recent messages sent to the NLU")
+    summarize: bool = Field(
+        default=False,
+        description="Fold dropped messages into a rolling summary shown to the NLU",
+    )
+    summary_max_chars: int = Field(
+        default=1000, ge=1, description="Maximum length of the rolling summary"
+    )
+
+
+# Type alias for what to do when a thread's turn queue is full
+QueueOverflowPolicy = Literal["reject", "coalesce"]
+
+# Type alias for how flows are executed by the orchestrator
+ExecutionEngine = Literal["subgraph", "direct"]
+
+
+class CompilationConfig(BaseModel):
+    """Configuration for flow compilation."""
+
+    lazy: bool = Field(
+        default=False, description="Compile flows on first use instead of at startup"
+    )
+    prewarm_flows: list[str] = Field(
+        default_factory=list,
+        description="Flows compiled at startup and never evicted when lazy compilation is on",
+    )
+    max_compiled_flows: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Max number of lazily compiled flows kept in memory, LRU evicted (0 = no limit). "
+            "A flow count, not a memory budget"
+        ),
+    )
+
+
+class ConcurrencyConfig(BaseModel):
+    """Configuration for per-thread turn serialization."""
+
+    max_queued_turns: int = Field(
+        default=8, ge=0, description="Max turns waiting behind the running turn per thread"
+    )
+    overflow_policy: QueueOverflowPolicy = Field(
+        default="reject",
+        description="On a full queue: reject the message or coalesce it into the last waiting turn",
+    )
 
 
 class Settings(BaseModel):
@@ -194,10 +368,54 @@ class Settings(BaseModel):
     rephrase_tone: RephraseTone = Field(
         default="friendly", description="Tone for rephrased responses"
     )
+    nlu_fast_path: bool = Field(
+        default=False,
+        description="Resolve unambiguous replies (yes/no, options, typed values) without the LLM",
+    )
+    speculative_slot_extraction: bool = Field(
+        default=False,
+        description="Run Pass 2 for likely flows in parallel with Pass 1 when no flow is active",
+    )
+    speculative_max_flows: int = Field(
+        default=1, ge=1, description="Candidate flows to extract slots for speculatively"
+    )
+    flow_shortlist_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Pass only the top-K flows ranked against the message (plus the active flow) "
+            "to the NLU; 0 passes every flow"
+        ),
+    )
+    execution_engine: ExecutionEngine = Field(
+        default="subgraph",
+        description=(
+            "How flows run: 'subgraph' streams a compiled LangGraph subgraph, "
+            "'direct' interprets the compiled step plan without nested graph runs"
+        ),
+    )
+    compilation: CompilationConfig = Field(
+        default_factory=CompilationConfig, description="Flow compilation settings"
+    )
+    nlu_cache: NLUCacheConfig = Field(
+        default_factory=NLUCacheConfig, description="NLU result cache settings"
+    )
+    rephrase_cache: RephraseCacheConfig = Field(
+        default_factory=RephraseCacheConfig, description="Rephrase result cache settings"
+    )
+    history: HistoryConfig = Field(
+        default_factory=HistoryConfig, description="Conversation history retention settings"
+    )
     llm: LLMConfig = Field(default_factory=LLMConfig, description="LLM settings")
+    module_llms: ModuleLLMConfig = Field(
+        default_factory=ModuleLLMConfig, description="Per-NLU-module LLM overrides"
+    )
     persistence: PersistenceConfig = Field(
         default_factory=PersistenceConfig, description="Persistence settings"
     )
+    concurrency: ConcurrencyConfig = Field(
+        default_factory=ConcurrencyConfig, description="Per-thread turn queueing settings"
+    )
 
 
 class SlotDefinition(BaseModel):
@@ -1,6 +1,12 @@
 """Core domain types and infrastructure."""
 
-from soni.core.message_sink import BufferedMessageSink, MessageSink, WebSocketMessageSink
+from soni.core.message_sink import (
+    BufferedMessageSink,
+    MessageSink,
+    QueueMessageSink,
+    StreamingMessageSink,
+    WebSocketMessageSink,
+)
 from soni.core.pending_task import (
     CollectTask,
     ConfirmTask,
@@ -31,5 +37,7 @@ __all__ = [
     "requires_input",
     "MessageSink",
     "BufferedMessageSink",
+    "QueueMessageSink",
+    "StreamingMessageSink",
     "WebSocketMessageSink",
 ]
@@ -3,9 +3,13 @@
 Handles bootstrapping DSPy with the correct language model settings from SoniConfig.
 """
 
+from typing import Any
+
 import dspy
 
 from soni.config import SoniConfig
+from soni.config.models import LLMConfig, NLUModuleName
+from soni.core.llm_client import LMThrottle, ResilientLM, RetryPolicy
 
 
 class DSPyBootstrapper:
@@ -13,6 +17,7 @@ class DSPyBootstrapper:
 
     def __init__(self, config: SoniConfig):
         self.config = config
+        self._module_lms: dict[str, dspy.LM] = {}
 
     @staticmethod
     def bootstrap(config: SoniConfig) -> dspy.LM:
@@ -22,29 +27,84 @@ class DSPyBootstrapper:
 
     def configure(self) -> dspy.LM:
         """Configure DSPy with the settings from config."""
-        # For now, we assume OpenAI or similar compatible interface
-        # In the future, this should support other providers based on config
+        lm = self.create_lm(self.config.settings.llm)
+        dspy.configure(lm=lm)
+        return lm
 
-        # M9/M10: Using dspy.LM with openai/gpt-4o-mini as default if not specified
-        # This matches the SoniConfig structure usually found in settings.llm
+    def module_llm_config(self, module: NLUModuleName) -> LLMConfig | None:
+        """Effective LLMConfig for a module, or None if it uses the global LM."""
+        override: LLMConfig | None = getattr(self.config.settings.module_llms, module)
+        if override is None:
+            return None
+        # Only fields set explicitly in the override replace the global ones
+        return self.config.settings.llm.model_copy(
+            update=override.model_dump(exclude_unset=True)
+        )
 
-        provider = self.config.settings.llm.provider
-        model_name = self.config.settings.llm.model
+    def module_lm(self, module: NLUModuleName) -> dspy.LM | None:
+        """LM for a module, or None to use the global LM.
 
-        if provider == "openai":
-            # dspy.LM("openai/model") format
-            lm = dspy.LM(f"openai/{model_name}")
-            dspy.configure(lm=lm)
-            return lm
+        Modules with identical effective configs share one LM (and therefore
+        one rate limiter).
+        """
+        llm_cfg = self.module_llm_config(module)
+        if llm_cfg is None:
+            return None
+        key = llm_cfg.model_dump_json()
+        if key not in self._module_lms:
+            self._module_lms[key] = self.create_lm(llm_cfg)
+        return self._module_lms[key]
 
-        elif provider == "anthropic":
-            lm = dspy.LM(f"anthropic/{model_name}")
-            dspy.configure(lm=lm)
-            return lm
+    @staticmethod
+    def create_lm(llm_cfg: LLMConfig) -> dspy.LM:
+        """Create a rate-limited, retrying LM for an LLMConfig."""
+        provider = llm_cfg.provider
+        model_name = llm_cfg.model
 
+        if provider == "anthropic":
+            model = f"anthropic/{model_name}"
         else:
-            # Fallback or generic support
-            # Assuming 'openai' compatible if unknown
-            lm = dspy.LM(f"openai/{model_name}")
-            dspy.configure(lm=lm)
-            return lm
+            # dspy.LM("openai/model") format; unknown providers are assumed
+            # to be OpenAI compatible
+            model = f"openai/{model_name}"
+
+        configure_http_pool(llm_cfg)
+
+        kwargs: dict[str, Any] = {}
+        if llm_cfg.api_key:
+            kwargs["api_key"] = llm_cfg.api_key
+        if llm_cfg.timeout_seconds is not None:
+            kwargs["timeout"] = llm_cfg.timeout_seconds
+
+        throttle = LMThrottle(
+            max_concurrent=llm_cfg.max_concurrent_requests,
+            requests_per_minute=llm_cfg.requests_per_minute,
+            burst=llm_cfg.rate_limit_burst,
+            retry=RetryPolicy(
+                max_retries=llm_cfg.max_retries,
+                base_delay=llm_cfg.retry_base_delay,
+                max_delay=llm_cfg.retry_max_delay,
+            ),
+        )
+        return ResilientLM(model, throttle=throttle, **kwargs)
+
+
+def configure_http_pool(llm_cfg: LLMConfig) -> None:
+    """Install shared pooled HTTP clients for litellm when pool sizes are configured.
+
+    Reusing one pooled client per process avoids a TCP/TLS handshake per
+    request under load.
+    """
+    if llm_cfg.max_connections is None and llm_cfg.max_keepalive_connections is None:
+        return
+
+    import httpx
+    import litellm
+
+    limits = httpx.Limits(
+        max_connections=llm_cfg.max_connections,
+        max_keepalive_connections=llm_cfg.max_keepalive_connections,
+    )
+    timeout = httpx.Timeout(llm_cfg.timeout_seconds or 600.0)
+    litellm.client_session = httpx.Client(limits=limits, timeout=timeout)
+    litellm.aclient_session = httpx.AsyncClient(limits=limits, timeout=timeout)
@@ -41,6 +41,12 @@ class FlowError(SoniError):
     pass
 
 
+class TurnQueueFullError(SoniError):
+    """Raised when a conversation thread has too many pending turns."""
+
+    pass
+
+
 class NLUError(SoniError):
     """Raised when NLU processing fails."""
 
@@ -6,11 +6,19 @@ Supports:
 - Existence: slot (truthy check)
 - Template substitution: "Hello, {name}!"
 - Branch case matching: ">1000", "<=500", "default"
+
+Expressions and case patterns are compiled once into closures
+(compile_expression / compile_pattern) so node functions evaluate them
+without re-parsing strings.
 """
 
 import operator
 import re
-from typing import Any
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import Any, NoReturn
+
+from soni.core.template import compile_template
 
 # Operators mapping - longer operators first to avoid partial matches
 _OPERATORS = {
@@ -23,6 +31,187 @@ _OPERATORS = {
 }
 
 
+Predicate = Callable[[Mapping[str, Any]], bool]
+Getter = Callable[[Mapping[str, Any]], Any]
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:"""
+    r"""(?P<op>>=|<=|!=|==|>|<)"""
+    r"""|(?P<paren>[()])"""
+    r"""|(?P<str>'[^']*'|"[^"]*")"""
+    r"""|(?P<word>[^\s()<>=!'"]+)"""
+    r""")"""
+)
+
+
+def _tokenize(expr: str) -> list[tuple[str, str]]:
+    """Split an expression into (kind, text) tokens."""
+    tokens: list[tuple[str, str]] = []
+    pos = 0
+    end = len(expr.rstrip())
+    while pos < end:
+        match = _TOKEN_RE.match(expr, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Invalid expression {expr!r}: unexpected character at {pos}")
+        kind = match.lastgroup or ""
+        text = match.group(kind)
+        if kind == "word" and text.upper() in ("AND", "OR"):
+            kind = text.upper()
+        tokens.append((kind, text))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser: OR < AND < parentheses/comparison."""
+
+    def __init__(self, expr: str) -> None:
+        self._expr = expr
+        self._tokens = _tokenize(expr)
+        self._pos = 0
+
+    def parse(self) -> Predicate:
+        if not self._tokens:
+            raise ValueError("Invalid expression: empty")
+        predicate = self._parse_or()
+        if self._pos != len(self._tokens):
+            self._error(f"unexpected '{self._tokens[self._pos][1]}'")
+        return predicate
+
+    def _peek(self) -> str | None:
+        return self._tokens[self._pos][0] if self._pos < len(self._tokens) else None
+
+    def _error(self, message: str) -> NoReturn:
+        raise ValueError(f"Invalid expression {self._expr!r}: {message}")
+
+    def _parse_or(self) -> Predicate:
+        left = self._parse_and()
+        while self._peek() == "OR":
+            self._pos += 1
+            left = _either(left, self._parse_and())
+        return left
+
+    def _parse_and(self) -> Predicate:
+        left = self._parse_primary()
+        while self._peek() == "AND":
+            self._pos += 1
+            left = _both(left, self._parse_primary())
+        return left
+
+    def _parse_primary(self) -> Predicate:
+        if self._peek() == "paren" and self._tokens[self._pos][1] == "(":
+            self._pos += 1
+            inner = self._parse_or()
+            if self._peek() != "paren" or self._tokens[self._pos][1] != ")":
+                self._error("missing ')'")
+            self._pos += 1
+            return inner
+
+        left = self._parse_operand(is_left=True)
+        if self._peek() != "op":
+            return _truthy(left)
+
+        op_str = self._tokens[self._pos][1]
+        self._pos += 1
+        right = self._parse_operand(is_left=False)
+        return _comparison(op_str, left, right)
+
+    def _parse_operand(self, is_left: bool) -> Getter:
+        """Consume consecutive words/strings as one operand.
+
+        Left operands are slot references; right operands are literals or
+        slot references (see _compile_literal).
+        """
+        parts: list[tuple[str, str]] = []
+        while self._peek() in ("word", "str"):
+            parts.append(self._tokens[self._pos])
+            self._pos += 1
+        if not parts:
+            self._error("expected a slot name or value")
+
+        if len(parts) == 1 and parts[0][0] == "str":
+            value = parts[0][1][1:-1]
+            return lambda slots: value
+
+        text = " ".join(part[1] for part in parts)
+        if is_left:
+            return lambda slots: slots.get(text)
+        return _compile_literal(text)
+
+
+def _either(left: Predicate, right: Predicate) -> Predicate:
+    def or_(slots: Mapping[str, Any]) -> bool:
+        return left(slots) or right(slots)
+
+    return or_
+
+
+def _both(left: Predicate, right: Predicate) -> Predicate:
+    def and_(slots: Mapping[str, Any]) -> bool:
+        return left(slots) and right(slots)
+
+    return and_
+
+
+def _truthy(getter: Getter) -> Predicate:
+    def truthy(slots: Mapping[str, Any]) -> bool:
+        return bool(getter(slots))
+
+    return truthy
+
+
+def _comparison(op_str: str, left: Getter, right: Getter) -> Predicate:
+    """Build a comparison predicate with the same coercion rules as before."""
+    op_func = _OPERATORS[op_str]
+
+    # Equality operators are None-safe
+    if op_str in ("==", "!="):
+
+        def equality(slots: Mapping[str, Any]) -> bool:
+            return bool(op_func(left(slots), right(slots)))
+
+        return equality
+
+    def ordering(slots: Mapping[str, Any]) -> bool:
+        left_val = left(slots)
+        # Ordering operators require non-None left value
+        if left_val is None:
+            return False
+        right_val = right(slots)
+
+        # Numeric comparison
+        left_num = _to_number(left_val)
+        right_num = _to_number(right_val)
+        if left_num is not None and right_num is not None:
+            return bool(op_func(left_num, right_num))
+
+        # String comparison fallback
+        if isinstance(left_val, str) and isinstance(right_val, str):
+            return bool(op_func(left_val, right_val))
+
+        return False
+
+    return ordering
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expr: str) -> Predicate:
+    """Compile a boolean expression into a predicate over slot values.
+
+    Precedence: OR < AND < parentheses/comparison. Compiled predicates are
+    cached per expression string, so evaluating them does no string parsing.
+
+    Raises:
+        ValueError: If the expression is malformed.
+
+    Examples:
+        >>> is_eligible = compile_expression("(age > 18 OR guardian) AND status == 'ok'")
+        >>> is_eligible({"age": 12, "guardian": True, "status": "ok"})
+        True
+    """
+    return _Parser(expr.strip()).parse()
+
+
 def evaluate_expression(expr: str, slots: dict[str, Any]) -> bool:
     """Evaluate a boolean expression against slot values.
 
@@ -41,72 +230,7 @@ def evaluate_expression(expr: str, slots: dict[str, Any]) -> bool:
         >>> evaluate_expression("items", {"items": ["a", "b"]})
         True
     """
-    expr = expr.strip()
-
-    # Handle AND/OR (case insensitive)
-    and_match = re.search(r"\s+AND\s+", expr, re.IGNORECASE)
-    if and_match:
-        left = expr[: and_match.start()]
-        right = expr[and_match.end() :]
-        return evaluate_expression(left, slots) and evaluate_expression(right, slots)
-
-    or_match = re.search(r"\s+OR\s+", expr, re.IGNORECASE)
-    if or_match:
-        left = expr[: or_match.start()]
-        right = expr[or_match.end() :]
-        return evaluate_expression(left, slots) or evaluate_expression(right, slots)
-
-    # Handle parentheses
-    if expr.startswith("(") and expr.endswith(")"):
-        return evaluate_expression(expr[1:-1], slots)
-
-    # Handle comparison operators
-    for op_str, op_func in _OPERATORS.items():
-        if op_str in expr:
-            return _evaluate_comparison(expr, op_str, op_func, slots)
-
-    # Simple existence/truthiness check
-    slot_name = expr.strip()
-    return bool(slots.get(slot_name))
-
-
-def _evaluate_comparison(
-    expr: str,
-    op_str: str,
-    op_func: Any,
-    slots: dict[str, Any],
-) -> bool:
-    """Evaluate a single comparison expression."""
-    parts = expr.split(op_str, 1)
-    if len(parts) != 2:
-        return False
-
-    left_expr = parts[0].strip()
-    right_expr = parts[1].strip()
-
-    left_val = slots.get(left_expr)
-    right_val = _parse_literal(right_expr, slots)
-
-    # Equality operators are None-safe
-    if op_str in ("==", "!="):
-        return bool(op_func(left_val, right_val))
-
-    # Ordering operators require non-None left value
-    if left_val is None:
-        return False
-
-    # Numeric comparison
-    left_num = _to_number(left_val)
-    right_num = _to_number(right_val)
-
-    if left_num is not None and right_num is not None:
-        return bool(op_func(left_num, right_num))
-
-    # String comparison fallback
-    if isinstance(left_val, str) and isinstance(right_val, str):
-        return bool(op_func(left_val, right_val))
-
-    return False
+    return compile_expression(expr)(slots)
 
 
 def _to_number(val: Any) -> float | int | None:
@@ -121,33 +245,37 @@ def _to_number(val: Any) -> float | int | None:
     return None
 
 
-def _parse_literal(expr: str, slots: dict[str, Any]) -> Any:
-    """Parse a value expression (literal or slot reference)."""
+def _compile_literal(expr: str) -> Getter:
+    """Compile a value expression (literal or slot reference) into a getter."""
     expr = expr.strip()
 
     # String literal (quoted)
     if (expr.startswith("'") and expr.endswith("'")) or (
         expr.startswith('"') and expr.endswith('"')
     ):
-        return expr[1:-1]
+        return _constant(expr[1:-1])
 
     # Numeric literal
     num = _to_number(expr)
     if num is not None:
-        return num
+        return _constant(num)
 
     # Boolean literals
     if expr.lower() == "true":
-        return True
+        return _constant(True)
     if expr.lower() == "false":
-        return False
+        return _constant(False)
 
     # None literal
     if expr.lower() in ("none", "null"):
-        return None
+        return _constant(None)
 
     # Slot reference
-    return slots.get(expr)
+    return lambda slots: slots.get(expr)
+
+
+def _constant(value: Any) -> Getter:
+    return lambda slots: value
 
 
 def evaluate_value(value_expr: str | Any, slots: dict[str, Any]) -> Any:
@@ -172,11 +300,53 @@ def evaluate_value(value_expr: str | Any, slots: dict[str, Any]) -> Any:
     if "{" not in value_expr:
         return value_expr
 
-    try:
-        return value_expr.format(**slots)
-    except (KeyError, ValueError):
-        # Return original if substitution fails
-        return value_expr
+    # Placeholders of missing slots are left untouched (see soni.core.template)
+    return compile_template(value_expr).render(slots)
+
+
+def _compile_comparison(
+    op_func: Callable[[Any, Any], Any], threshold_str: str, is_equality: bool
+) -> Callable[[Any], bool]:
+    """Predicate comparing a value against a threshold parsed once."""
+    threshold = _to_number(threshold_str)
+
+    def compare(value: Any) -> bool:
+        val_num = _to_number(value)
+        if threshold is not None and val_num is not None:
+            return bool(op_func(val_num, threshold))
+
+        # String comparison for equality operators
+        if is_equality:
+            return bool(op_func(str(value), threshold_str))
+
+        return False
+
+    return compare
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> Callable[[Any], bool]:
+    """Compile a branch case pattern into a predicate over a value.
+
+    See matches() for the supported patterns. Thresholds and literals are
+    parsed once; compiled patterns are cached per pattern string.
+    """
+    pattern = pattern.strip()
+
+    # Comparison operators
+    for op_str, op_func in _OPERATORS.items():
+        if pattern.startswith(op_str):
+            threshold_str = pattern[len(op_str) :].strip()
+            return _compile_comparison(op_func, threshold_str, op_str in ("==", "!="))
+
+    # Boolean pattern
+    if pattern.lower() == "true":
+        return lambda value: bool(value) is True
+    if pattern.lower() == "false":
+        return lambda value: bool(value) is False
+
+    # Exact string match
+    return lambda value: str(value) == pattern
 
 
 def matches(value: Any, pattern: str) -> bool:
@@ -204,29 +374,4 @@ def matches(value: Any, pattern: str) -> bool:
         >>> matches("approved", "approved")
         True
     """
-    pattern = pattern.strip()
-
-    # Comparison operators
-    for op_str, op_func in _OPERATORS.items():
-        if pattern.startswith(op_str):
-            threshold_str = pattern[len(op_str) :].strip()
-            threshold = _to_number(threshold_str)
-            val_num = _to_number(value)
-
-            if threshold is not None and val_num is not None:
-                return bool(op_func(val_num, threshold))
-
-            # String comparison for equality operators
-            if op_str in ("==", "!="):
-                return bool(op_func(str(value), threshold_str))
-
-            return False
-
-    # Boolean pattern
-    if pattern.lower() == "true":
-        return bool(value) is True
-    if pattern.lower() == "false":
-        return bool(value) is False
-
-    # Exact string match
-    return str(value) == pattern
+    return compile_pattern(pattern)(value)
@@ -0,0 +1,212 @@
+"""Rate-limit-aware LM client.
+
+ResilientLM is a dspy.LM that sends every request through an LMThrottle:
+
+- a concurrency cap on requests in flight
+- a token bucket limiting the request rate (with bursts up to its capacity)
+- retries with exponential backoff and full jitter on transient errors
+  (rate limits, timeouts, connection failures, 5xx)
+
+so bursts queue up and back off instead of failing the turn.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import dspy
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` acquisitions per second and bursts of ``capacity``.
+
+    Thread-safe; usable from sync code and from any event loop.
+    """
+
+    def __init__(
+        self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how long to wait before using it (0 = now)."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # Negative balance: the caller's token becomes available later
+            return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+@functools.lru_cache(maxsize=1)
+def _transient_errors() -> tuple[type[BaseException], ...]:
+    """Exceptions worth retrying: litellm rate limit/timeout/connection/5xx errors."""
+    import litellm
+
+    names = (
+        "RateLimitError",
+        "Timeout",
+        "APIConnectionError",
+        "ServiceUnavailableError",
+        "InternalServerError",
+    )
+    litellm_errors = tuple(getattr(litellm, name) for name in names if hasattr(litellm, name))
+    return (*litellm_errors, TimeoutError, ConnectionError)
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether an LM error is likely to succeed on retry."""
+    return isinstance(error, _transient_errors())
+
+
+class LMThrottle:
+    """Concurrency cap, rate limit and retries shared by the copies of an LM.
+
+    Async callers share one semaphore per event loop; sync callers (e.g.
+    optimizers) share a separate thread semaphore of the same size.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 0,
+        requests_per_minute: float = 0,
+        burst: int | None = None,
+        retry: RetryPolicy | None = None,
+        is_retryable: Callable[[BaseException], bool] = is_transient,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.retry = retry or RetryPolicy()
+        self._is_retryable = is_retryable
+        self.bucket = (
+            TokenBucket(requests_per_minute / 60, burst or max(1, max_concurrent))
+            if requests_per_minute > 0
+            else None
+        )
+        self._thread_semaphore = (
+            threading.BoundedSemaphore(max_concurrent) if max_concurrent > 0 else None
+        )
+        self._async_semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        self.retries = 0
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "LMThrottle":
+        # dspy.LM.copy() deep-copies the LM: copies must share the same limits
+        return self
+
+    def _async_semaphore(self) -> asyncio.Semaphore | None:
+        if self.max_concurrent <= 0:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._async_semaphores = {
+                k: v for k, v in self._async_semaphores.items() if not k.is_closed()
+            }
+            self._async_semaphores[loop] = semaphore
+        return semaphore
+
+    def _should_retry(self, error: Exception, attempt: int) -> bool:
+        if attempt >= self.retry.max_retries or not self._is_retryable(error):
+            return False
+        self.retries += 1
+        logger.warning(f"LM request failed ({type(error).__name__}), retry {attempt + 1}: {error}")
+        return True
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run an async LM request under the limits, retrying transient errors."""
+        semaphore = self._async_semaphore()
+        attempt = 0
+        while True:
+            if self.bucket is not None:
+                await self.bucket.acquire()
+            try:
+                if semaphore is None:
+                    return await fn()
+                async with semaphore:
+                    return await fn()
+            except Exception as e:
+                if not self._should_retry(e, attempt):
+                    raise
+            # Back off outside the semaphore so other requests can proceed
+            await asyncio.sleep(self.retry.delay(attempt))
+            attempt += 1
+
+    def call_sync(self, fn: Callable[[], T]) -> T:
+        """Blocking variant of :meth:`call`."""
+        attempt = 0
+        while True:
+            if self.bucket is not None:
+                self.bucket.acquire_sync()
+            try:
+                if self._thread_semaphore is None:
+                    return fn()
+                with self._thread_semaphore:
+                    return fn()
+            except Exception as e:
+                if not self._should_retry(e, attempt):
+                    raise
+            time.sleep(self.retry.delay(attempt))
+            attempt += 1
+
+
+class ResilientLM(dspy.LM):
+    """dspy.LM whose requests go through an LMThrottle.
+
+    Retries are handled by the throttle, so litellm's own retries are disabled.
+    """
+
+    def __init__(self, model: str, throttle: LMThrottle | None = None, **kwargs: Any) -> None:
+        kwargs.setdefault("num_retries", 0)
+        super().__init__(model, **kwargs)
+        self.throttle = throttle or LMThrottle()
+
+    def forward(self, prompt: Any = None, messages: Any = None, **kwargs: Any) -> Any:
+        request = functools.partial(super().forward, prompt=prompt, messages=messages, **kwargs)
+        return self.throttle.call_sync(request)
+
+    async def aforward(self, prompt: Any = None, messages: Any = None, **kwargs: Any) -> Any:
+        request = functools.partial(super().aforward, prompt=prompt, messages=messages, **kwargs)
+        return await self.throttle.call(request)
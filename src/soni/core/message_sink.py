@@ -4,8 +4,9 @@ This module defines the abstract interface and implementations for
 streaming messages to users during flow execution.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Literal
 
 
 class MessageSink(ABC):
@@ -17,6 +18,20 @@ class MessageSink(ABC):
         ...
 
 
+class StreamingMessageSink(MessageSink):
+    """Sink that can also receive a message incrementally (e.g. LLM tokens).
+
+    Chunks of a message in progress arrive through ``send_chunk``; the complete
+    text is still delivered afterwards through ``send``, which replaces the
+    streamed draft (it may differ slightly, e.g. a fallback after an error).
+    """
+
+    @abstractmethod
+    async def send_chunk(self, chunk: str) -> None:
+        """Send the next piece of a message that is still being generated."""
+        ...
+
+
 class BufferedMessageSink(MessageSink):
     """Buffers messages for testing or batch delivery."""
 
@@ -41,3 +56,30 @@ class WebSocketMessageSink(MessageSink):
     async def send(self, message: str) -> None:
         """Send message via WebSocket."""
         await self._ws.send_json({"type": "message", "content": message})
+
+
+# Event kinds emitted by QueueMessageSink: a streamed chunk or a complete message
+SinkEventType = Literal["delta", "message"]
+
+
+class QueueMessageSink(BufferedMessageSink, StreamingMessageSink):
+    """Buffers messages and exposes chunks and messages as a queue of events.
+
+    Used by the streaming HTTP endpoint: a consumer reads ``events`` while the
+    turn runs. Complete messages are also buffered, so the turn's return
+    value is unchanged.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: asyncio.Queue[tuple[SinkEventType, str]] = asyncio.Queue()
+
+    async def send_chunk(self, chunk: str) -> None:
+        """Queue a streamed chunk."""
+        if chunk:
+            self.events.put_nowait(("delta", chunk))
+
+    async def send(self, message: str) -> None:
+        """Buffer and queue a complete message."""
+        await super().send(message)
+        self.events.put_nowait(("message", message))
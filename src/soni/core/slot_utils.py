@@ -1,9 +1,17 @@
 """Utilities for slot manipulation.
 
 This module provides the single source of truth for slot-related operations.
+
+flow_slots is copy-on-write: the per-flow slot dicts ({slot_name: value}) are
+never mutated once they are part of a state. Every update builds a new outer
+dict and new slot dicts only for the flows that changed; unchanged flows (and
+slot values) are shared between the old and new state. A merge therefore costs
+O(flows + changed slots) instead of a deep copy of every slot value.
+
+Callers must not mutate slot dicts obtained from state (e.g. via
+FlowManager.get_all_slots); copy them first if needed.
 """
 
-from copy import deepcopy
 from typing import Any
 
 
@@ -41,16 +49,19 @@ def deep_merge_flow_slots(
         - For existing flow_ids, slots are merged (not replaced)
         - Individual slot values are replaced (not deep merged)
         - None values in new dict DO overwrite base values
+        - Slot dicts of flows not in ``new`` are shared with ``base``
+          (copy-on-write); changed flows always get a fresh slot dict
     """
     if not new:
         return (base if base is not None else {}) if in_place else dict(base or {})
 
-    result = base if (in_place and base is not None) else deepcopy(base or {})
+    result = base if (in_place and base is not None) else dict(base or {})
 
     for flow_id, slots in new.items():
-        if flow_id in result:
-            # Merge slots for existing flow
-            result[flow_id] = {**result[flow_id], **slots}
+        existing = result.get(flow_id)
+        if existing:
+            # Merge slots for existing flow into a new dict
+            result[flow_id] = {**existing, **slots}
         else:
             # Add new flow
             result[flow_id] = dict(slots)
@@ -84,7 +95,7 @@ def set_slot_value(
     slot_name: str,
     value: Any,
 ) -> dict[str, dict[str, Any]]:
-    """Set a slot value immutably.
+    """Set a slot value immutably (copy-on-write).
 
     Args:
         flow_slots: Flow slots dictionary
@@ -93,10 +104,8 @@ def set_slot_value(
         value: Value to set
 
     Returns:
-        New flow_slots dict with updated value
+        New flow_slots dict with updated value; other flows' slot dicts are shared
     """
-    result = deepcopy(flow_slots)
-    if flow_id not in result:
-        result[flow_id] = {}
-    result[flow_id][slot_name] = value
+    result = dict(flow_slots)
+    result[flow_id] = {**result.get(flow_id, {}), slot_name: value}
     return result
@@ -9,6 +9,7 @@ def create_empty_state() -> DialogueState:
         "user_message": None,
         "messages": [],  # Messages are always additive (add_messages reducer)
         "response": None,
+        "conversation_summary": None,  # None keeps the persisted summary
         "flow_stack": None,  # MUST be None to avoid clobbering persistence
         "flow_slots": None,  # MUST be None
         "commands": None,  # Commands are transient but safer as None
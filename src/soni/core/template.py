@@ -0,0 +1,128 @@
+"""Compiled prompt templates.
+
+Templates such as "Transfer {amount} to {recipient}?" are parsed once with
+string.Formatter into a render plan: literal chunks plus slot lookups. The
+plan knows which slots it needs, renders without building a kwargs dict
+and leaves placeholders of missing slots untouched (instead of giving up on
+the whole template), logging which slots were missing.
+"""
+
+import logging
+import string
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_FORMATTER = string.Formatter()
+
+# (literal, field_name, format_spec, conversion, placeholder)
+_Part = tuple[str, str | None, str, str | None, str]
+
+
+def _root_name(field_name: str) -> str:
+    """Slot referenced by a field such as 'user.name' or 'items[0]'."""
+    for i, char in enumerate(field_name):
+        if char in ".[":
+            return field_name[:i]
+    return field_name
+
+
+class Template:
+    """A template parsed into literal chunks and slot fields."""
+
+    __slots__ = ("source", "slots", "_parts")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        # Each part is (literal, field_name, format_spec, conversion, placeholder);
+        # field_name is None for purely literal parts
+        self._parts: tuple[_Part, ...]
+        self.slots: frozenset[str]
+
+        try:
+            parsed = list(_FORMATTER.parse(source))
+        except ValueError:
+            # Malformed template (e.g. unmatched brace): render it verbatim
+            logger.warning(f"Invalid template, rendering verbatim: {source!r}")
+            self._parts = ((source, None, "", None, ""),)
+            self.slots = frozenset()
+            return
+
+        parts: list[_Part] = []
+        for literal, field_name, format_spec, conversion in parsed:
+            if field_name is None:
+                parts.append((literal, None, "", None, ""))
+            elif not field_name or field_name.isdigit() or "{" in (format_spec or ""):
+                # Positional or nested fields aren't slot lookups: render verbatim
+                placeholder = _placeholder(field_name, format_spec, conversion)
+                parts.append((literal + placeholder, None, "", None, ""))
+            else:
+                placeholder = _placeholder(field_name, format_spec, conversion)
+                parts.append((literal, field_name, format_spec or "", conversion, placeholder))
+
+        self._parts = tuple(parts)
+        self.slots = frozenset(_root_name(p[1]) for p in self._parts if p[1] is not None)
+
+    def missing(self, slots: Mapping[str, Any]) -> set[str]:
+        """Slots referenced by the template that are absent from ``slots``."""
+        return {name for name in self.slots if name not in slots}
+
+    def render(self, slots: Mapping[str, Any]) -> str:
+        """Render the template; placeholders of missing slots are kept as-is."""
+        chunks: list[str] = []
+        missing: list[str] = []
+        for literal, field_name, format_spec, conversion, placeholder in self._parts:
+            chunks.append(literal)
+            if field_name is None:
+                continue
+            try:
+                chunks.append(_render_field(field_name, format_spec, conversion, slots))
+            except (KeyError, IndexError, AttributeError, ValueError, TypeError):
+                missing.append(field_name)
+                chunks.append(placeholder)
+
+        if missing:
+            logger.debug(f"Template {self.source!r} missing slots: {missing}")
+        return "".join(chunks)
+
+    def __repr__(self) -> str:
+        return f"Template({self.source!r})"
+
+
+def _placeholder(field_name: str, format_spec: str | None, conversion: str | None) -> str:
+    """Rebuild the original '{field!conv:spec}' text of a field."""
+    text = field_name
+    if conversion:
+        text += f"!{conversion}"
+    if format_spec:
+        text += f":{format_spec}"
+    return "{" + text + "}"
+
+
+def _render_field(
+    field_name: str,
+    format_spec: str,
+    conversion: str | None,
+    slots: Mapping[str, Any],
+) -> str:
+    if field_name in slots and not conversion and not format_spec:
+        # Fast path: plain "{slot}"
+        return format(slots[field_name])
+    value, _ = _FORMATTER.get_field(field_name, (), slots)
+    value = _FORMATTER.convert_field(value, conversion)
+    return str(_FORMATTER.format_field(value, format_spec))
+
+
+@lru_cache(maxsize=1024)
+def compile_template(source: str) -> Template:
+    """Parse a template once; compiled templates are cached per string.
+
+    Examples:
+        >>> compile_template("Hello, {name}!").render({"name": "Alice"})
+        'Hello, Alice!'
+        >>> compile_template("Hello, {name}!").missing({})
+        {'name'}
+    """
+    return Template(source)
@@ -97,6 +97,11 @@ def _last_value_any(current: Any | None, new: Any | None) -> Any | None:
     return new
 
 
+def _last_value_keep_none(current: str | None, new: str | None) -> str | None:
+    """Reducer that keeps the last value but ignores None (None never clears)."""
+    return current if new is None else new
+
+
 def _merge_flow_slots(
     current: dict[str, dict[str, Any]],
     new: dict[str, dict[str, Any]],
@@ -157,6 +162,7 @@ class DialogueState(TypedDict):
     user_message: Annotated[str | None, _last_value_str]
     messages: Annotated[list[AnyMessage], add_messages]
     response: Annotated[str | None, _last_value_str]
+    conversation_summary: Annotated[str | None, _last_value_keep_none]  # Trimmed history
 
     # M2: Flow Management
     flow_stack: Annotated[list[FlowContext] | None, _last_value_any]
@@ -13,6 +13,7 @@ from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
+from soni.compiler.plan import FlowPlan, build_flow_plan
 from soni.compiler.subgraph import build_flow_subgraph
 from soni.config.models import SoniConfig
 from soni.core.types import DialogueState
@@ -26,15 +27,46 @@ from soni.runtime.context import RuntimeContext
 def compile_all_subgraphs(config: SoniConfig) -> dict[str, CompiledStateGraph]:
     """Compile subgraphs for all flows in config.
 
+    Flows are compiled one after another: compiled subgraphs can't be pickled,
+    so a process pool could only take over a tiny part of the work (see
+    ``soni compile-profile --workers``).
+
     Returns:
         Dict mapping flow_name to compiled subgraph.
     """
     subgraphs: dict[str, Any] = {}
     for flow_name, flow_config in config.flows.items():
-        subgraphs[flow_name] = build_flow_subgraph(flow_config)
+        subgraphs[flow_name] = build_flow_subgraph(flow_config, flow_name)
     return subgraphs
 
 
+def compile_all_flow_plans(config: SoniConfig) -> dict[str, FlowPlan]:
+    """Compile step plans for all flows in config (direct execution engine).
+
+    Returns:
+        Dict mapping flow_name to FlowPlan.
+    """
+    return {
+        flow_name: build_flow_plan(flow_config, flow_name)
+        for flow_name, flow_config in config.flows.items()
+    }
+
+
+def compile_flow(config: SoniConfig, flow_name: str) -> Any:
+    """Compile one flow for the configured execution engine."""
+    flow_config = config.flows[flow_name]
+    if config.settings.execution_engine == "direct":
+        return build_flow_plan(flow_config, flow_name)
+    return build_flow_subgraph(flow_config, flow_name)
+
+
+def compile_flows(config: SoniConfig) -> dict[str, Any]:
+    """Compile all flows for the configured execution engine."""
+    if config.settings.execution_engine == "direct":
+        return compile_all_flow_plans(config)
+    return compile_all_subgraphs(config)
+
+
 def build_orchestrator(
     checkpointer: BaseCheckpointSaver | None = None,
 ) -> CompiledStateGraph[DialogueState, RuntimeContext, Any, Any]:
@@ -3,16 +3,10 @@
 import logging
 from typing import Literal
 
-from soni.config.models import CollectStepConfig, SoniConfig
 from soni.core.types import DialogueState
 from soni.du import SlotExtractionInput
-from soni.du.models import (
-    CommandInfo,
-    DialogueContext,
-    FlowInfo,
-    SlotDefinition,
-    SlotValue,
-)
+from soni.du.catalog import NLUCatalog
+from soni.du.models import DialogueContext, FlowInfo, SlotValue
 from soni.flow.manager import FlowManager
 from soni.runtime.context import RuntimeContext
 
@@ -27,6 +21,8 @@ class DialogueContextBuilder:
 
     def __init__(self, context: RuntimeContext) -> None:
         self._context = context
+        # Static parts are compiled once per config by RuntimeLoop
+        self._catalog = context.nlu_catalog or NLUCatalog(context.config)
 
     def build(self, state: DialogueState) -> DialogueContext:
         """Build full dialogue context for NLU.
@@ -37,29 +33,19 @@ class DialogueContextBuilder:
         Returns:
             Constructed DialogueContext
         """
-        config = self._context.config
         fm = self._context.flow_manager
 
-        flows_info = self._build_flows_info(config)
-        commands_info = self._build_commands_info()
+        commands_info = self._catalog.commands_info()
 
         active_ctx = fm.get_active_context(state)
         active_flow = active_ctx["flow_name"] if active_ctx else None
 
+        flows_info = self._select_flows(state.get("user_message") or "", active_flow)
+
         expected_slot = self._get_expected_slot(state)
 
-        # Build flow_slots from active flow's collect steps
-        flow_slots_defs: list[SlotDefinition] = []
-        if active_flow and active_flow in config.flows:
-            for slot_input in self.get_slot_definitions(active_flow):
-                flow_slots_defs.append(
-                    SlotDefinition(
-                        name=slot_input.name,
-                        slot_type=slot_input.slot_type,
-                        description=slot_input.description,
-                        examples=slot_input.examples,
-                    )
-                )
+        # Slot definitions of the active flow (precomputed)
+        flow_slots_defs = self._catalog.flow_slots(active_flow) if active_flow else []
 
         # Build current_slots from flow state
         current_slots = self._get_current_slots(state, fm)
@@ -96,37 +82,28 @@ class DialogueContextBuilder:
             conversation_state=conversation_state,
         )
 
-    def _build_flows_info(self, config: SoniConfig) -> list[FlowInfo]:
-        """Build flow information list."""
-        return [
-            FlowInfo(
-                name=name,
-                description=flow.description or name,
-                trigger_intents=getattr(flow, "trigger_intents", None) or [],
-            )
-            for name, flow in config.flows.items()
-        ]
+    def _select_flows(self, user_message: str, active_flow: str | None) -> list[FlowInfo]:
+        """Shortlist flows for the NLU prompt.
 
-    def _build_commands_info(self) -> list[CommandInfo]:
-        """Build standard command information list."""
-        return [
-            CommandInfo(
-                command_type="start_flow",
-                description="Start a new flow. flow_name must match one of available_flows.name",
-                required_fields=["flow_name"],
-                example='{"type": "start_flow", "flow_name": "check_balance"}',
-            ),
-            CommandInfo(
-                command_type="set_slot",
-                description="Set a slot value when user provides information",
-                required_fields=["slot", "value"],
-                example='{"type": "set_slot", "slot": "account_type", "value": "checking"}',
-            ),
-            CommandInfo(command_type="cancel_flow", description="Cancel current flow"),
-            CommandInfo(command_type="chitchat", description="Off-topic message"),
-            CommandInfo(command_type="affirm", description="User confirms/agrees"),
-            CommandInfo(command_type="deny", description="User denies/disagrees"),
-        ]
+        With flow_shortlist_size=K, only the K flows that best match the message
+        (plus the active flow) are passed. Falls back to every flow when
+        shortlisting is off, no index is available, or nothing matches.
+        """
+        all_flows = self._catalog.flows_info()
+        top_k = self._context.config.settings.flow_shortlist_size
+        index = self._context.flow_index
+        if not top_k or index is None or len(all_flows) <= top_k or not user_message:
+            return all_flows
+
+        selected = [name for name, _score in index.rank(user_message, top_k=top_k)]
+        if not selected:
+            return all_flows
+        if active_flow and active_flow not in selected:
+            selected.append(active_flow)
+
+        shortlist = [info for name in selected if (info := self._catalog.flow_info(name))]
+        logger.debug(f"Flow shortlist ({len(shortlist)}/{len(all_flows)}): {selected}")
+        return shortlist
 
     def _get_expected_slot(self, state: DialogueState) -> str | None:
         """Extract expected slot from pending task."""
@@ -143,34 +120,7 @@ class DialogueContextBuilder:
 
     def get_slot_definitions(self, flow_name: str) -> list[SlotExtractionInput]:
         """Extract slot definitions from flow config for SlotExtractor."""
-        config = self._context.config
-        if flow_name not in config.flows:
-            return []
-
-        flow_config = config.flows[flow_name]
-        definitions_map = {}
-
-        # 1. explicit slots from flow definition
-        if flow_config.slots:
-            for slot in flow_config.slots:
-                definitions_map[slot.name] = SlotExtractionInput(
-                    name=slot.name,
-                    slot_type=slot.type or "string",
-                    description=slot.description or f"Value for {slot.name}",
-                    examples=[],
-                )
-
-        # 2. implicit slots from collect steps (fallback)
-        for step in flow_config.steps:
-            if isinstance(step, CollectStepConfig) and step.slot not in definitions_map:
-                definitions_map[step.slot] = SlotExtractionInput(
-                    name=step.slot,
-                    slot_type="string",
-                    description=step.message or f"Value for {step.slot}",
-                    examples=[],
-                )
-
-        return list(definitions_map.values())
+        return self._catalog.slot_inputs(flow_name)
 
     def _get_current_slots(self, state: DialogueState, fm: FlowManager) -> list[SlotValue]:
         """Get current slot values from flow state."""
@@ -0,0 +1,76 @@
+"""Retention policy for the conversation history kept in dialogue state.
+
+``messages`` uses the add_messages reducer, so by default every user message
+stays in the checkpoint for the lifetime of the thread. HistoryPolicy trims
+on write: when appending a message would exceed ``max_messages`` it also
+emits RemoveMessage entries for the oldest ones, and optionally folds their
+text into a rolling ``conversation_summary`` that the NLU sees instead.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from langchain_core.messages import BaseMessage, RemoveMessage
+
+from soni.config.models import HistoryConfig
+from soni.core.types import DialogueState
+from soni.dm.nodes.history_converter import HistoryConverter
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PREFIX = "Summary of earlier conversation:"
+
+
+def roll_summary(previous: str | None, dropped: Sequence[BaseMessage], max_chars: int) -> str:
+    """Append dropped messages to a summary, keeping its most recent ``max_chars``.
+
+    Deterministic (no LLM call): one "role: content" line per message, oldest
+    lines discarded first.
+    """
+    lines = [previous] if previous else []
+    for msg in dropped:
+        role = "user" if getattr(msg, "type", None) == "human" else "assistant"
+        lines.append(f"{role}: {msg.content}")
+    summary = "\n".join(lines)
+    if len(summary) <= max_chars:
+        return summary
+    tail = summary[-max_chars:]
+    # Prefer cutting at a line boundary
+    newline = tail.find("\n")
+    return tail[newline + 1 :] if 0 <= newline < len(tail) - 1 else tail
+
+
+class HistoryPolicy:
+    """Bounds the stored message history and builds the NLU history window."""
+
+    def __init__(self, config: HistoryConfig) -> None:
+        self.config = config
+
+    def append(self, state: DialogueState, message: BaseMessage) -> dict[str, Any]:
+        """State update adding ``message`` and trimming the history to its limit."""
+        update: dict[str, Any] = {"messages": [message]}
+        max_messages = self.config.max_messages
+        messages = state.get("messages") or []
+        overflow = len(messages) + 1 - max_messages
+        if max_messages <= 0 or overflow <= 0:
+            return update
+
+        dropped = messages[:overflow]
+        update["messages"] = [RemoveMessage(id=m.id) for m in dropped if m.id] + [message]
+        if self.config.summarize:
+            update["conversation_summary"] = roll_summary(
+                state.get("conversation_summary"), dropped, self.config.summary_max_chars
+            )
+        logger.debug(f"Trimmed {len(dropped)} messages from history")
+        return update
+
+    def nlu_history(self, state: DialogueState) -> list[dict[str, str]]:
+        """Recent messages in NLU format, preceded by the rolling summary if any."""
+        history = HistoryConverter.to_nlu_format(
+            state.get("messages") or [], max_history=self.config.nlu_window
+        )
+        summary = state.get("conversation_summary")
+        if summary:
+            history.insert(0, {"role": "system", "content": f"{SUMMARY_PREFIX}\n{summary}"})
+        return history
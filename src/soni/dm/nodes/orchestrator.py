@@ -1,9 +1,11 @@
 """Orchestrator node - thin coordinator using RuntimeContext."""
 
+import logging
 from typing import Any
 
 from langgraph.runtime import Runtime
 
+from soni.compiler.plan import FlowPlan
 from soni.core.types import DialogueState
 from soni.dm.orchestrator import (
     build_merged_return,
@@ -21,9 +23,13 @@ from soni.dm.orchestrator.task_handler import PendingTaskHandler, TaskAction
 from soni.flow.manager import apply_delta_to_dict
 from soni.runtime.context import RuntimeContext
 
+logger = logging.getLogger(__name__)
+
 # Safety limit to prevent infinite loops
 MAX_FLOW_ITERATIONS = 50
 
+FLOW_UNAVAILABLE_MESSAGE = "Sorry, I can't continue with that anymore."
+
 
 async def orchestrator_node(
     state: DialogueState,
@@ -82,12 +88,28 @@ async def orchestrator_node(
         stack_before = working_state.get("flow_stack") or []
         stack_size_before = len(stack_before)
 
-        # Execute subgraph
+        # Execute subgraph (or its step plan with the direct engine)
         subgraph = ctx.subgraph_registry.get(active_ctx["flow_name"])
+        if subgraph is None:
+            # A config reload removed the flow this conversation was in
+            logger.warning(f"Flow '{active_ctx['flow_name']}' no longer exists, leaving it")
+            await ctx.message_sink.send(FLOW_UNAVAILABLE_MESSAGE)
+            _, pop_delta = fm.pop_flow(working_state)
+            apply_delta_to_dict(updates, pop_delta)
+            working_state["flow_stack"] = pop_delta.flow_stack or []
+            if working_state["flow_stack"]:
+                continue  # Resume parent flow
+            break
+
         subgraph_state = build_subgraph_state(working_state)
         subgraph_output: dict[str, Any] = {}
 
-        async for event in subgraph.astream(subgraph_state, stream_mode="updates"):
+        if isinstance(subgraph, FlowPlan):
+            events = subgraph.astream(subgraph_state, runtime)
+        else:
+            events = subgraph.astream(subgraph_state, stream_mode="updates")
+
+        async for event in events:
             for _node_name, output in event.items():
                 pending_task = output.get("_pending_task")
 
@@ -1,28 +1,70 @@
 """Understand node - NLU orchestrator.
 
 Refactored to comply with SRP by delegating responsibilities to specialized components:
-- HistoryConverter: Message format conversion
+- HistoryPolicy: History retention and NLU history window
 - DialogueContextBuilder: NLU context construction
 
 Note: Command processing (StartFlow/CancelFlow/SetSlot) has been consolidated
 into orchestrator_node's CommandProcessor for OCP compliance (Issue #3).
 """
 
+import asyncio
 import logging
 from typing import Any, cast
 
 from langchain_core.messages import HumanMessage
 from langgraph.runtime import Runtime
 
+from soni.core.commands import SetSlot
 from soni.core.errors import NLUError, NLUProviderError
 from soni.core.types import DialogueState
 from soni.dm.nodes.context_builder import DialogueContextBuilder
-from soni.dm.nodes.history_converter import HistoryConverter
+from soni.dm.nodes.history_policy import HistoryPolicy
+from soni.du.models import DialogueContext
 from soni.runtime.context import RuntimeContext
 
 logger = logging.getLogger(__name__)
 
 
+def _discard_result(task: "asyncio.Task[list[SetSlot]]") -> None:
+    """Retrieve the outcome of an unused speculative task so errors aren't logged as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _start_speculative_extraction(
+    ctx: RuntimeContext,
+    context_builder: DialogueContextBuilder,
+    user_message: str,
+    dialogue_context: DialogueContext,
+) -> dict[str, "asyncio.Task[list[SetSlot]]"]:
+    """Launch Pass 2 for the most likely flows before Pass 1 has finished.
+
+    Only runs when speculative_slot_extraction is enabled and no flow is
+    active (cold-start turns), using the lexical FlowIndex to pick
+    candidates. Returns tasks keyed by flow name.
+    """
+    # The FlowIndex also exists for flow shortlisting, so check the setting itself
+    if not ctx.config.settings.speculative_slot_extraction:
+        return {}
+    if not ctx.flow_index or dialogue_context.active_flow:
+        return {}
+
+    top_k = ctx.config.settings.speculative_max_flows
+    tasks: dict[str, asyncio.Task[list[SetSlot]]] = {}
+    for flow_name, _score in ctx.flow_index.rank(user_message, top_k=top_k):
+        slot_definitions = context_builder.get_slot_definitions(flow_name)
+        if not slot_definitions:
+            continue
+        task = asyncio.ensure_future(ctx.slot_extractor.acall(user_message, slot_definitions))
+        task.add_done_callback(_discard_result)
+        tasks[flow_name] = task
+
+    if tasks:
+        logger.debug(f"Speculative slot extraction started for {list(tasks)}")
+    return tasks
+
+
 async def understand_node(
     state: DialogueState,
     runtime: Runtime[RuntimeContext],
@@ -31,67 +73,96 @@ async def understand_node(
 
     Orchestrates:
     1. Context building
-    2. NLU Pass 1 (intent detection)
-    3. NLU Pass 2 (slot extraction)
+    2. Rule-based fast path (optional, skips the LLM when decisive)
+    3. Speculative NLU Pass 2 (optional, concurrent with Pass 1)
+    4. NLU Pass 1 (intent detection)
+    5. NLU Pass 2 (slot extraction)
 
     Returns commands for orchestrator_node to process.
     """
     ctx = runtime.context
-    messages = state.get("messages", [])
     user_message = state.get("user_message", "")
 
     if not user_message:
         return {"commands": []}
 
     # 1. Prepare context and history
-    history = HistoryConverter.to_nlu_format(messages)
+    history_policy = HistoryPolicy(ctx.config.settings.history)
+    history = history_policy.nlu_history(state)
     context_builder = DialogueContextBuilder(ctx)
     dialogue_context = context_builder.build(state)
 
-    # 2. PASS 1: Intent detection
-    try:
-        nlu_result = await ctx.nlu_provider.acall(user_message, dialogue_context, history)
-        commands = list(nlu_result.commands)
-    except Exception as e:
-        logger.error(f"NLU Pass 1 failed: {e}", exc_info=True)
-        # Wrap non-NLU exceptions with proper error type
-        if isinstance(e, NLUError):
-            raise
-        raise NLUProviderError(f"NLU Pass 1 failed: {e}") from e
-
-    # 3. PASS 2: Slot extraction (only when StartFlow detected)
-    # Per design: Pass 2 runs only for StartFlow to extract slots from the initial message.
-    # When a flow is already active, Pass 1 should extract slots using expected_slot context.
-    start_flow_cmd = next(
-        (cmd for cmd in commands if getattr(cmd, "type", None) == "start_flow"), None
+    # 2. Fast path: deterministic rules for unambiguous replies
+    if ctx.rule_nlu:
+        pending_task = cast(dict[str, Any] | None, state.get("_pending_task"))
+        rule_commands = ctx.rule_nlu.match(user_message, dialogue_context, pending_task)
+        if rule_commands is not None:
+            return {
+                "commands": [cmd.model_dump() for cmd in rule_commands],
+                **history_policy.append(state, HumanMessage(content=user_message)),
+            }
+
+    # 3. Speculative PASS 2: extract slots for likely flows while Pass 1 runs
+    speculative = _start_speculative_extraction(
+        ctx, context_builder, user_message, dialogue_context
     )
 
-    if start_flow_cmd:
-        flow_name = cast(str, getattr(start_flow_cmd, "flow_name", None))
-        if flow_name:
-            slot_definitions = context_builder.get_slot_definitions(flow_name)
-            logger.debug(
-                f"SlotExtractor: flow={flow_name}, definitions={len(slot_definitions)}, "
-                f"slots={[s.name for s in slot_definitions]}"
-            )
-            if slot_definitions:
-                try:
-                    slot_commands = await ctx.slot_extractor.acall(user_message, slot_definitions)
-                    logger.debug(f"SlotExtractor extracted: {slot_commands}")
-                    commands.extend(slot_commands)
-                except Exception as e:
-                    logger.error(f"Slot extraction failed: {e}", exc_info=True)
-                    # Wrap non-NLU exceptions with proper error type
-                    if isinstance(e, NLUError):
-                        raise
-                    raise NLUProviderError(f"Slot extraction failed: {e}") from e
-
-    # 4. Convert commands to dicts for orchestrator processing
+    try:
+        # 4. PASS 1: Intent detection
+        try:
+            nlu_result = await ctx.nlu_provider.acall(user_message, dialogue_context, history)
+            commands = list(nlu_result.commands)
+        except Exception as e:
+            logger.error(f"NLU Pass 1 failed: {e}", exc_info=True)
+            # Wrap non-NLU exceptions with proper error type
+            if isinstance(e, NLUError):
+                raise
+            raise NLUProviderError(f"NLU Pass 1 failed: {e}") from e
+
+        # 5. PASS 2: Slot extraction (only when StartFlow detected)
+        # Per design: Pass 2 runs only for StartFlow to extract slots from the initial message.
+        # When a flow is already active, Pass 1 should extract slots using expected_slot context.
+        start_flow_cmd = next(
+            (cmd for cmd in commands if getattr(cmd, "type", None) == "start_flow"), None
+        )
+
+        if start_flow_cmd:
+            flow_name = cast(str, getattr(start_flow_cmd, "flow_name", None))
+            if flow_name:
+                slot_definitions = context_builder.get_slot_definitions(flow_name)
+                logger.debug(
+                    f"SlotExtractor: flow={flow_name}, definitions={len(slot_definitions)}, "
+                    f"slots={[s.name for s in slot_definitions]}"
+                )
+                if slot_definitions:
+                    try:
+                        speculative_task = speculative.pop(flow_name, None)
+                        if speculative_task is not None:
+                            logger.debug(f"Using speculative slot extraction for {flow_name}")
+                            slot_commands = await speculative_task
+                        else:
+                            slot_commands = await ctx.slot_extractor.acall(
+                                user_message, slot_definitions
+                            )
+                        logger.debug(f"SlotExtractor extracted: {slot_commands}")
+                        commands.extend(slot_commands)
+                    except Exception as e:
+                        logger.error(f"Slot extraction failed: {e}", exc_info=True)
+                        # Wrap non-NLU exceptions with proper error type
+                        if isinstance(e, NLUError):
+                            raise
+                        raise NLUProviderError(f"Slot extraction failed: {e}") from e
+    finally:
+        # Discard speculative results for flows Pass 1 didn't start
+        for task in speculative.values():
+            task.cancel()
+
+    # 6. Convert commands to dicts for orchestrator processing
     command_dicts = [
         cmd.model_dump() if hasattr(cmd, "model_dump") else dict(cmd) for cmd in commands
     ]
 
     return {
         "commands": command_dicts,
-        "messages": [HumanMessage(content=user_message)],
+        **history_policy.append(state, HumanMessage(content=user_message)),
     }
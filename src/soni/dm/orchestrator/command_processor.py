@@ -26,10 +26,9 @@ class CommandProcessor:
         # This ensures that e.g. SetSlot sees the stack created by a preceding StartFlow
         working_state = dict(state)
         working_state["flow_stack"] = list(state.get("flow_stack") or [])
-        # Deep copy slots to avoid mutation issues (shallow copy of outer dict might seem enough but better safe)
-        working_state["flow_slots"] = {
-            k: v.copy() for k, v in (state.get("flow_slots") or {}).items()
-        }
+        # flow_slots is copy-on-write (see soni.core.slot_utils): deltas applied
+        # below create new slot dicts, so the incoming ones can be shared
+        working_state["flow_slots"] = dict(state.get("flow_slots") or {})
 
         deltas: list[FlowDelta] = []
 
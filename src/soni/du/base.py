@@ -8,13 +8,15 @@ Provides shared functionality for:
 
 import logging
 from abc import abstractmethod
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
 from pathlib import Path
 from typing import Any, ClassVar, TypeVar
 
 import dspy
 from pydantic import BaseModel, ValidationError
 
+from soni.du.batch import DEFAULT_MAX_CONCURRENCY, BatchResult, run_batch
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -99,6 +101,7 @@ class OptimizableDSPyModule(dspy.Module):
     - Automatic loading of best available optimized model
     - Configurable ChainOfThought vs Predict
     - Standard async (.acall) and sync (__call__) interfaces
+    - Batched async inference (.abatch)
 
     Subclasses should:
     1. Set `optimized_files` class variable with priority-ordered filenames
@@ -136,8 +139,27 @@ class OptimizableDSPyModule(dspy.Module):
         """
         ...
 
+    def abatch(
+        self,
+        inputs: Iterable[tuple[Any, ...]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult[Any]]:
+        """Run ``aforward`` over many inputs, streaming results as they complete.
+
+        Args:
+            inputs: Positional ``aforward`` argument tuples, e.g.
+                ``(user_message, context, history)`` for CommandGenerator.
+            max_concurrency: Maximum LM calls in flight.
+
+        Identical inputs are only run once. Failures are reported per item
+        in ``BatchResult.error`` instead of aborting the batch.
+        """
+        return run_batch(self.acall, inputs, max_concurrency)
+
     @classmethod
-    def create_with_best_model(cls, use_cot: bool | None = None) -> "OptimizableDSPyModule":
+    def create_with_best_model(
+        cls, use_cot: bool | None = None, lm: dspy.LM | None = None
+    ) -> "OptimizableDSPyModule":
         """Create instance with the best available optimized model.
 
         Automatically searches for optimization files in `optimized/` directory
@@ -145,12 +167,16 @@ class OptimizableDSPyModule(dspy.Module):
 
         Args:
             use_cot: Whether to use ChainOfThought reasoning.
+            lm: LM for this module's predictors (None = global dspy LM).
 
         Returns:
             Instance with loaded optimization if available, else zero-shot.
         """
         instance = cls(use_cot=use_cot)
         instance._load_best_optimization()
+        if lm is not None:
+            # After loading: saved programs may carry their own LM state
+            instance.set_lm(lm)
         return instance
 
     def _load_best_optimization(self) -> bool:
@@ -0,0 +1,112 @@
+"""Batched NLU inference with bounded concurrency and deduplication.
+
+Used to replay production logs or evaluate prompts over a dataset:
+
+    async for item in generator.abatch([(msg, context, history), ...]):
+        print(item.index, item.result)
+
+Identical inputs run once and their result is delivered for every index.
+Results stream back as they complete, not in input order.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[T]):
+    """Outcome of one batch input: a result, or the error it raised."""
+
+    index: int
+    result: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def input_key(args: tuple[Any, ...]) -> Hashable:
+    """Hashable key identifying a call's arguments (used for deduplication)."""
+
+    def default(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return value.model_dump(mode="json")
+        return repr(value)
+
+    return json.dumps(args, default=default, sort_keys=True)
+
+
+async def run_batch(
+    call: Callable[..., Awaitable[T]],
+    inputs: Iterable[tuple[Any, ...]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[BatchResult[T]]:
+    """Run ``call(*args)`` for every input and yield results as they complete.
+
+    Args:
+        call: Async callable, e.g. a module's ``acall``.
+        inputs: Positional argument tuples, one per item.
+        max_concurrency: Maximum calls in flight at once.
+
+    Yields:
+        BatchResult for every input index. Duplicated inputs share the same
+        result object, which must be treated as read-only.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    # Deduplicate: unique args -> indices that asked for them
+    unique: dict[Hashable, tuple[tuple[Any, ...], list[int]]] = {}
+    total = 0
+    for index, args in enumerate(inputs):
+        total += 1
+        key = input_key(args)
+        if key in unique:
+            unique[key][1].append(index)
+        else:
+            unique[key] = (args, [index])
+
+    logger.debug(f"Batch: {total} inputs, {len(unique)} unique")
+
+    pending: asyncio.Queue[tuple[tuple[Any, ...], list[int]]] = asyncio.Queue()
+    for entry in unique.values():
+        pending.put_nowait(entry)
+    done: asyncio.Queue[list[BatchResult[T]]] = asyncio.Queue()
+
+    async def worker() -> None:
+        while True:
+            try:
+                args, indices = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                result = await call(*args)
+                outcome = [BatchResult(index=i, result=result) for i in indices]
+            except Exception as e:
+                logger.warning(f"Batch item {indices[0]} failed: {e}")
+                outcome = [BatchResult(index=i, error=e) for i in indices]
+            done.put_nowait(outcome)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(max_concurrency, len(unique)))]
+    try:
+        for _ in range(len(unique)):
+            for item in await done.get():
+                yield item
+    finally:
+        # Consumer stopped early (or finished): don't leave calls running
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
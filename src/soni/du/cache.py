@@ -0,0 +1,139 @@
+"""Result cache for CommandGenerator (Pass 1).
+
+Many conversations open with near-identical messages in an identical idle
+context ("check my balance"). Caching the NLU output keyed by the normalized
+message and the parts of DialogueContext that influence intent detection
+lets repeated intents skip the LLM entirely.
+
+Key components:
+- the user message: with no active flow, case, punctuation and whitespace
+  are folded ("Check my balance!" == "check my balance"). Inside a flow only
+  whitespace is collapsed, because Pass 1 returns slot values taken from the
+  literal text ("-50" vs "50", "12-34" vs "1234", "Bob" vs "bob").
+- active_flow, expected_slot, conversation_state
+- names of slots already filled in the active flow
+- a version hash of the available flows (changes when the catalog changes)
+
+Conversation history is intentionally not part of the key.
+"""
+
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from cachetools import TTLCache
+
+from soni.du.batch import DEFAULT_MAX_CONCURRENCY, BatchResult, run_batch
+from soni.du.models import DialogueContext, FlowInfo, NLUOutput
+from soni.du.rules import normalize_message
+
+logger = logging.getLogger(__name__)
+
+
+def flows_version(flows: list[FlowInfo]) -> str:
+    """Stable short hash identifying a list of available flows."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    for flow in flows:
+        digest.update(flow.name.encode())
+        digest.update(b"\x00")
+        digest.update(flow.description.encode())
+        for intent in flow.trigger_intents:
+            digest.update(b"\x01")
+            digest.update(intent.encode())
+        digest.update(b"\x02")
+    return digest.hexdigest()[:16]
+
+
+def cache_message(user_message: str, context: DialogueContext) -> str:
+    """Message part of the cache key (see module docstring)."""
+    if context.active_flow or context.expected_slot:
+        return " ".join(user_message.split())
+    return normalize_message(user_message)
+
+
+def make_cache_key(user_message: str, context: DialogueContext) -> tuple[Any, ...]:
+    """Build the cache key for a message in a dialogue context."""
+    return (
+        cache_message(user_message, context),
+        context.active_flow,
+        context.expected_slot,
+        context.conversation_state,
+        tuple(sorted(slot.name for slot in context.current_slots if slot.value is not None)),
+        flows_version(context.available_flows),
+    )
+
+
+class NLUResultCache:
+    """LRU + TTL cache of NLUOutput with hit/miss counters."""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 3600) -> None:
+        self._cache: TTLCache[tuple[Any, ...], NLUOutput] = TTLCache(
+            maxsize=max_size, ttl=ttl_seconds
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[Any, ...]) -> NLUOutput | None:
+        """Return a copy of the cached output, or None on a miss."""
+        cached: NLUOutput | None = self._cache.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached.model_copy(deep=True)
+
+    def set(self, key: tuple[Any, ...], output: NLUOutput) -> None:
+        """Store an output. Empty or zero-confidence (fallback) results are not cached."""
+        if not output.commands or output.confidence <= 0:
+            return
+        self._cache[key] = output.model_copy(deep=True)
+
+    def clear(self) -> None:
+        """Drop all entries (e.g. after a config reload)."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+
+class CachedCommandGenerator:
+    """Drop-in wrapper that consults NLUResultCache before CommandGenerator.
+
+    Exposes the same ``acall`` interface used by understand_node.
+    """
+
+    def __init__(self, generator: Any, cache: NLUResultCache) -> None:
+        self.generator = generator
+        self.cache = cache
+
+    async def acall(
+        self,
+        user_message: str,
+        context: DialogueContext,
+        history: list[dict[str, str]] | None = None,
+    ) -> NLUOutput:
+        """Return cached commands or run the wrapped generator and cache the result."""
+        key = make_cache_key(user_message, context)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"NLU cache hit for '{key[0]}'")
+            return cached
+
+        result: NLUOutput = await self.generator.acall(user_message, context, history)
+        if isinstance(result, NLUOutput):
+            self.cache.set(key, result)
+        return result
+
+    def abatch(
+        self,
+        inputs: Iterable[tuple[Any, ...]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult[NLUOutput]]:
+        """Batched ``acall`` that consults the cache for every item."""
+        return run_batch(self.acall, inputs, max_concurrency)
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate everything else (forward, save, load, ...) to the wrapped module
+        return getattr(self.generator, name)
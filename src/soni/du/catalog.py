@@ -0,0 +1,113 @@
+"""Static NLU catalog compiled once per SoniConfig.
+
+The flow list, command list and per-flow slot definitions passed to the NLU
+only depend on the configuration, so they are built once here instead of on
+every turn. DialogueContextBuilder then only assembles the dynamic parts
+(active flow, current slots, expected slot, conversation state).
+
+A catalog is immutable: after a config reload build a new one.
+"""
+
+from soni.config.models import CollectStepConfig, FlowConfig, SoniConfig
+from soni.du.models import CommandInfo, FlowInfo, SlotDefinition
+from soni.du.schemas.extract_slots import SlotExtractionInput
+
+STANDARD_COMMANDS: tuple[CommandInfo, ...] = (
+    CommandInfo(
+        command_type="start_flow",
+        description="Start a new flow. flow_name must match one of available_flows.name",
+        required_fields=["flow_name"],
+        example='{"type": "start_flow", "flow_name": "check_balance"}',
+    ),
+    CommandInfo(
+        command_type="set_slot",
+        description="Set a slot value when user provides information",
+        required_fields=["slot", "value"],
+        example='{"type": "set_slot", "slot": "account_type", "value": "checking"}',
+    ),
+    CommandInfo(command_type="cancel_flow", description="Cancel current flow"),
+    CommandInfo(command_type="chitchat", description="Off-topic message"),
+    CommandInfo(command_type="affirm", description="User confirms/agrees"),
+    CommandInfo(command_type="deny", description="User denies/disagrees"),
+)
+
+
+def _slot_inputs(flow: FlowConfig) -> list[SlotExtractionInput]:
+    """Slot definitions for a flow: explicit slots first, then collect steps."""
+    definitions_map: dict[str, SlotExtractionInput] = {}
+
+    # 1. explicit slots from flow definition
+    for slot in flow.slots:
+        definitions_map[slot.name] = SlotExtractionInput(
+            name=slot.name,
+            slot_type=slot.type or "string",
+            description=slot.description or f"Value for {slot.name}",
+            examples=[],
+        )
+
+    # 2. implicit slots from collect steps (fallback)
+    for step in flow.steps:
+        if isinstance(step, CollectStepConfig) and step.slot not in definitions_map:
+            definitions_map[step.slot] = SlotExtractionInput(
+                name=step.slot,
+                slot_type="string",
+                description=step.message or f"Value for {step.slot}",
+                examples=[],
+            )
+
+    return list(definitions_map.values())
+
+
+class NLUCatalog:
+    """Precomputed FlowInfo/CommandInfo lists and slot definitions for a config.
+
+    Lists returned by the accessors are fresh containers, but the models inside
+    are shared and must be treated as read-only.
+    """
+
+    def __init__(self, config: SoniConfig) -> None:
+        self.config = config
+        self._flows_info: tuple[FlowInfo, ...] = tuple(
+            FlowInfo(
+                name=name,
+                description=flow.description or name,
+                trigger_intents=list(flow.trigger.intents) if flow.trigger else [],
+            )
+            for name, flow in config.flows.items()
+        )
+        self._flow_info_by_name = {info.name: info for info in self._flows_info}
+        self._slot_inputs: dict[str, tuple[SlotExtractionInput, ...]] = {
+            name: tuple(_slot_inputs(flow)) for name, flow in config.flows.items()
+        }
+        self._flow_slots: dict[str, tuple[SlotDefinition, ...]] = {
+            name: tuple(
+                SlotDefinition(
+                    name=s.name,
+                    slot_type=s.slot_type,
+                    description=s.description,
+                    examples=s.examples,
+                )
+                for s in inputs
+            )
+            for name, inputs in self._slot_inputs.items()
+        }
+
+    def flows_info(self) -> list[FlowInfo]:
+        """All flows available to the NLU, in config order."""
+        return list(self._flows_info)
+
+    def flow_info(self, flow_name: str) -> FlowInfo | None:
+        """FlowInfo for a single flow, or None if unknown."""
+        return self._flow_info_by_name.get(flow_name)
+
+    def commands_info(self) -> list[CommandInfo]:
+        """Standard commands the NLU can generate."""
+        return list(STANDARD_COMMANDS)
+
+    def slot_inputs(self, flow_name: str) -> list[SlotExtractionInput]:
+        """Slot definitions for SlotExtractor (empty for unknown flows)."""
+        return list(self._slot_inputs.get(flow_name, ()))
+
+    def flow_slots(self, flow_name: str) -> list[SlotDefinition]:
+        """Slot definitions for DialogueContext.flow_slots (empty for unknown flows)."""
+        return list(self._flow_slots.get(flow_name, ()))
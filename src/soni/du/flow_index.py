@@ -0,0 +1,74 @@
+"""Lexical index over flow descriptions and trigger intents.
+
+Built once per config and used to cheaply rank flows against a user message
+without calling the LLM (e.g. to pick candidates for speculative slot
+extraction).
+"""
+
+import math
+import re
+from collections import Counter
+
+from soni.config.models import FlowConfig
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    (
+        "a an and are can do for from i in is it like me my need of on please some the to "
+        "want would with you your"
+    ).split()
+)
+
+# Bonus added when a full trigger phrase appears verbatim in the message
+TRIGGER_PHRASE_BONUS = 5.0
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class FlowIndex:
+    """IDF-weighted term overlap between messages and flows."""
+
+    def __init__(self, flows: dict[str, FlowConfig]) -> None:
+        self._terms: dict[str, set[str]] = {}
+        self._phrases: dict[str, list[str]] = {}
+
+        for name, flow in flows.items():
+            intents = flow.trigger.intents if flow.trigger else []
+            text = " ".join([name.replace("_", " "), flow.description, *intents])
+            self._terms[name] = set(tokenize(text))
+            self._phrases[name] = [
+                " ".join(_TOKEN_RE.findall(i.lower())) for i in intents if i.strip()
+            ]
+
+        doc_freq: Counter[str] = Counter()
+        for terms in self._terms.values():
+            doc_freq.update(terms)
+        total = max(len(self._terms), 1)
+        self._idf = {term: math.log(1 + total / df) for term, df in doc_freq.items()}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def score(self, message: str, flow_name: str) -> float:
+        """Relevance of a flow for a message (0 when nothing overlaps)."""
+        terms = self._terms.get(flow_name)
+        if not terms:
+            return 0.0
+
+        query = set(tokenize(message))
+        score = sum(self._idf[t] for t in query if t in terms)
+
+        normalized = " ".join(_TOKEN_RE.findall(message.lower()))
+        if any(phrase and phrase in normalized for phrase in self._phrases[flow_name]):
+            score += TRIGGER_PHRASE_BONUS
+        return score
+
+    def rank(self, message: str, top_k: int | None = None) -> list[tuple[str, float]]:
+        """Return (flow_name, score) pairs with a positive score, best first."""
+        scored = [(name, self.score(message, name)) for name in self._terms]
+        ranked = sorted((s for s in scored if s[1] > 0), key=lambda s: s[1], reverse=True)
+        return ranked[:top_k] if top_k is not None else ranked
@@ -1,5 +1,6 @@
 """ResponseRephraser - DSPy module for polishing responses."""
 
+from collections.abc import Awaitable, Callable
 from typing import Literal
 
 import dspy
@@ -24,6 +25,9 @@ class ResponseRephraser(OptimizableDSPyModule):
         # Runtime (async)
         polished = await rephraser.acall(template, context)
 
+        # Runtime, forwarding tokens as they are generated
+        polished = await rephraser.astream(template, context, on_chunk=sink.send_chunk)
+
         # Optimization (sync)
         polished = rephraser(template, context)
     """
@@ -72,6 +76,44 @@ class ResponseRephraser(OptimizableDSPyModule):
         )
         return str(result.polished_response)
 
+    async def astream(
+        self,
+        template: str,
+        context: str,
+        on_chunk: Callable[[str], Awaitable[None]],
+    ) -> str:
+        """Polish a template response, passing tokens to ``on_chunk`` as they arrive.
+
+        Args:
+            template: Original template response to polish
+            context: Recent conversation history for context
+            on_chunk: Called with each generated piece of the polished response
+
+        Returns:
+            The complete polished response (no chunks are produced on LM cache hits)
+        """
+        listener = dspy.streaming.StreamListener(signature_field_name="polished_response")
+        stream_program = dspy.streamify(
+            self.extractor, stream_listeners=[listener], is_async_program=True
+        )
+
+        chunks: list[str] = []
+        final: dspy.Prediction | None = None
+        async for item in stream_program(
+            template_response=template,
+            conversation_context=context,
+            tone=self.tone,
+        ):
+            if isinstance(item, dspy.streaming.StreamResponse):
+                chunks.append(item.chunk)
+                await on_chunk(item.chunk)
+            elif isinstance(item, dspy.Prediction):
+                final = item
+
+        if final is not None:
+            return str(final.polished_response)
+        return "".join(chunks)
+
     def forward(self, template: str, context: str) -> str:
         """Sync version for DSPy optimization.
 
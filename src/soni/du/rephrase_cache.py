@@ -0,0 +1,135 @@
+"""Result cache for ResponseRephraser.
+
+Say templates are fixed and many rendered prompts repeat verbatim across
+users ("What is the amount?"), so rephrasing results are cached keyed by:
+
+- the rendered message
+- the rephrasing tone
+- optionally a coarse conversation bucket: "opening" on the user's first
+  turn, "ongoing" afterwards
+
+Entries computed offline by ``soni rephrase-precompute`` are loaded as
+pinned entries: they never expire and are served for every bucket.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from cachetools import TTLCache
+
+from soni.config.models import SayStepConfig, SoniConfig, WhileStepConfig
+from soni.core.template import compile_template
+from soni.core.types import DialogueState
+
+logger = logging.getLogger(__name__)
+
+RephraseKey = tuple[str, str, str]
+
+
+def context_bucket(state: DialogueState) -> str:
+    """Coarse conversation position: 'opening' during the user's first turn.
+
+    Turns are counted from the user messages in the history; a conversation
+    summary means earlier turns were trimmed away.
+    """
+    if state.get("conversation_summary"):
+        return "ongoing"
+    messages = state.get("messages") or []
+    user_turns = sum(1 for msg in messages if getattr(msg, "type", None) == "human")
+    return "opening" if user_turns <= 1 else "ongoing"
+
+
+class RephraseCache:
+    """LRU + TTL cache of rephrased messages with pinned precomputed entries."""
+
+    def __init__(
+        self, max_size: int = 1024, ttl_seconds: float = 3600, context_aware: bool = False
+    ) -> None:
+        self._cache: TTLCache[RephraseKey, str] = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+        self._precomputed: dict[tuple[str, str], str] = {}
+        self.context_aware = context_aware
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, message: str, tone: str, state: DialogueState) -> RephraseKey:
+        """Build the cache key for a rendered message in a conversation."""
+        bucket = context_bucket(state) if self.context_aware else ""
+        return (message, tone, bucket)
+
+    def get(self, key: RephraseKey) -> str | None:
+        """Return the cached rephrasing, or None on a miss."""
+        message, tone, _ = key
+        cached = self._precomputed.get((message, tone))
+        if cached is None:
+            cached = self._cache.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached
+
+    def set(self, key: RephraseKey, rephrased: str) -> None:
+        """Store a rephrasing. Empty results are not cached."""
+        if rephrased:
+            self._cache[key] = rephrased
+
+    def clear(self) -> None:
+        """Drop runtime entries (precomputed entries are kept)."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current sizes."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "precomputed": len(self._precomputed),
+        }
+
+    def load_precomputed(self, path: Path | str) -> int:
+        """Load entries written by ``save_precomputed``; returns how many were loaded."""
+        entries = read_precomputed(path)
+        for message, tone, response in entries:
+            self._precomputed[(message, tone)] = response
+        logger.info(f"Loaded {len(entries)} precomputed rephrasings from {path}")
+        return len(entries)
+
+
+def read_precomputed(path: Path | str) -> list[tuple[str, str, str]]:
+    """Read (message, tone, response) entries written by ``save_precomputed``."""
+    with open(path, encoding="utf-8") as f:
+        data: dict[str, Any] = json.load(f)
+    return [(e["message"], e["tone"], e["response"]) for e in data.get("entries", [])]
+
+
+def save_precomputed(path: Path | str, entries: list[tuple[str, str, str]]) -> None:
+    """Write (message, tone, response) entries for ``RephraseCache.load_precomputed``."""
+    data = {
+        "entries": [
+            {"message": message, "tone": tone, "response": response}
+            for message, tone, response in entries
+        ]
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def static_templates(config: SoniConfig) -> list[str]:
+    """Rendered say messages that reference no slots and allow rephrasing.
+
+    Their text never changes, so they can be rephrased offline.
+    """
+    templates: dict[str, None] = {}
+    for flow in config.flows.values():
+        steps: list[Any] = list(flow.steps)
+        for step in flow.steps:
+            if isinstance(step, WhileStepConfig):
+                steps.extend(step.get_inline_steps())
+        for step in steps:
+            if isinstance(step, SayStepConfig) and step.rephrase:
+                template = compile_template(step.message)
+                if not template.slots:
+                    templates[template.render({})] = None
+    return list(templates)
@@ -0,0 +1,216 @@
+"""Deterministic rule-based NLU fast path.
+
+Runs before the LLM in understand_node and resolves the unambiguous bulk of
+mid-flow turns locally:
+- yes/no answers to a confirmation
+- exact matches against the options of a pending task
+- cancel keywords
+- typed slot values (numbers, dates, emails) for the expected slot
+
+Matchers return None when they can't decide, in which case the turn falls
+through to CommandGenerator (Pass 1).
+"""
+
+import logging
+import re
+import string
+from abc import ABC, abstractmethod
+from datetime import date, timedelta
+from typing import Any
+
+from soni.core.commands import (
+    AffirmConfirmation,
+    CancelFlow,
+    Command,
+    DenyConfirmation,
+    SetSlot,
+)
+from soni.du.models import DialogueContext
+
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION = str.maketrans("", "", string.punctuation.replace("@", "").replace(".", ""))
+
+AFFIRM_WORDS = frozenset(
+    {"yes", "y", "yeah", "yep", "yup", "sure", "ok", "okay", "correct", "confirm", "right"}
+)
+DENY_WORDS = frozenset({"no", "n", "nope", "nah", "incorrect", "wrong"})
+CANCEL_PHRASES = frozenset(
+    {"cancel", "stop", "abort", "nevermind", "never mind", "forget it", "cancel that"}
+)
+
+NUMBER_TYPES = frozenset({"number", "integer", "int", "float", "amount", "currency"})
+DATE_TYPES = frozenset({"date"})
+EMAIL_TYPES = frozenset({"email"})
+
+_NUMBER_RE = re.compile(r"^[-+]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?$")
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_EMAIL_RE = re.compile(r"^[\w.+-]+@[\w-]+(?:\.[\w-]+)+$")
+
+
+def normalize_message(message: str) -> str:
+    """Lowercase, strip punctuation (except '@' and '.') and collapse whitespace."""
+    text = message.strip().lower().translate(_PUNCTUATION)
+    return " ".join(text.split()).rstrip(".")
+
+
+class RuleMatcher(ABC):
+    """Matcher that resolves a user message to commands without the LLM."""
+
+    @abstractmethod
+    def match(
+        self,
+        message: str,
+        context: DialogueContext,
+        pending_task: dict[str, Any] | None,
+    ) -> list[Command] | None:
+        """Return commands if the message is unambiguous, None otherwise."""
+        ...
+
+
+class AffirmDenyMatcher(RuleMatcher):
+    """Resolves yes/no replies while a confirmation is pending."""
+
+    def match(
+        self,
+        message: str,
+        context: DialogueContext,
+        pending_task: dict[str, Any] | None,
+    ) -> list[Command] | None:
+        if context.conversation_state != "confirming":
+            return None
+
+        text = normalize_message(message)
+        if text in AFFIRM_WORDS:
+            return [AffirmConfirmation()]
+        if text in DENY_WORDS:
+            return [DenyConfirmation()]
+        return None
+
+
+class OptionMatcher(RuleMatcher):
+    """Resolves exact matches against the options of a pending collect task."""
+
+    def match(
+        self,
+        message: str,
+        context: DialogueContext,
+        pending_task: dict[str, Any] | None,
+    ) -> list[Command] | None:
+        if not pending_task or pending_task.get("type") != "collect":
+            return None
+
+        slot = pending_task.get("slot")
+        options = pending_task.get("options") or []
+        if not slot or not options:
+            return None
+
+        text = normalize_message(message)
+        for option in options:
+            if normalize_message(str(option)) == text:
+                return [SetSlot(slot=slot, value=option)]
+        return None
+
+
+class CancelMatcher(RuleMatcher):
+    """Resolves cancel keywords while a flow is active."""
+
+    def match(
+        self,
+        message: str,
+        context: DialogueContext,
+        pending_task: dict[str, Any] | None,
+    ) -> list[Command] | None:
+        if not context.active_flow:
+            return None
+        if normalize_message(message) in CANCEL_PHRASES:
+            return [CancelFlow()]
+        return None
+
+
+class TypedSlotMatcher(RuleMatcher):
+    """Resolves number, date and email values for the expected slot.
+
+    Only applies when the whole message is a value of the expected slot's
+    declared type; free-text slots always go to the LLM.
+    """
+
+    def match(
+        self,
+        message: str,
+        context: DialogueContext,
+        pending_task: dict[str, Any] | None,
+    ) -> list[Command] | None:
+        expected = context.expected_slot
+        if not expected or context.conversation_state != "collecting":
+            return None
+
+        slot_def = next((s for s in context.flow_slots if s.name == expected), None)
+        if slot_def is None:
+            return None
+
+        value = self._parse(message.strip(), slot_def.slot_type.lower())
+        if value is None:
+            return None
+        return [SetSlot(slot=expected, value=value)]
+
+    def _parse(self, text: str, slot_type: str) -> Any:
+        if slot_type in NUMBER_TYPES:
+            return _parse_number(text)
+        if slot_type in DATE_TYPES:
+            return _parse_date(text)
+        if slot_type in EMAIL_TYPES and _EMAIL_RE.match(text):
+            return text
+        return None
+
+
+def _parse_number(text: str) -> int | float | None:
+    """Parse a bare number such as '250', '1,500' or '99.90'."""
+    if not _NUMBER_RE.match(text):
+        return None
+    cleaned = text.replace(",", "")
+    return float(cleaned) if "." in cleaned else int(cleaned)
+
+
+def _parse_date(text: str) -> str | None:
+    """Parse ISO dates and 'today'/'tomorrow' into an ISO date string."""
+    lowered = normalize_message(text)
+    if lowered == "today":
+        return date.today().isoformat()
+    if lowered == "tomorrow":
+        return (date.today() + timedelta(days=1)).isoformat()
+    if _ISO_DATE_RE.match(text):
+        try:
+            return date.fromisoformat(text).isoformat()
+        except ValueError:
+            return None
+    return None
+
+
+DEFAULT_MATCHERS: tuple[RuleMatcher, ...] = (
+    AffirmDenyMatcher(),
+    OptionMatcher(),
+    CancelMatcher(),
+    TypedSlotMatcher(),
+)
+
+
+class RuleBasedNLU:
+    """Runs rule matchers in order; the first decisive matcher wins."""
+
+    def __init__(self, matchers: list[RuleMatcher] | tuple[RuleMatcher, ...] | None = None) -> None:
+        self._matchers = tuple(matchers) if matchers is not None else DEFAULT_MATCHERS
+
+    def match(
+        self,
+        message: str,
+        context: DialogueContext,
+        pending_task: dict[str, Any] | None = None,
+    ) -> list[Command] | None:
+        """Return commands from the first matching rule, or None to defer to the LLM."""
+        for matcher in self._matchers:
+            commands = matcher.match(message, context, pending_task)
+            if commands is not None:
+                logger.debug(f"Rule fast path: {type(matcher).__name__} -> {commands}")
+                return commands
+        return None
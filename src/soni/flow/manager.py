@@ -204,7 +204,11 @@ class FlowManager:
         return FlowDelta(flow_stack=new_stack)
 
     def get_all_slots(self, state: DialogueState) -> dict[str, Any]:
-        """Get all slots for the active flow."""
+        """Get all slots for the active flow.
+
+        The returned dict is shared with the state (copy-on-write) and must
+        not be mutated.
+        """
         context = self.get_active_context(state)
         if context:
             # Safe access
@@ -0,0 +1,331 @@
+"""Compact checkpoint representation.
+
+LangGraph writes the full DialogueState on every super-step. CompactCheckpointSaver
+wraps any checkpointer and rewrites channel values on the way in and out:
+
+- transient fields (commands, branch targets, pending responses and the
+  loop/flow-changed flags) are not persisted, neither in checkpoints nor in
+  pending task writes. They are only read within the run that wrote them;
+  after an interrupt the next turn sets them again.
+- ``_executed_steps`` (flow_id -> set of step names) is stored as one integer
+  bitset per flow, indexed by step position in the compiled flow.
+
+Each bitset carries a short fingerprint of the step order it was encoded
+against instead of the order itself. Orders are kept in a process-wide
+registry and persisted once per fingerprint as a side record (thread
+``STEP_ORDERS_THREAD``, one checkpoint namespace per fingerprint), so a
+checkpoint decodes the same after a restart or after its flow's steps were
+edited.
+"""
+
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    empty_checkpoint,
+)
+
+from soni.compiler.plan import _flatten_inline_steps
+from soni.config.models import SoniConfig
+from soni.core.errors import StateError
+
+logger = logging.getLogger(__name__)
+
+# Fields only meaningful within the run that writes them
+TRANSIENT_FIELDS = frozenset(
+    {"commands", "_branch_target", "_pending_responses", "_loop_flag", "_flow_changed"}
+)
+
+EXECUTED_STEPS = "_executed_steps"
+_BITSETS = "__bitsets__"
+
+# Side record holding the step orders bitsets refer to
+STEP_ORDERS_THREAD = "__soni_step_orders__"
+
+# Process-wide registry: order fingerprint -> step order
+_STEP_ORDERS: dict[str, tuple[str, ...]] = {}
+
+
+def order_key(order: Sequence[str]) -> str:
+    """Short fingerprint of a step order."""
+    return hashlib.blake2b("\x00".join(order).encode(), digest_size=6).hexdigest()
+
+
+def register_order(order: Sequence[str]) -> str:
+    """Add a step order to the process-wide registry; returns its fingerprint."""
+    key = order_key(order)
+    _STEP_ORDERS.setdefault(key, tuple(order))
+    return key
+
+
+class StepIndex:
+    """Step positions per flow, used to store executed steps as bitsets."""
+
+    def __init__(self, config: SoniConfig) -> None:
+        self._orders: dict[str, tuple[str, ...]] = {}
+        self._keys: dict[str, str] = {}
+        self.update(config)
+
+    def update(self, config: SoniConfig) -> None:
+        """Use a (reloaded) config's step orders for new checkpoints."""
+        self._orders = {
+            name: tuple(step.step for step in _flatten_inline_steps(list(flow.steps)))
+            for name, flow in config.flows.items()
+        }
+        self._keys = {name: register_order(order) for name, order in self._orders.items()}
+
+    def order(self, flow_name: str | None) -> tuple[str, ...] | None:
+        """Compiled step order of a flow, or None for an unknown flow."""
+        return self._orders.get(flow_name) if flow_name else None
+
+    def key(self, flow_name: str) -> str:
+        """Fingerprint of a known flow's step order."""
+        return self._keys[flow_name]
+
+
+def _encode_bits(order: Sequence[str], steps: set[str]) -> int | None:
+    """Bitset of ``steps`` by position in ``order``, or None if a step isn't in it."""
+    positions = {step: i for i, step in enumerate(order)}
+    bits = 0
+    for step in steps:
+        if step not in positions:
+            return None
+        bits |= 1 << positions[step]
+    return bits
+
+
+def _decode_bits(order: Sequence[str], bits: int) -> set[str]:
+    return {step for i, step in enumerate(order) if bits >> i & 1}
+
+
+def compact_values(values: dict[str, Any], step_index: StepIndex) -> dict[str, Any]:
+    """Channel values as persisted: transient fields dropped, executed steps as bitsets."""
+    compact = {k: v for k, v in values.items() if k not in TRANSIENT_FIELDS}
+    executed = compact.get(EXECUTED_STEPS)
+    if not executed:
+        return compact
+
+    flow_names = {ctx["flow_id"]: ctx["flow_name"] for ctx in compact.get("flow_stack") or []}
+    entries: dict[str, Any] = {}
+    for flow_id, steps in executed.items():
+        flow_name = flow_names.get(flow_id)
+        order = step_index.order(flow_name)
+        bits = _encode_bits(order, steps) if order is not None else None
+        if flow_name is None or bits is None:
+            # Flows that can't be mapped to a step order keep a plain list
+            entries[flow_id] = sorted(steps)
+            continue
+        entries[flow_id] = {"o": step_index.key(flow_name), "b": bits}
+    compact[EXECUTED_STEPS] = {_BITSETS: entries}
+    return compact
+
+
+def order_keys(values: dict[str, Any]) -> set[str]:
+    """Fingerprints of the step orders compacted ``values`` refer to."""
+    executed = values.get(EXECUTED_STEPS)
+    if not isinstance(executed, dict) or _BITSETS not in executed:
+        return set()
+    return {entry["o"] for entry in executed[_BITSETS].values() if isinstance(entry, dict)}
+
+
+def expand_values(
+    values: dict[str, Any], orders: Mapping[str, Sequence[str]] | None = None
+) -> dict[str, Any]:
+    """Inverse of :func:`compact_values` (transient fields stay absent).
+
+    Orders are looked up in ``orders``, by default the process-wide registry.
+
+    Raises:
+        StateError: If a bitset refers to a step order that isn't known.
+    """
+    executed = values.get(EXECUTED_STEPS)
+    if not isinstance(executed, dict) or _BITSETS not in executed:
+        return values
+
+    known = _STEP_ORDERS if orders is None else orders
+    expanded: dict[str, set[str]] = {}
+    for flow_id, entry in executed[_BITSETS].items():
+        if not isinstance(entry, dict):
+            expanded[flow_id] = set(entry)
+            continue
+        order = known.get(entry["o"])
+        if order is None:
+            raise StateError(f"Unknown step order {entry['o']!r} for flow '{flow_id}'")
+        expanded[flow_id] = _decode_bits(order, entry["b"])
+    return {**values, EXECUTED_STEPS: expanded}
+
+
+def compact_writes(writes: Sequence[tuple[str, Any]]) -> list[tuple[str, Any]]:
+    """Pending task writes as persisted: writes to transient fields dropped.
+
+    ``_executed_steps`` writes are per-node deltas of one step, without the
+    flow_stack needed to find their step order, so they are kept as-is.
+    """
+    return [(channel, value) for channel, value in writes if channel not in TRANSIENT_FIELDS]
+
+
+def _order_config(key: str) -> RunnableConfig:
+    return {"configurable": {"thread_id": STEP_ORDERS_THREAD, "checkpoint_ns": key}}
+
+
+def _record_order(record: CheckpointTuple | None) -> tuple[str, ...] | None:
+    if record is None:
+        return None
+    return tuple(record.checkpoint["channel_values"]["order"])
+
+
+class CompactCheckpointSaver(BaseCheckpointSaver[Any]):
+    """Checkpointer wrapper that persists the compact state representation."""
+
+    def __init__(self, inner: BaseCheckpointSaver[Any], config: SoniConfig) -> None:
+        super().__init__(serde=inner.serde)
+        self.inner = inner
+        self.step_index = StepIndex(config)
+        # Fingerprints known to have a side record in ``inner``
+        self._stored_orders: set[str] = set()
+
+    @property
+    def config_specs(self) -> list[Any]:
+        return self.inner.config_specs
+
+    def _compact(self, checkpoint: Checkpoint) -> Checkpoint:
+        values = compact_values(checkpoint["channel_values"], self.step_index)
+        return {**checkpoint, "channel_values": values}
+
+    def _expand(self, item: CheckpointTuple | None) -> CheckpointTuple | None:
+        if item is None:
+            return None
+        checkpoint = item.checkpoint
+        values = expand_values(checkpoint["channel_values"])
+        return item._replace(checkpoint={**checkpoint, "channel_values": values})
+
+    def _unstored_orders(self, checkpoint: Checkpoint) -> list[str]:
+        return sorted(order_keys(checkpoint["channel_values"]) - self._stored_orders)
+
+    def _missing_orders(self, item: CheckpointTuple | None) -> list[str]:
+        if item is None:
+            return []
+        return sorted(order_keys(item.checkpoint["channel_values"]) - _STEP_ORDERS.keys())
+
+    def _order_record(self, key: str) -> tuple[Checkpoint, ChannelVersions]:
+        version = self.inner.get_next_version(None, None)
+        record = empty_checkpoint()
+        record["channel_values"] = {"order": list(_STEP_ORDERS[key])}
+        record["channel_versions"] = {"order": version}
+        return record, {"order": version}
+
+    def _loaded_order(self, key: str, record: CheckpointTuple | None) -> None:
+        order = _record_order(record)
+        if order is not None:
+            _STEP_ORDERS[key] = order
+            self._stored_orders.add(key)
+
+    def _store_orders(self, checkpoint: Checkpoint) -> None:
+        for key in self._unstored_orders(checkpoint):
+            if self.inner.get_tuple(_order_config(key)) is None:
+                record, versions = self._order_record(key)
+                self.inner.put(_order_config(key), record, {}, versions)
+            self._stored_orders.add(key)
+
+    def _load_orders(self, item: CheckpointTuple | None) -> CheckpointTuple | None:
+        for key in self._missing_orders(item):
+            self._loaded_order(key, self.inner.get_tuple(_order_config(key)))
+        return self._expand(item)
+
+    async def _astore_orders(self, checkpoint: Checkpoint) -> None:
+        for key in self._unstored_orders(checkpoint):
+            if await self.inner.aget_tuple(_order_config(key)) is None:
+                record, versions = self._order_record(key)
+                await self.inner.aput(_order_config(key), record, {}, versions)
+            self._stored_orders.add(key)
+
+    async def _aload_orders(self, item: CheckpointTuple | None) -> CheckpointTuple | None:
+        for key in self._missing_orders(item):
+            self._loaded_order(key, await self.inner.aget_tuple(_order_config(key)))
+        return self._expand(item)
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self._load_orders(self.inner.get_tuple(config))
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        for item in self.inner.list(config, filter=filter, before=before, limit=limit):
+            yield self._load_orders(item)  # type: ignore[misc]
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        compact = self._compact(checkpoint)
+        # Step orders are stored before the checkpoint that refers to them
+        self._store_orders(compact)
+        return self.inner.put(config, compact, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.inner.put_writes(config, compact_writes(writes), task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.inner.delete_thread(thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await self._aload_orders(await self.inner.aget_tuple(config))
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        async for item in self.inner.alist(config, filter=filter, before=before, limit=limit):
+            yield await self._aload_orders(item)  # type: ignore[misc]
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        compact = self._compact(checkpoint)
+        await self._astore_orders(compact)
+        return await self.inner.aput(config, compact, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await self.inner.aput_writes(config, compact_writes(writes), task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self.inner.adelete_thread(thread_id)
+
+    def get_next_version(self, current: Any, channel: None) -> Any:
+        return self.inner.get_next_version(current, channel)
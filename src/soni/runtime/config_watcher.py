@@ -0,0 +1,83 @@
+"""Polling watcher for config files (hot reload).
+
+Polls the modification times of the files ConfigLoader reads for the config
+path (see ``ConfigLoader.config_files``) and calls ``on_change`` when they
+differ from the last snapshot. Polling keeps the watcher dependency-free and works on network and
+container filesystems where inotify events are unreliable.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from soni.config.loader import ConfigLoader
+
+logger = logging.getLogger(__name__)
+
+ChangeHandler = Callable[[], Awaitable[Any]]
+
+
+class ConfigWatcher:
+    """Calls ``on_change`` whenever the watched config files change."""
+
+    def __init__(self, path: Path | str, on_change: ChangeHandler, interval: float = 1.0) -> None:
+        self.path = Path(path)
+        self._on_change = on_change
+        self._interval = interval
+        self._snapshot = self._take_snapshot()
+        self._task: asyncio.Task[None] | None = None
+
+    def _take_snapshot(self) -> dict[Path, int]:
+        snapshot = {}
+        try:
+            files = ConfigLoader.config_files(self.path)
+        except FileNotFoundError:
+            # Mid-edit (file replaced) or removed: the next poll sees it again
+            return snapshot
+        for file in files:
+            try:
+                snapshot[file] = file.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return snapshot
+
+    async def check(self) -> bool:
+        """Compare against the last snapshot and call ``on_change`` if different.
+
+        Errors raised by ``on_change`` (e.g. an invalid YAML edit) are logged
+        and the watcher keeps running; the next edit triggers another attempt.
+        """
+        snapshot = self._take_snapshot()
+        if snapshot == self._snapshot:
+            return False
+
+        self._snapshot = snapshot
+        logger.info(f"Config change detected in {self.path}")
+        try:
+            await self._on_change()
+        except Exception as e:
+            logger.error(f"Config reload failed, keeping current config: {e}")
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.check()
+
+    def start(self) -> None:
+        """Start polling in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
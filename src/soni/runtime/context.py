@@ -9,6 +9,10 @@ if TYPE_CHECKING:
     from soni.core.message_sink import MessageSink
     from soni.dm.orchestrator.commands import CommandHandler
     from soni.du import CommandGenerator, ResponseRephraser, SlotExtractor
+    from soni.du.catalog import NLUCatalog
+    from soni.du.flow_index import FlowIndex
+    from soni.du.rephrase_cache import RephraseCache
+    from soni.du.rules import RuleBasedNLU
 
 
 class SubgraphRegistry(Protocol):
@@ -36,3 +40,7 @@ class RuntimeContext:
     action_registry: "ActionRegistry"
     command_handlers: tuple["CommandHandler", ...] | None = None
     rephraser: "ResponseRephraser | None" = None
+    rule_nlu: "RuleBasedNLU | None" = None  # Deterministic fast path before Pass 1
+    flow_index: "FlowIndex | None" = None  # Lexical flow ranking (speculative Pass 2)
+    nlu_catalog: "NLUCatalog | None" = None  # Static NLU context, compiled per config
+    rephrase_cache: "RephraseCache | None" = None  # Rephrased message cache
@@ -0,0 +1,51 @@
+"""In-memory index of which threads are paused at an interrupt.
+
+RuntimeLoop needs to know, before each turn, whether a thread is waiting
+for user input (resume with ``Command(resume=...)``) or idle (fresh invoke).
+Reading the full checkpoint just for that doubles checkpoint loads per turn,
+so the loop records the outcome of every turn here and only falls back to
+``aget_state`` on a cache miss.
+
+The index is coherent as long as this process is the only writer for a
+thread (guaranteed within one RuntimeLoop by TurnQueue). Disable it
+(size 0) when several processes serve the same threads.
+"""
+
+from typing import Any
+
+from cachetools import LRUCache
+
+
+class InterruptIndex:
+    """Bounded LRU map of thread_id -> "has pending interrupt"."""
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._enabled = maxsize > 0
+        self._cache: LRUCache[str, bool] = LRUCache(maxsize=max(maxsize, 1))
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, thread_id: str) -> bool | None:
+        """Return cached interrupt status, or None if unknown."""
+        if not self._enabled:
+            return None
+        value: bool | None = self._cache.get(thread_id)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def record(self, thread_id: str, interrupted: bool) -> None:
+        """Record the interrupt status after a completed turn."""
+        if self._enabled:
+            self._cache[thread_id] = interrupted
+
+    def invalidate(self, thread_id: str) -> None:
+        """Forget a thread (e.g. after a failed turn or external state change)."""
+        self._cache.pop(thread_id, None)
+
+    @staticmethod
+    def is_interrupted(result: dict[str, Any]) -> bool:
+        """Check whether a graph invocation result ended at an interrupt."""
+        return bool(result.get("__interrupt__") or result.get("_pending_task"))
@@ -1,7 +1,10 @@
 """RuntimeLoop for M7 (ADR-002 compliant interrupt architecture)."""
 
+import asyncio
 import sys
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, cast
 
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import BaseCheckpointSaver
@@ -11,20 +14,36 @@ from langgraph.types import Command
 from soni.config.models import SoniConfig
 from soni.core.state import create_empty_state
 from soni.core.types import DialogueState
-from soni.dm.builder import build_orchestrator, compile_all_subgraphs
+from soni.dm.builder import build_orchestrator, compile_flows
 from soni.du import CommandGenerator
 from soni.flow.manager import FlowManager
-from soni.runtime.context import RuntimeContext
+from soni.runtime.checkpoint import CompactCheckpointSaver
+from soni.runtime.context import RuntimeContext, SubgraphRegistry
+from soni.runtime.interrupt_index import InterruptIndex
+from soni.runtime.turn_queue import TurnQueue
 
 if TYPE_CHECKING:
     from soni.actions.registry import ActionRegistry
+    from soni.compiler.incremental import FlowDiff
     from soni.core.message_sink import MessageSink
+    from soni.du.catalog import NLUCatalog
+    from soni.du.flow_index import FlowIndex
+    from soni.du.rules import RuleMatcher
 
 
 class RuntimeLoop:
     """Runtime loop for M7 with ADR-002 interrupt architecture.
 
     Uses LangGraph's native interrupt/resume mechanism for multi-turn flows.
+
+    Turns for the same user are serialized (see TurnQueue) while turns for
+    different users run concurrently.
+
+    Message delivery:
+    - ``message_sink``: a single sink shared by every turn (e.g. a console).
+    - ``message_sink_factory``: called once per turn to create an isolated sink.
+      This is the default (``BufferedMessageSink``) so concurrent turns for
+      different users never share a buffer.
     """
 
     def __init__(
@@ -33,26 +52,74 @@ class RuntimeLoop:
         checkpointer: BaseCheckpointSaver | None = None,
         action_registry: "ActionRegistry | None" = None,
         message_sink: "MessageSink | None" = None,
+        message_sink_factory: "Callable[[], MessageSink] | None" = None,
+        rule_matchers: "list[RuleMatcher] | None" = None,
     ) -> None:
         self.config = config
+        if checkpointer is not None and config.settings.persistence.compact_checkpoints:
+            checkpointer = CompactCheckpointSaver(checkpointer, config)
         self.checkpointer = checkpointer
         self._action_registry = action_registry
         self._message_sink = message_sink
+        self._message_sink_factory = message_sink_factory
+        self._rule_matchers = rule_matchers
+        concurrency_cfg = config.settings.concurrency
+        self._turn_queue = TurnQueue(
+            max_queued_turns=concurrency_cfg.max_queued_turns,
+            overflow_policy=concurrency_cfg.overflow_policy,
+        )
+        persistence_cfg = config.settings.persistence
+        # Postgres is shared by several workers: another worker may move a
+        # thread on, so a per-process interrupt cache could go stale
+        index_size = (
+            0 if persistence_cfg.backend == "postgres" else persistence_cfg.interrupt_index_size
+        )
+        self._interrupt_index = InterruptIndex(index_size)
         self._graph: CompiledStateGraph[DialogueState, RuntimeContext, Any, Any] | None = None
         self._context: RuntimeContext | None = None
+        self._reload_lock = asyncio.Lock()
 
     async def __aenter__(self) -> "RuntimeLoop":
         """Initialize graphs, NLU modules, and action registry."""
-        # Compile ALL subgraphs upfront (ADR-002)
-        subgraphs = compile_all_subgraphs(self.config)
-
-        # Create flow manager and NLU modules (two-pass)
+        # Compile flows (ADR-002): subgraphs or direct step plans, eagerly by default
+        compilation_cfg = self.config.settings.compilation
+        subgraphs: SubgraphRegistry
+        if compilation_cfg.lazy:
+            from soni.compiler.registry import LazySubgraphRegistry
+
+            subgraphs = LazySubgraphRegistry(
+                self.config,
+                prewarm=compilation_cfg.prewarm_flows,
+                max_compiled=compilation_cfg.max_compiled_flows,
+            )
+        else:
+            subgraphs = compile_flows(self.config)
+
+        # Create flow manager and NLU modules (two-pass). Modules without an
+        # LM override in settings.module_llms use the global DSPy LM.
+        from soni.core.dspy_service import DSPyBootstrapper
+
+        lms = DSPyBootstrapper(self.config)
         flow_manager = FlowManager()
-        du = CommandGenerator.create_with_best_model()  # Pass 1: Intent detection
+        # Pass 1: Intent detection
+        du = CommandGenerator.create_with_best_model(lm=lms.module_lm("command_generator"))
+
+        # Optional result cache in front of Pass 1
+        cache_cfg = self.config.settings.nlu_cache
+        if cache_cfg.enabled:
+            from soni.du.cache import CachedCommandGenerator, NLUResultCache
+
+            du = cast(
+                CommandGenerator,
+                CachedCommandGenerator(
+                    du, NLUResultCache(cache_cfg.max_size, cache_cfg.ttl_seconds)
+                ),
+            )
 
         from soni.du import SlotExtractor
 
-        slot_extractor = SlotExtractor.create_with_best_model()  # Pass 2: Slot extraction
+        # Pass 2: Slot extraction
+        slot_extractor = SlotExtractor.create_with_best_model(lm=lms.module_lm("slot_extractor"))
 
         # Use provided registry or create empty one
         from soni.actions.registry import ActionRegistry
@@ -64,9 +131,32 @@ class RuntimeLoop:
         if self.config.settings.rephrase_responses:
             from soni.du import ResponseRephraser
 
-            rephraser = ResponseRephraser.create_with_best_model()
+            rephraser = ResponseRephraser.create_with_best_model(lm=lms.module_lm("rephraser"))
             rephraser.tone = self.config.settings.rephrase_tone
 
+        # Optional rephrase cache (with offline-precomputed entries)
+        rephrase_cache = None
+        rephrase_cache_cfg = self.config.settings.rephrase_cache
+        if rephraser is not None and rephrase_cache_cfg.enabled:
+            from soni.du.rephrase_cache import RephraseCache
+
+            rephrase_cache = RephraseCache(
+                rephrase_cache_cfg.max_size,
+                rephrase_cache_cfg.ttl_seconds,
+                context_aware=rephrase_cache_cfg.context_aware,
+            )
+            if rephrase_cache_cfg.precomputed_path:
+                rephrase_cache.load_precomputed(rephrase_cache_cfg.precomputed_path)
+
+        # Rule-based fast path (enabled by setting or by passing custom matchers)
+        rule_nlu = None
+        if self.config.settings.nlu_fast_path or self._rule_matchers is not None:
+            from soni.du.rules import RuleBasedNLU
+
+            rule_nlu = RuleBasedNLU(self._rule_matchers)
+
+        flow_index, nlu_catalog = self._build_flow_lookups(self.config)
+
         # Create message sink (M7: ADR-002)
         from soni.core.message_sink import BufferedMessageSink
 
@@ -82,12 +172,84 @@ class RuntimeLoop:
             slot_extractor=slot_extractor,
             action_registry=action_registry,
             rephraser=rephraser,
+            rule_nlu=rule_nlu,
+            flow_index=flow_index,
+            nlu_catalog=nlu_catalog,
+            rephrase_cache=rephrase_cache,
         )
 
         # Build orchestrator with checkpointer
         self._graph = build_orchestrator(checkpointer=self.checkpointer)
         return self
 
+    @staticmethod
+    def _build_flow_lookups(config: SoniConfig) -> "tuple[FlowIndex | None, NLUCatalog]":
+        """Build the config-derived NLU structures (flow index and catalog)."""
+        # Lexical flow index for speculative slot extraction and flow shortlisting
+        flow_index = None
+        settings = config.settings
+        if settings.speculative_slot_extraction or settings.flow_shortlist_size:
+            from soni.du.flow_index import FlowIndex
+
+            flow_index = FlowIndex(config.flows)
+
+        # Static NLU context (flows, commands, slot definitions) compiled once
+        from soni.du.catalog import NLUCatalog
+
+        return flow_index, NLUCatalog(config)
+
+    async def reload(self, config: SoniConfig) -> "FlowDiff":
+        """Swap in a new configuration without restarting.
+
+        Only flows whose definition changed (by content hash) are recompiled;
+        the flow index, NLU catalog and NLU result cache are rebuilt. The new
+        context is swapped in with a single assignment, so turns already
+        running finish on the old flows and later turns use the new ones.
+
+        Components sized at startup (LM modules, NLU cache size, turn queue,
+        compilation mode) keep their original settings.
+
+        Returns:
+            Which flows were added, changed, removed or left unchanged.
+        """
+        if self._context is None:
+            raise RuntimeError("RuntimeLoop not initialized. Use 'async with' context.")
+
+        from soni.compiler.incremental import arecompile_changed
+
+        async with self._reload_lock:
+            old_context = self._context
+            # Compiles run in threads so the event loop keeps serving turns meanwhile
+            subgraphs, diff = await arecompile_changed(
+                self.config, config, old_context.subgraph_registry
+            )
+            flow_index, nlu_catalog = self._build_flow_lookups(config)
+            if isinstance(self.checkpointer, CompactCheckpointSaver):
+                self.checkpointer.step_index.update(config)
+
+            from soni.du.cache import CachedCommandGenerator
+
+            if isinstance(old_context.nlu_provider, CachedCommandGenerator):
+                old_context.nlu_provider.cache.clear()
+
+            self._context = replace(
+                old_context,
+                config=config,
+                subgraph_registry=subgraphs,
+                flow_index=flow_index,
+                nlu_catalog=nlu_catalog,
+            )
+            self.config = config
+            return diff
+
+    def is_thread_busy(self, thread_id: str) -> bool:
+        """Whether a turn is running or queued for a thread in this process."""
+        return self._turn_queue.is_busy(thread_id)
+
+    def forget_thread(self, thread_id: str) -> None:
+        """Drop cached per-thread state after the thread's checkpoints were deleted."""
+        self._interrupt_index.invalidate(thread_id)
+
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -97,34 +259,83 @@ class RuntimeLoop:
         """Cleanup."""
         pass
 
-    async def process_message(self, message: str, user_id: str = "default") -> str:
+    def _create_turn_context(self, message_sink: "MessageSink | None" = None) -> RuntimeContext:
+        """Build the RuntimeContext for a single turn.
+
+        A sink passed for this turn takes precedence. A shared sink (passed to
+        the constructor) is reused as-is. Otherwise a fresh sink is created so
+        that concurrent turns don't interleave their messages.
+        """
+        assert self._context is not None
+        if message_sink is not None:
+            return replace(self._context, message_sink=message_sink)
+        if self._message_sink is not None:
+            return self._context
+
+        from soni.core.message_sink import BufferedMessageSink
+
+        factory = self._message_sink_factory or BufferedMessageSink
+        return replace(self._context, message_sink=factory())
+
+    async def process_message(
+        self,
+        message: str,
+        user_id: str = "default",
+        message_sink: "MessageSink | None" = None,
+    ) -> str:
         """Process a message and return response.
 
         With ADR-002 architecture:
         - First turn: Fresh invoke, may interrupt waiting for input
         - Subsequent turns: Resume from interrupt with user's response
+
+        ``message_sink`` delivers this turn's messages to a caller-provided
+        sink (e.g. a streaming response). A message coalesced into another
+        queued turn is answered through that turn's sink instead.
+
+        Raises:
+            TurnQueueFullError: If too many turns are already pending for this
+                user and the overflow policy is "reject".
         """
         if self._graph is None or self._context is None:
             raise RuntimeError("RuntimeLoop not initialized. Use 'async with' context.")
 
         # Thread config for persistence
         thread_id = f"thread_{user_id}"
+
+        async def run_turn(turn_message: str) -> str:
+            return await self._run_turn(turn_message, thread_id, message_sink)
+
+        return await self._turn_queue.run(thread_id, message, run_turn)
+
+    async def _run_turn(
+        self, message: str, thread_id: str, message_sink: "MessageSink | None" = None
+    ) -> str:
+        """Execute a single turn; callers guarantee one turn per thread at a time."""
+        assert self._graph is not None
+        turn_context = self._create_turn_context(message_sink)
         config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
 
         try:
-            # Check for existing state (persistence)
-            snapshot = None
+            # Check for a pending interrupt (persistence). The in-memory index
+            # avoids a full checkpoint read; fall back to aget_state on a miss.
+            interrupted = False
             if self.checkpointer:
-                snapshot = await self._graph.aget_state(config)
+                cached = self._interrupt_index.get(thread_id)
+                if cached is None:
+                    snapshot = await self._graph.aget_state(config)
+                    interrupted = bool(snapshot and snapshot.tasks)
+                else:
+                    interrupted = cached
 
-            if snapshot and snapshot.tasks:
+            if interrupted:
                 # Resuming from interrupt (ADR-002 simplified)
                 # Native LangGraph resume: pass message via Command(resume=...)
                 # The message will be picked up by human_input_gate node.
                 result = await self._graph.ainvoke(
                     Command(resume=message),
                     config=config,
-                    context=self._context,
+                    context=turn_context,
                 )
             else:
                 # Fresh execution (ADR-002)
@@ -134,18 +345,20 @@ class RuntimeLoop:
                 result = await self._graph.ainvoke(
                     state,
                     config=config,
-                    context=self._context,
+                    context=turn_context,
                 )
 
+            self._interrupt_index.record(thread_id, InterruptIndex.is_interrupted(result))
+
             # Handle response (ADR-002: collect from MessageSink)
             # All prompts (Inform, Collect, Confirm) are sent to MessageSink
             # by PendingTaskHandler during orchestrator execution.
             from soni.core.message_sink import BufferedMessageSink
 
-            sink = self._context.message_sink
+            sink = turn_context.message_sink
             if isinstance(sink, BufferedMessageSink) and sink.messages:
                 response = "\n".join(sink.messages)
-                sink.clear()  # Reset for next turn
+                sink.clear()  # Reset for next turn (only matters for shared sinks)
                 return response
 
             return str(result.get("response") or "")
@@ -153,6 +366,9 @@ class RuntimeLoop:
         except Exception:
             import traceback
 
+            # State after a failed turn is unknown; re-read it next time
+            self._interrupt_index.invalidate(thread_id)
+
             traceback.print_exc(file=sys.stderr)
 
             # Try to get response from snapshot if available
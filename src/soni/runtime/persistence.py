@@ -0,0 +1,101 @@
+"""Checkpointer construction from PersistenceConfig.
+
+Backends:
+
+- ``memory``: in-process MemorySaver (state is lost on restart)
+- ``sqlite``: AsyncSqliteSaver on ``path`` (single process)
+- ``postgres``: AsyncPostgresSaver on a psycopg connection pool, so several
+  API workers can share conversation state. ``path`` is the connection
+  string. Requires the ``postgres`` extra (langgraph-checkpoint-postgres,
+  psycopg-pool).
+
+The Postgres saver runs each checkpoint write (channel blobs plus the
+checkpoint row) and each batch of pending writes as one pipelined round
+trip. Statements are server-side prepared after ``prepare_threshold``
+executions on a connection.
+"""
+
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from soni.config.models import PersistenceConfig
+from soni.core.errors import ConfigError
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    config: PersistenceConfig,
+) -> AsyncIterator[BaseCheckpointSaver[Any]]:
+    """Open the configured checkpointer and close its connections on exit.
+
+    Raises:
+        ConfigError: If the backend's dependencies or connection settings are missing.
+    """
+    if config.backend == "sqlite":
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+        async with AsyncSqliteSaver.from_conn_string(config.path) as saver:
+            yield saver
+    elif config.backend == "postgres":
+        async with open_postgres_checkpointer(config) as saver:
+            yield saver
+    else:
+        from langgraph.checkpoint.memory import MemorySaver
+
+        yield MemorySaver()
+
+
+def postgres_pool_kwargs(config: PersistenceConfig) -> dict[str, Any]:
+    """Connection settings required by AsyncPostgresSaver."""
+    from psycopg.rows import dict_row
+
+    return {
+        "autocommit": True,
+        "row_factory": dict_row,
+        "prepare_threshold": config.prepare_threshold,
+    }
+
+
+@asynccontextmanager
+async def open_postgres_checkpointer(
+    config: PersistenceConfig,
+) -> AsyncIterator[BaseCheckpointSaver[Any]]:
+    """AsyncPostgresSaver on a connection pool sized from ``config``."""
+    try:
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        from psycopg_pool import AsyncConnectionPool
+    except ImportError as e:
+        raise ConfigError(
+            "The postgres persistence backend requires the 'postgres' extra: "
+            "pip install 'soni[postgres]'"
+        ) from e
+
+    if not config.path or config.path == ":memory:":
+        raise ConfigError("persistence.path must be a Postgres connection string")
+
+    pool = AsyncConnectionPool(
+        conninfo=config.path,
+        min_size=config.pool_min_size,
+        max_size=config.pool_max_size,
+        timeout=config.pool_timeout,
+        kwargs=postgres_pool_kwargs(config),
+        open=False,
+    )
+    # Fail at startup, not on the first turn, if the database is unreachable
+    await pool.open(wait=True, timeout=config.pool_timeout)
+    try:
+        saver = AsyncPostgresSaver(pool)  # type: ignore[arg-type]
+        if config.setup:
+            await saver.setup()
+        logger.info(
+            f"Postgres checkpointer ready (pool {config.pool_min_size}-{config.pool_max_size})"
+        )
+        yield saver
+    finally:
+        await pool.close()
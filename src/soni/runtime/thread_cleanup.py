@@ -0,0 +1,291 @@
+"""Background eviction of idle conversation threads.
+
+Checkpointers keep every thread forever. ThreadJanitor periodically deletes
+the checkpoints of threads whose latest checkpoint is older than a TTL:
+
+- thread ids are enumerated per backend (memory, SQLite, Postgres; other
+  savers fall back to listing every checkpoint)
+- staleness is read from the timestamp of each thread's latest checkpoint
+- threads are scanned and deleted in batches of ``batch_size`` with a pause
+  in between, so cleanup never holds the store for long
+- threads with a turn running or queued in this process (``is_busy``) are
+  skipped, so a conversation is never deleted under an active turn
+
+Bytes reclaimed are the serialized checkpoint, blob and pending-write bytes
+of the deleted threads. SQLite reuses freed pages but only shrinks the file
+on VACUUM.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from soni.runtime.checkpoint import STEP_ORDERS_THREAD, CompactCheckpointSaver
+
+logger = logging.getLogger(__name__)
+
+EvictHandler = Callable[[str], None]
+BusyCheck = Callable[[str], bool]
+
+
+@dataclass
+class CleanupStats:
+    """Counters accumulated over all cleanup runs."""
+
+    runs: int = 0
+    threads_scanned: int = 0
+    threads_evicted: int = 0
+    bytes_reclaimed: int = 0
+    last_run_at: datetime | None = None
+    last_run_seconds: float = 0.0
+    last_run_evicted: int = 0
+
+
+def _bytes_in(value: Any) -> int:
+    """Total length of the bytes nested in a stored (serialized) value."""
+    if isinstance(value, bytes | bytearray):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_bytes_in(v) for v in value.values())
+    if isinstance(value, tuple | list):
+        return sum(_bytes_in(v) for v in value)
+    return 0
+
+
+def _first(row: Any) -> Any:
+    """First column of a DB row (tuple rows or psycopg dict rows)."""
+    return next(iter(row.values())) if isinstance(row, dict) else row[0]
+
+
+class _ThreadStore:
+    """Backend-specific thread enumeration and size accounting."""
+
+    def __init__(self, saver: BaseCheckpointSaver[Any]) -> None:
+        self.saver = saver
+
+    async def thread_ids(self) -> list[str]:
+        ids: dict[str, None] = {}
+        async for item in self.saver.alist(None):
+            ids[item.config["configurable"]["thread_id"]] = None
+        return list(ids)
+
+    async def sizes(self, thread_ids: list[str]) -> dict[str, int]:
+        """Stored bytes per thread (threads without data may be missing)."""
+        return {}
+
+
+class _MemoryStore(_ThreadStore):
+    async def thread_ids(self) -> list[str]:
+        return list(self.saver.storage)  # type: ignore[attr-defined]
+
+    async def sizes(self, thread_ids: list[str]) -> dict[str, int]:
+        saver: Any = self.saver
+        totals = {thread_id: _bytes_in(saver.storage.get(thread_id)) for thread_id in thread_ids}
+        for store in (saver.blobs, saver.writes):
+            for key, value in store.items():
+                if key[0] in totals:
+                    totals[key[0]] += _bytes_in(value)
+        return totals
+
+
+def _add_rows(totals: dict[str, int], rows: Iterable[Any]) -> None:
+    """Add (thread_id, bytes) rows (tuple or dict rows) to ``totals``."""
+    for row in rows:
+        thread_id, size = row.values() if isinstance(row, dict) else row
+        totals[str(thread_id)] = totals.get(str(thread_id), 0) + int(size or 0)
+
+
+class _SqliteStore(_ThreadStore):
+    async def _query(self, sql: str, params: Iterable[Any] = ()) -> list[Any]:
+        saver: Any = self.saver
+        await saver.setup()
+        async with saver.lock, saver.conn.execute(sql, tuple(params)) as cur:
+            return list(await cur.fetchall())
+
+    async def thread_ids(self) -> list[str]:
+        rows = await self._query("SELECT DISTINCT thread_id FROM checkpoints")
+        return [str(_first(row)) for row in rows]
+
+    async def sizes(self, thread_ids: list[str]) -> dict[str, int]:
+        marks = ",".join("?" * len(thread_ids))
+        totals: dict[str, int] = {}
+        for sql in (
+            "SELECT thread_id, SUM(LENGTH(checkpoint) + LENGTH(metadata)) "
+            f"FROM checkpoints WHERE thread_id IN ({marks}) GROUP BY thread_id",  # noqa: S608 - placeholders only
+            "SELECT thread_id, SUM(LENGTH(value)) "
+            f"FROM writes WHERE thread_id IN ({marks}) GROUP BY thread_id",  # noqa: S608 - placeholders only
+        ):
+            _add_rows(totals, await self._query(sql, thread_ids))
+        return totals
+
+
+class _PostgresStore(_ThreadStore):
+    @asynccontextmanager
+    async def _cursor(self) -> AsyncIterator[Any]:
+        saver: Any = self.saver
+        if hasattr(saver.conn, "connection"):
+            # Connection pool
+            async with saver.conn.connection() as conn, conn.cursor() as cur:
+                yield cur
+        else:
+            async with saver.lock, saver.conn.cursor() as cur:
+                yield cur
+
+    async def thread_ids(self) -> list[str]:
+        async with self._cursor() as cur:
+            await cur.execute("SELECT DISTINCT thread_id FROM checkpoints")
+            return [str(_first(row)) for row in await cur.fetchall()]
+
+    async def sizes(self, thread_ids: list[str]) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        queries = (
+            "SELECT thread_id, SUM(pg_column_size(checkpoint) + pg_column_size(metadata)) "
+            "FROM checkpoints WHERE thread_id = ANY(%s) GROUP BY thread_id",
+            "SELECT thread_id, SUM(pg_column_size(blob)) "
+            "FROM checkpoint_blobs WHERE thread_id = ANY(%s) GROUP BY thread_id",
+            "SELECT thread_id, SUM(pg_column_size(blob)) "
+            "FROM checkpoint_writes WHERE thread_id = ANY(%s) GROUP BY thread_id",
+        )
+        async with self._cursor() as cur:
+            for sql in queries:
+                await cur.execute(sql, (thread_ids,))
+                _add_rows(totals, await cur.fetchall())
+        return totals
+
+
+def _thread_store(saver: BaseCheckpointSaver[Any]) -> _ThreadStore:
+    from langgraph.checkpoint.memory import InMemorySaver
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    if isinstance(saver, InMemorySaver):
+        return _MemoryStore(saver)
+    if isinstance(saver, AsyncSqliteSaver):
+        return _SqliteStore(saver)
+    try:
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+    except ImportError:
+        pass
+    else:
+        if isinstance(saver, AsyncPostgresSaver):
+            return _PostgresStore(saver)
+    return _ThreadStore(saver)
+
+
+class ThreadJanitor:
+    """Deletes checkpoints of threads idle for longer than ``ttl_seconds``."""
+
+    def __init__(
+        self,
+        checkpointer: BaseCheckpointSaver[Any],
+        ttl_seconds: float,
+        interval: float = 3600,
+        batch_size: int = 100,
+        batch_pause: float = 0.1,
+        on_evict: EvictHandler | None = None,
+        is_busy: BusyCheck | None = None,
+    ) -> None:
+        if ttl_seconds <= 0 or batch_size < 1:
+            raise ValueError("ttl_seconds must be > 0 and batch_size >= 1")
+        # Compact wrappers store through their inner saver
+        while isinstance(checkpointer, CompactCheckpointSaver):
+            checkpointer = checkpointer.inner
+        self.checkpointer = checkpointer
+        self.ttl_seconds = ttl_seconds
+        self.interval = interval
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self._on_evict = on_evict
+        self._is_busy = is_busy
+        self._store = _thread_store(checkpointer)
+        self.stats = CleanupStats()
+        self._task: asyncio.Task[None] | None = None
+
+    async def _last_activity(self, thread_id: str) -> datetime | None:
+        item = await self.checkpointer.aget_tuple(
+            {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+        )
+        if item is None:
+            return None
+        ts = datetime.fromisoformat(item.checkpoint["ts"])
+        return ts if ts.tzinfo else ts.replace(tzinfo=UTC)
+
+    def _busy(self, thread_id: str) -> bool:
+        return self._is_busy is not None and self._is_busy(thread_id)
+
+    async def run_once(self) -> int:
+        """Evict every thread idle longer than the TTL; returns how many were evicted."""
+        started = time.perf_counter()
+        cutoff = datetime.now(UTC) - timedelta(seconds=self.ttl_seconds)
+        # The compact step-order record is shared by every thread
+        thread_ids = [t for t in await self._store.thread_ids() if t != STEP_ORDERS_THREAD]
+        evicted = 0
+
+        for start in range(0, len(thread_ids), self.batch_size):
+            batch = thread_ids[start : start + self.batch_size]
+            stale = []
+            for thread_id in batch:
+                if self._busy(thread_id):
+                    continue
+                last = await self._last_activity(thread_id)
+                # Threads without a root checkpoint hold nothing worth keeping
+                if last is None or last < cutoff:
+                    stale.append(thread_id)
+
+            if stale:
+                sizes = await self._store.sizes(stale)
+                for thread_id in stale:
+                    # A turn may have started while the batch was scanned
+                    if self._busy(thread_id):
+                        continue
+                    await self.checkpointer.adelete_thread(thread_id)
+                    self.stats.bytes_reclaimed += sizes.get(thread_id, 0)
+                    if self._on_evict:
+                        self._on_evict(thread_id)
+                    evicted += 1
+
+            # Let turns use the store between batches
+            if start + self.batch_size < len(thread_ids):
+                await asyncio.sleep(self.batch_pause)
+
+        self.stats.runs += 1
+        self.stats.threads_scanned += len(thread_ids)
+        self.stats.threads_evicted += evicted
+        self.stats.last_run_at = datetime.now(UTC)
+        self.stats.last_run_seconds = time.perf_counter() - started
+        self.stats.last_run_evicted = evicted
+        logger.info(
+            f"Thread cleanup: evicted {evicted} of {len(thread_ids)} threads "
+            f"in {self.stats.last_run_seconds:.2f}s"
+        )
+        return evicted
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Thread cleanup failed: {e}", exc_info=True)
+
+    def start(self) -> None:
+        """Start periodic cleanup in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic cleanup."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,133 @@
+"""Per-thread turn serialization for RuntimeLoop.
+
+Turns for different threads run fully in parallel, while turns for the
+same thread are executed one at a time in arrival order. Each thread has a
+bounded number of waiting turns; when it is exceeded the configured
+overflow policy applies:
+
+- ``reject``: raise TurnQueueFullError for the new message.
+- ``coalesce``: append the new message to the newest waiting turn, so both
+  callers receive the response of a single combined turn.
+
+Serialization is per process: workers sharing a checkpointer (e.g. the
+postgres backend) do not coordinate, so clients should route a thread's
+messages to one worker (sticky sessions) to avoid concurrent turns.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from soni.config.models import QueueOverflowPolicy
+from soni.core.errors import TurnQueueFullError
+
+logger = logging.getLogger(__name__)
+
+TurnHandler = Callable[[str], Awaitable[str]]
+
+
+@dataclass
+class _QueuedTurn:
+    """A turn waiting to run (possibly shared by coalesced callers)."""
+
+    message: str
+    handler: TurnHandler
+    future: asyncio.Future[str]
+
+
+@dataclass
+class _ThreadQueue:
+    """Waiting turns and drain task for a single thread.
+
+    The running turn is owned by the drain task and is not in `waiting`.
+    """
+
+    waiting: deque[_QueuedTurn] = field(default_factory=deque)
+    drain_task: asyncio.Task[None] | None = None
+
+
+class TurnQueue:
+    """Serializes turns per thread with bounded queue depth."""
+
+    def __init__(
+        self,
+        max_queued_turns: int = 8,
+        overflow_policy: QueueOverflowPolicy = "reject",
+        coalesce_separator: str = "\n",
+    ) -> None:
+        self._max_queued = max_queued_turns
+        self._policy = overflow_policy
+        self._separator = coalesce_separator
+        self._threads: dict[str, _ThreadQueue] = {}
+
+    def queued(self, thread_id: str) -> int:
+        """Number of turns waiting (not running) for a thread."""
+        queue = self._threads.get(thread_id)
+        return len(queue.waiting) if queue else 0
+
+    def is_busy(self, thread_id: str) -> bool:
+        """Whether a turn is currently running or waiting for a thread."""
+        return thread_id in self._threads
+
+    async def run(self, thread_id: str, message: str, handler: TurnHandler) -> str:
+        """Run a turn for a thread once all earlier turns have finished.
+
+        Raises:
+            TurnQueueFullError: If the thread queue is full and policy is "reject".
+        """
+        queue = self._threads.get(thread_id)
+        if queue is None:
+            queue = self._threads[thread_id] = _ThreadQueue()
+
+        if queue.drain_task is not None and len(queue.waiting) >= self._max_queued:
+            if self._policy == "coalesce" and queue.waiting:
+                newest = queue.waiting[-1]
+                newest.message = f"{newest.message}{self._separator}{message}"
+                logger.debug(f"Coalesced message into queued turn for {thread_id}")
+                return await asyncio.shield(newest.future)
+
+            raise TurnQueueFullError(
+                f"Too many pending turns for thread '{thread_id}' (max {self._max_queued} queued)"
+            )
+
+        turn = _QueuedTurn(
+            message=message,
+            handler=handler,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        if queue.drain_task is None:
+            queue.drain_task = asyncio.create_task(self._drain(thread_id, queue, turn))
+        else:
+            queue.waiting.append(turn)
+
+        # Shield so a cancelled caller doesn't cancel a turn shared with others
+        return await asyncio.shield(turn.future)
+
+    async def _drain(self, thread_id: str, queue: _ThreadQueue, first: _QueuedTurn) -> None:
+        """Execute turns for a thread in FIFO order until none are waiting."""
+        turn: _QueuedTurn | None = first
+        try:
+            while turn is not None:
+                try:
+                    result = await turn.handler(turn.message)
+                except asyncio.CancelledError:
+                    turn.future.cancel()
+                    raise
+                except Exception as e:
+                    if not turn.future.done():
+                        turn.future.set_exception(e)
+                else:
+                    if not turn.future.done():
+                        turn.future.set_result(result)
+
+                turn = queue.waiting.popleft() if queue.waiting else None
+        finally:
+            # Only reached with waiting turns if the drain task was cancelled
+            for waiting in queue.waiting:
+                waiting.future.cancel()
+            queue.waiting.clear()
+            queue.drain_task = None
+            if self._threads.get(thread_id) is queue:
+                del self._threads[thread_id]
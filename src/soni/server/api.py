@@ -4,27 +4,30 @@ Provides REST API endpoints for the Soni dialogue system.
 Uses the RuntimeLoop for dialogue processing with async support.
 """
 
+import hmac
 import logging
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Literal
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from soni import __version__
 from soni.actions.registry import ActionRegistry
 from soni.config import SoniConfig
-from soni.core.errors import SoniError, StateError
+from soni.core.errors import SoniError, StateError, TurnQueueFullError
 from soni.server.dependencies import RuntimeDep
 from soni.server.errors import global_exception_handler
 from soni.server.models import (
+    CleanupStatsResponse,
     ComponentStatus,
     HealthResponse,
     MessageRequest,
     MessageResponse,
     ReadinessResponse,
+    ReloadResponse,
     ResetResponse,
     StateResponse,
     VersionResponse,
@@ -33,6 +36,34 @@ from soni.server.models import (
 logger = logging.getLogger(__name__)
 
 
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+async def reload_config(app: FastAPI) -> ReloadResponse:
+    """Re-read the config from disk and hot-swap it into the running RuntimeLoop.
+
+    The YAML is fully validated before anything is swapped; on error the
+    current config stays active and the exception propagates.
+    """
+    import asyncio
+
+    from soni.config.loader import ConfigLoader
+
+    runtime = app.state.runtime
+    config = await asyncio.to_thread(ConfigLoader.load, app.state.config_path)
+    diff = await runtime.reload(config)
+    app.state.config = config
+    return ReloadResponse(
+        success=True,
+        message="Configuration reloaded",
+        added=diff.added,
+        changed=diff.changed,
+        removed=diff.removed,
+        unchanged=diff.unchanged,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - initialize on startup, cleanup on shutdown."""
@@ -63,13 +94,10 @@ async def lifespan(app: FastAPI):
         yield
         return
 
-    # Checkpointer
-    from langgraph.checkpoint.base import BaseCheckpointSaver
-    from langgraph.checkpoint.memory import MemorySaver
-    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    # Checkpointer (memory, sqlite or pooled postgres)
+    from soni.runtime.persistence import open_checkpointer
 
     persistence_cfg = config.settings.persistence
-    checkpointer: BaseCheckpointSaver | None = None
 
     # Initialize RuntimeLoop
     from soni.runtime.loop import RuntimeLoop
@@ -80,11 +108,8 @@ async def lifespan(app: FastAPI):
     checkpointer_cm = None
 
     try:
-        if persistence_cfg.backend == "sqlite":
-            checkpointer_cm = AsyncSqliteSaver.from_conn_string(persistence_cfg.path)
-            checkpointer = await checkpointer_cm.__aenter__()
-        else:
-            checkpointer = MemorySaver()
+        checkpointer_cm = open_checkpointer(persistence_cfg)
+        checkpointer = await checkpointer_cm.__aenter__()
 
         # Configure DSPy
         from soni.core.dspy_service import DSPyBootstrapper
@@ -96,8 +121,46 @@ async def lifespan(app: FastAPI):
         ) as runtime:
             app.state.runtime = runtime
             app.state.config = config
+            app.state.config_path = config_path
             logger.info("RuntimeLoop initialized and ready.")
-            yield
+
+            # Optional hot reload: poll the config files and swap on change
+            watcher = None
+            if _env_flag("SONI_WATCH_CONFIG"):
+                from soni.runtime.config_watcher import ConfigWatcher
+
+                watcher = ConfigWatcher(config_path, lambda: reload_config(app))
+                watcher.start()
+                logger.info(f"Watching {config_path} for changes")
+
+            # Optional eviction of idle threads' checkpoints
+            janitor = None
+            if persistence_cfg.thread_ttl > 0 and runtime.checkpointer is not None:
+                from soni.runtime.thread_cleanup import ThreadJanitor
+
+                janitor = ThreadJanitor(
+                    runtime.checkpointer,
+                    ttl_seconds=persistence_cfg.thread_ttl,
+                    interval=persistence_cfg.cleanup_interval,
+                    batch_size=persistence_cfg.cleanup_batch_size,
+                    batch_pause=persistence_cfg.cleanup_batch_pause,
+                    on_evict=runtime.forget_thread,
+                    is_busy=runtime.is_thread_busy,
+                )
+                janitor.start()
+                logger.info(
+                    f"Evicting threads idle for {persistence_cfg.thread_ttl}s "
+                    f"every {persistence_cfg.cleanup_interval}s"
+                )
+            app.state.janitor = janitor
+
+            try:
+                yield
+            finally:
+                if janitor:
+                    await janitor.stop()
+                if watcher:
+                    await watcher.stop()
             logger.info("RuntimeLoop cleanup...")
 
     except Exception as e:
@@ -184,6 +247,15 @@ async def process_message(
             active_flow=None,  # placeholder
             turn_count=0,  # placeholder
         )
+    except TurnQueueFullError as e:
+        logger.warning(f"Turn rejected for user {request.user_id}: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": "Too many pending messages",
+                "message": "Please wait for the previous response before sending more.",
+            },
+        ) from e
     except StateError as e:
         logger.warning(f"State error for user {request.user_id}: {e}")
         return MessageResponse(
@@ -194,6 +266,24 @@ async def process_message(
         raise SoniError(f"Error processing message: {str(e)}") from e
 
 
+@app.post("/chat/stream")
+async def stream_message(
+    request: MessageRequest,
+    runtime: RuntimeDep,
+) -> StreamingResponse:
+    """Process a user message, streaming the response as Server-Sent Events.
+
+    See soni.server.streaming for the event types.
+    """
+    from soni.server.streaming import stream_turn
+
+    return StreamingResponse(
+        stream_turn(runtime, request.message, request.user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/state/{user_id}", response_model=StateResponse)
 async def get_conversation_state(
     user_id: str,
@@ -223,6 +313,74 @@ async def reset_conversation(
     return ResetResponse(success=False, message="Reset not implemented in M10 runtime")
 
 
+def _require_admin(x_admin_token: str | None) -> None:
+    """Reject admin requests without the SONI_ADMIN_TOKEN.
+
+    Admin endpoints are disabled until SONI_ADMIN_TOKEN is set.
+    """
+    admin_token = os.environ.get("SONI_ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(status_code=403, detail={"error": "Admin endpoints are disabled"})
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), admin_token.encode()
+    ):
+        raise HTTPException(status_code=403, detail={"error": "Invalid admin token"})
+
+
+@app.post("/admin/reload", response_model=ReloadResponse)
+async def reload_configuration(
+    request: Request,
+    runtime: RuntimeDep,
+    x_admin_token: str | None = Header(default=None),
+) -> ReloadResponse:
+    """Reload flow YAML from disk without restarting.
+
+    Requires the ``X-Admin-Token`` header to match SONI_ADMIN_TOKEN.
+    """
+    _require_admin(x_admin_token)
+
+    if not getattr(request.app.state, "config_path", None):
+        raise HTTPException(
+            status_code=409,
+            detail={"error": "No config path", "message": "Server was not started from a file."},
+        )
+
+    try:
+        return await reload_config(request.app)
+    except Exception as e:
+        logger.warning(f"Config reload rejected: {e}")
+        raise HTTPException(
+            status_code=422,
+            detail={"error": "Invalid configuration", "message": str(e)},
+        ) from e
+
+
+@app.get("/admin/cleanup", response_model=CleanupStatsResponse)
+async def cleanup_stats(
+    request: Request,
+    x_admin_token: str | None = Header(default=None),
+) -> CleanupStatsResponse:
+    """Metrics of the idle-thread cleanup task (persistence.thread_ttl)."""
+    _require_admin(x_admin_token)
+
+    janitor = getattr(request.app.state, "janitor", None)
+    if janitor is None:
+        return CleanupStatsResponse(enabled=False)
+
+    stats = janitor.stats
+    return CleanupStatsResponse(
+        enabled=True,
+        thread_ttl=janitor.ttl_seconds,
+        runs=stats.runs,
+        threads_scanned=stats.threads_scanned,
+        threads_evicted=stats.threads_evicted,
+        bytes_reclaimed=stats.bytes_reclaimed,
+        last_run_at=stats.last_run_at.isoformat() if stats.last_run_at else None,
+        last_run_seconds=stats.last_run_seconds,
+        last_run_evicted=stats.last_run_evicted,
+    )
+
+
 @app.get("/version", response_model=VersionResponse)
 def get_version() -> VersionResponse:
     """Get detailed version information."""
@@ -30,6 +30,7 @@ SAFE_ERROR_MESSAGES = {
     "StateError": "Session state error. Please start a new conversation.",
     "GraphBuildError": "Internal configuration error.",
     "SlotError": "Invalid slot value provided.",
+    "TurnQueueFullError": "Too many pending messages. Please wait and retry.",
 }
 
 DEFAULT_ERROR_MESSAGE = "An internal error occurred. Please try again later."
@@ -56,6 +57,7 @@ def get_http_status_for_exception(exception: Exception) -> int:
         NLUError,
         SlotError,
         StateError,
+        TurnQueueFullError,
         ValidationError,
     )
 
@@ -66,6 +68,8 @@ def get_http_status_for_exception(exception: Exception) -> int:
         return 422
     if isinstance(exception, NLUError):
         return 422
+    if isinstance(exception, TurnQueueFullError):
+        return 429
 
     # Server errors (5xx)
     if isinstance(exception, ConfigError):
@@ -83,3 +83,30 @@ class VersionResponse(BaseModel):
     major: int = Field(description="Major version number")
     minor: int = Field(description="Minor version number")
     patch: str = Field(description="Patch version (may include suffix)")
+
+
+class ReloadResponse(BaseModel):
+    """Response model for the config reload endpoint."""
+
+    success: bool
+    message: str
+    added: list[str] = Field(default_factory=list, description="Flows added by the reload")
+    changed: list[str] = Field(default_factory=list, description="Flows recompiled")
+    removed: list[str] = Field(default_factory=list, description="Flows no longer available")
+    unchanged: list[str] = Field(
+        default_factory=list, description="Flows whose compiled graphs were reused"
+    )
+
+
+class CleanupStatsResponse(BaseModel):
+    """Response model for idle-thread cleanup metrics."""
+
+    enabled: bool
+    thread_ttl: float = Field(default=0, description="Idle seconds before a thread is evicted")
+    runs: int = Field(default=0, description="Completed cleanup runs")
+    threads_scanned: int = Field(default=0, description="Threads checked over all runs")
+    threads_evicted: int = Field(default=0, description="Threads deleted over all runs")
+    bytes_reclaimed: int = Field(default=0, description="Checkpoint bytes deleted over all runs")
+    last_run_at: str | None = Field(default=None, description="ISO time of the last run")
+    last_run_seconds: float = Field(default=0.0, description="Duration of the last run")
+    last_run_evicted: int = Field(default=0, description="Threads deleted by the last run")
@@ -0,0 +1,66 @@
+"""Server-Sent Events streaming of a dialogue turn.
+
+Events (each ``data`` is a JSON object):
+
+- ``delta``: ``{"content": chunk}`` a piece of a message still being generated
+- ``message``: ``{"content": text}`` a complete message; replaces any deltas
+  streamed before it
+- ``done``: ``{"response": text}`` the turn finished (all messages joined)
+- ``error``: ``{"error": ..., "message": ...}`` the turn failed
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from soni.core.errors import TurnQueueFullError
+from soni.core.message_sink import QueueMessageSink
+
+if TYPE_CHECKING:
+    from soni.runtime.loop import RuntimeLoop
+
+logger = logging.getLogger(__name__)
+
+
+def sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_turn(runtime: "RuntimeLoop", message: str, user_id: str) -> AsyncIterator[str]:
+    """Run a turn and yield its messages as SSE events while it executes."""
+    sink = QueueMessageSink()
+    turn = asyncio.create_task(runtime.process_message(message, user_id=user_id, message_sink=sink))
+
+    try:
+        while True:
+            next_event = asyncio.ensure_future(sink.events.get())
+            done, _ = await asyncio.wait({next_event, turn}, return_when=asyncio.FIRST_COMPLETED)
+            if next_event in done:
+                kind, text = next_event.result()
+                yield sse_event(kind, {"content": text})
+                continue
+            next_event.cancel()
+            break
+
+        # Events queued while the turn was finishing
+        while not sink.events.empty():
+            kind, text = sink.events.get_nowait()
+            yield sse_event(kind, {"content": text})
+
+        try:
+            response = turn.result()
+        except TurnQueueFullError as e:
+            logger.warning(f"Turn rejected for user {user_id}: {e}")
+            yield sse_event("error", {"error": "Too many pending messages", "message": str(e)})
+        except Exception as e:
+            logger.exception(f"Error streaming message for user {user_id}")
+            yield sse_event("error", {"error": "Error processing message", "message": str(e)})
+        else:
+            yield sse_event("done", {"response": response})
+    finally:
+        # Client went away: stop waiting (the turn itself is shielded by TurnQueue)
+        if not turn.done():
+            turn.cancel()
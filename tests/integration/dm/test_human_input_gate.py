@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from soni.config.models import HistoryConfig
 from soni.core.message_sink import BufferedMessageSink
 from soni.core.pending_task import collect, inform, is_collect, is_inform
 from soni.core.types import (
@@ -93,6 +94,7 @@ def mock_context():
         "transfer_funds": MagicMock(description="Transfer funds"),
     }
     config.settings.rephrase_responses = False
+    config.settings.history = HistoryConfig()
 
     return RuntimeContext(
         flow_manager=FlowManager(),
@@ -266,3 +268,25 @@ class TestHumanInputGateE2E:
         # Assert
         assert "_need_input" not in state
         assert "_pending_prompt" not in state
+
+    @pytest.mark.asyncio
+    async def test_removed_flow_is_left_with_message(self, mock_context):
+        """Test: A flow removed by a config reload is popped instead of crashing."""
+        # Arrange
+        mock_runtime = MockRuntime(mock_context)
+        sink = cast(BufferedMessageSink, mock_context.message_sink)
+        from soni.core.state import create_empty_state
+        from soni.dm.nodes.orchestrator import FLOW_UNAVAILABLE_MESSAGE
+
+        state = create_empty_state()
+        _, delta = mock_context.flow_manager.push_flow(state, "transfer_funds")
+        apply_updates(state, delta.to_dict(), "setup")
+        mock_context.subgraph_registry.get = MagicMock(return_value=None)
+
+        # Act
+        updates = await orchestrator_node(state, mock_runtime)
+        apply_updates(state, updates, "orchestrator_node")
+
+        # Assert
+        assert state.get("flow_stack") == []
+        assert sink.messages == [FLOW_UNAVAILABLE_MESSAGE]
@@ -0,0 +1,59 @@
+"""Concurrent turn processing integration tests."""
+
+import asyncio
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from soni.config.models import FlowConfig, SayStepConfig, SoniConfig
+from soni.core.message_sink import BufferedMessageSink
+from soni.runtime.loop import RuntimeLoop
+
+
+@pytest.fixture
+def greet_config() -> SoniConfig:
+    return SoniConfig(
+        flows={
+            "greet": FlowConfig(
+                description="Greet the user and say hello",
+                steps=[SayStepConfig(step="hello", message="Hello, World!")],
+            )
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_users_do_not_share_messages(greet_config):
+    """Each concurrent turn only receives its own messages."""
+    # Arrange
+    checkpointer = MemorySaver()
+
+    # Act
+    async with RuntimeLoop(greet_config, checkpointer=checkpointer) as runtime:
+        responses = await asyncio.gather(
+            *(runtime.process_message("greet me", user_id=f"user_{i}") for i in range(20))
+        )
+
+    # Assert
+    assert responses == ["Hello, World!"] * 20
+
+
+@pytest.mark.asyncio
+async def test_message_sink_factory_is_called_per_turn(greet_config):
+    """A custom sink factory provides a fresh sink for every turn."""
+    # Arrange
+    created: list[BufferedMessageSink] = []
+
+    def factory() -> BufferedMessageSink:
+        sink = BufferedMessageSink()
+        created.append(sink)
+        return sink
+
+    # Act
+    async with RuntimeLoop(greet_config, message_sink_factory=factory) as runtime:
+        await runtime.process_message("greet me", user_id="a")
+        await runtime.process_message("greet me", user_id="b")
+
+    # Assert
+    assert len(created) == 2
+    assert created[0] is not created[1]
@@ -0,0 +1,143 @@
+"""Integration tests: the direct execution engine matches the subgraph engine."""
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from soni.compiler.plan import FlowPlan
+from soni.config.models import (
+    BranchStepConfig,
+    CollectStepConfig,
+    FlowConfig,
+    LinkStepConfig,
+    SayStepConfig,
+    SetStepConfig,
+    Settings,
+    SoniConfig,
+    WhileStepConfig,
+)
+from soni.runtime.loop import RuntimeLoop
+
+ENGINES = ["subgraph", "direct"]
+
+
+def _config(engine: str, flows: dict[str, FlowConfig]) -> SoniConfig:
+    return SoniConfig(settings=Settings(execution_engine=engine), flows=flows)
+
+
+@pytest.mark.asyncio
+async def test_direct_engine_registers_flow_plans():
+    """With execution_engine='direct' the registry holds FlowPlans."""
+    config = _config(
+        "direct", {"hello": FlowConfig(steps=[SayStepConfig(step="hi", message="Hi")])}
+    )
+
+    async with RuntimeLoop(config) as runtime:
+        assert runtime._context is not None
+        assert isinstance(runtime._context.subgraph_registry.get("hello"), FlowPlan)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("engine", ENGINES)
+async def test_set_branch_and_loop(engine):
+    """Set, branch and while steps produce the same responses on both engines."""
+    config = _config(
+        engine,
+        {
+            "test_flow": FlowConfig(
+                steps=[
+                    SetStepConfig(step="init", slots={"amount": 500, "counter": 5}),
+                    BranchStepConfig(
+                        step="check",
+                        slot="amount",
+                        cases={">1000": "high", "default": "low"},
+                    ),
+                    SayStepConfig(step="low", message="Low {amount}"),
+                    WhileStepConfig(
+                        step="loop",
+                        condition="counter < 3",
+                        do=[SetStepConfig(step="never", slots={"counter": 999})],
+                        exit_to="done",
+                    ),
+                    SayStepConfig(step="done", message="Counter is {counter}"),
+                ]
+            )
+        },
+    )
+
+    async with RuntimeLoop(config) as runtime:
+        response = await runtime.process_message("start")
+
+    assert "Low 500" in response
+    assert "Counter is 5" in response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("engine", ENGINES)
+async def test_collect_interrupt_and_resume(engine):
+    """Collect interrupts and resumes with the slot value on both engines."""
+    config = _config(
+        engine,
+        {
+            "greet": FlowConfig(
+                description="Greet user by asking their name first",
+                steps=[
+                    CollectStepConfig(step="ask", slot="name", message="What is your name?"),
+                    SayStepConfig(step="hello", message="Hello, {name}!"),
+                ],
+            )
+        },
+    )
+    checkpointer = MemorySaver()
+
+    async with RuntimeLoop(config, checkpointer=checkpointer) as runtime:
+        first = await runtime.process_message("hi", user_id="u1")
+        second = await runtime.process_message("Alice", user_id="u1")
+
+    assert "What is your name?" in first
+    assert "Hello, Alice!" in second
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("engine", ENGINES)
+async def test_link_transfers_to_next_flow(engine):
+    """Link steps end the current plan and continue in the target flow."""
+    config = _config(
+        engine,
+        {
+            "main": FlowConfig(
+                steps=[
+                    SayStepConfig(step="intro", message="Starting"),
+                    LinkStepConfig(step="go", target="other"),
+                ]
+            ),
+            "other": FlowConfig(steps=[SayStepConfig(step="end", message="In other")]),
+        },
+    )
+
+    async with RuntimeLoop(config) as runtime:
+        response = await runtime.process_message("start")
+
+    assert "Starting" in response
+    assert "In other" in response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("engine", ENGINES)
+async def test_lazy_compilation(engine):
+    """Lazily compiled flows run like eagerly compiled ones."""
+    config = _config(
+        engine,
+        {
+            "hello": FlowConfig(steps=[SayStepConfig(step="hi", message="Hello, World!")]),
+            "unused": FlowConfig(steps=[SayStepConfig(step="x", message="Never")]),
+        },
+    )
+    config.settings.compilation.lazy = True
+
+    async with RuntimeLoop(config) as runtime:
+        response = await runtime.process_message("hi")
+        assert runtime._context is not None
+        registry = runtime._context.subgraph_registry
+
+    assert response == "Hello, World!"
+    assert registry.compiled == ["hello"]
@@ -127,3 +127,32 @@ async def test_confirm_correction_updates_slot():
     async with RuntimeLoop(config, checkpointer=checkpointer) as runtime:
         response4 = await runtime.process_message("yes", user_id="u3")
     assert "Transferred $50" in response4
+
+
+@pytest.mark.asyncio
+async def test_interrupt_index_skips_state_reads():
+    """After the first turn, the loop does not re-read state to detect interrupts."""
+    from unittest.mock import patch
+
+    config = SoniConfig(
+        flows={
+            "main": FlowConfig(
+                steps=[
+                    CollectStepConfig(step="ask", slot="param", message="Value?"),
+                    SayStepConfig(step="done", message="Got {param}"),
+                ]
+            )
+        }
+    )
+    checkpointer = MemorySaver()
+
+    async with RuntimeLoop(config, checkpointer=checkpointer) as runtime:
+        graph = runtime._graph
+        with patch.object(graph, "aget_state", wraps=graph.aget_state) as aget_state:
+            r1 = await runtime.process_message("start", user_id="idx")
+            r2 = await runtime.process_message("200", user_id="idx")
+
+    assert "Value?" in r1
+    assert "Got 200" in r2
+    # Only the very first turn (cache miss) reads the checkpoint
+    assert aget_state.call_count == 1
@@ -36,7 +36,7 @@ class MockCommandGenerator:
         self._call_count = 0
 
     @classmethod
-    def create_with_best_model(cls) -> "MockCommandGenerator":
+    def create_with_best_model(cls, lm: Any = None) -> "MockCommandGenerator":
         """Factory method matching real CommandGenerator interface."""
         return cls()
 
@@ -110,7 +110,7 @@ class MockSlotExtractor:
         self._call_count = 0
 
     @classmethod
-    def create_with_best_model(cls) -> "MockSlotExtractor":
+    def create_with_best_model(cls, lm: Any = None) -> "MockSlotExtractor":
         """Factory method matching real SlotExtractor interface."""
         return cls()
 
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from soni.cli.chat_runner import ChatConfig, ChatRunner
+from soni.config.models import SoniConfig
 
 
 class TestChatRunner:
@@ -33,7 +34,8 @@ class TestChatRunner:
         with patch("soni.cli.chat_runner.ConfigLoader.load") as mock_load:
             with patch("soni.cli.chat_runner.RuntimeLoop") as mock_runtime:
                 mock_runtime.return_value.__aenter__ = AsyncMock()
-                mock_load.return_value = MagicMock()
+                # Real settings: LM pool sizes reach httpx.Limits
+                mock_load.return_value = SoniConfig()
                 runner = ChatRunner(config)
                 await runner.setup()
                 assert runner.runtime is not None
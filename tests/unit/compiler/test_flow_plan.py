@@ -0,0 +1,84 @@
+"""Tests for compiled flow step plans."""
+
+import pytest
+from langgraph.graph import END
+
+from soni.compiler.plan import apply_update, build_flow_plan
+from soni.config.models import FlowConfig, SayStepConfig, SetStepConfig, WhileStepConfig
+from soni.core.errors import GraphBuildError
+
+
+def _loop_flow() -> FlowConfig:
+    return FlowConfig(
+        steps=[
+            SetStepConfig(step="init", slots={"counter": 0}),
+            WhileStepConfig(
+                step="loop",
+                condition="counter < 3",
+                do=[SetStepConfig(step="increment", slots={"counter": 1})],
+                exit_to="done",
+            ),
+            SayStepConfig(step="done", message="Done"),
+        ]
+    )
+
+
+class TestBuildFlowPlan:
+    """Tests for build_flow_plan."""
+
+    def test_default_successors(self):
+        """Linear steps chain, loop bodies return to the guard, last step ends."""
+        plan = build_flow_plan(_loop_flow(), "loop_flow")
+
+        assert plan.entry == "set_init"
+        assert plan.nodes["set_init"].default_next == "while_loop"
+        assert plan.nodes["set_increment"].default_next == "while_loop"
+        assert plan.nodes["say_done"].default_next == END
+
+    def test_branch_target_overrides_default(self):
+        """_branch_target step names are routed to their nodes."""
+        plan = build_flow_plan(_loop_flow())
+
+        assert plan.next_node("while_loop", {"_branch_target": "done"}) == "say_done"
+        assert plan.next_node("set_init", {"_branch_target": "__end__"}) == END
+
+    def test_blocking_task_ends_run(self):
+        """Blocking pending tasks stop the plan; fire-and-forget informs don't."""
+        plan = build_flow_plan(_loop_flow())
+
+        assert plan.next_node("set_init", {"_pending_task": {"type": "collect"}}) == END
+        inform = {"type": "inform", "wait_for_ack": False}
+        assert plan.next_node("set_init", {"_pending_task": inform}) == "while_loop"
+
+    def test_duplicate_step_names_rejected(self):
+        """Duplicate step names are a build error."""
+        flow = FlowConfig(
+            steps=[SayStepConfig(step="a", message="1"), SayStepConfig(step="a", message="2")]
+        )
+        with pytest.raises(GraphBuildError, match="Duplicate step"):
+            build_flow_plan(flow, "dup")
+
+
+class TestApplyUpdate:
+    """Tests for reducer-aware state updates."""
+
+    def test_uses_state_reducers(self):
+        """flow_slots and _executed_steps merge; other keys keep the last value."""
+        state = {
+            "flow_slots": {"f1": {"a": 1}},
+            "_executed_steps": {"f1": {"s1"}},
+            "_branch_target": "x",
+        }
+
+        apply_update(
+            state,
+            {
+                "flow_slots": {"f1": {"b": 2}},
+                "_executed_steps": {"f1": {"s2"}},
+                "_branch_target": None,
+            },
+        )
+
+        assert state["flow_slots"] == {"f1": {"a": 1, "b": 2}}
+        assert state["_executed_steps"] == {"f1": {"s1", "s2"}}
+        assert state["_branch_target"] is None
@@ -0,0 +1,148 @@
+"""Tests for incremental recompilation on config reload."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from soni.compiler.incremental import (
+    arecompile_changed,
+    diff_flows,
+    flow_fingerprint,
+    recompile_changed,
+)
+from soni.compiler.registry import LazySubgraphRegistry
+from soni.config.models import FlowConfig, SayStepConfig, Settings, SoniConfig
+
+
+def _flow(message: str) -> FlowConfig:
+    return FlowConfig(steps=[SayStepConfig(step="hi", message=message)])
+
+
+def _config(settings: Settings | None = None, **messages: str) -> SoniConfig:
+    return SoniConfig(
+        settings=settings or Settings(),
+        flows={name: _flow(message) for name, message in messages.items()},
+    )
+
+
+def _compile_fn() -> MagicMock:
+    def compile_fn(config: SoniConfig, name: str) -> str:
+        return f"{name}:{config.flows[name].steps[0].message}"
+
+    return MagicMock(side_effect=compile_fn)
+
+
+class TestFlowFingerprint:
+    """Tests for flow_fingerprint."""
+
+    def test_equal_definitions_share_fingerprint(self):
+        assert flow_fingerprint(_flow("Hello")) == flow_fingerprint(_flow("Hello"))
+
+    def test_any_change_alters_fingerprint(self):
+        assert flow_fingerprint(_flow("Hello")) != flow_fingerprint(_flow("Hello!"))
+
+
+class TestDiffFlows:
+    """Tests for diff_flows."""
+
+    def test_classifies_flows(self):
+        # Arrange
+        old = _config(keep="same", edit="before", drop="bye")
+        new = _config(keep="same", edit="after", new="hi")
+
+        # Act
+        diff = diff_flows(old, new)
+
+        # Assert
+        assert diff.unchanged == ["keep"]
+        assert diff.changed == ["edit"]
+        assert diff.added == ["new"]
+        assert diff.removed == ["drop"]
+        assert diff.recompile == ["new", "edit"]
+
+    def test_engine_switch_recompiles_everything(self):
+        old = _config(a="x", b="y")
+        new = _config(Settings(execution_engine="direct"), a="x", b="y")
+
+        diff = diff_flows(old, new)
+
+        assert diff.changed == ["a", "b"]
+        assert diff.unchanged == []
+
+
+class TestRecompileChanged:
+    """Tests for recompile_changed."""
+
+    def test_eager_registry_reuses_unchanged_flows(self):
+        # Arrange
+        old = _config(keep="same", edit="before", drop="bye")
+        new = _config(keep="same", edit="after")
+        kept = object()
+        registry = {"keep": kept, "edit": object(), "drop": object()}
+        compile_fn = _compile_fn()
+
+        # Act
+        new_registry, diff = recompile_changed(old, new, registry, compile_fn)
+
+        # Assert
+        assert new_registry == {"keep": kept, "edit": "edit:after"}
+        assert new_registry["keep"] is kept
+        compile_fn.assert_called_once_with(new, "edit")
+        # Old registry untouched for in-flight turns
+        assert set(registry) == {"keep", "edit", "drop"}
+
+    def test_lazy_registry_is_seeded_with_unchanged_flows(self):
+        # Arrange
+        old = _config(keep="same", edit="before", cold="zzz")
+        new = _config(keep="same", edit="after", cold="zzz")
+        compile_fn = _compile_fn()
+        registry = LazySubgraphRegistry(old, compile_fn)
+        registry.get("keep")
+        registry.get("edit")
+        compile_fn.reset_mock()
+
+        # Act
+        new_registry, _ = recompile_changed(old, new, registry, compile_fn)
+
+        # Assert
+        assert isinstance(new_registry, LazySubgraphRegistry)
+        assert new_registry.compiled == ["keep"]
+        assert new_registry.get("keep") == "keep:same"
+        assert new_registry.get("edit") == "edit:after"
+        compile_fn.assert_called_once_with(new, "edit")
+
+    @pytest.mark.asyncio
+    async def test_async_reads_old_registry_on_caller_thread(self):
+        # Arrange
+        old = _config(keep="same", edit="before")
+        new = _config(keep="same", edit="after")
+        new.settings.compilation.prewarm_flows = ["edit"]
+        compile_threads: list[int] = []
+        peek_threads: list[int] = []
+
+        def compile_fn(config, name):
+            compile_threads.append(threading.get_ident())
+            return f"{name}:{config.flows[name].steps[0].message}"
+
+        registry = LazySubgraphRegistry(old, compile_fn)
+        registry.get("keep")
+        peek = registry.peek
+
+        def tracking_peek(name):
+            peek_threads.append(threading.get_ident())
+            return peek(name)
+
+        registry.peek = tracking_peek  # type: ignore[method-assign]
+        compile_threads.clear()
+
+        # Act
+        new_registry, diff = await arecompile_changed(old, new, registry, compile_fn)
+
+        # Assert
+        assert diff.changed == ["edit"]
+        assert peek_threads == [threading.get_ident()]
+        assert len(compile_threads) == 1 and compile_threads[0] != threading.get_ident()
+        assert new_registry.get("keep") == "keep:same"
+        assert new_registry.get("edit") == "edit:after"
+        assert len(compile_threads) == 1
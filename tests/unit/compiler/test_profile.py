@@ -0,0 +1,63 @@
+"""Tests for compile profiling."""
+
+import pytest
+
+from soni.compiler.profile import (
+    FlowCompileProfile,
+    profile_flow_compilation,
+    profile_process_pool,
+)
+from soni.config.models import FlowConfig, SayStepConfig, SoniConfig
+
+
+def _config(sizes: dict[str, int]) -> SoniConfig:
+    return SoniConfig(
+        flows={
+            name: FlowConfig(
+                steps=[SayStepConfig(step=f"say_{i}", message=f"{name} {i}") for i in range(size)]
+            )
+            for name, size in sizes.items()
+        }
+    )
+
+
+class TestProfileFlowCompilation:
+    """Tests for profile_flow_compilation."""
+
+    def test_reports_every_flow_with_graph_size(self):
+        # Arrange
+        config = _config({"small": 1, "large": 4})
+
+        # Act
+        profiles = {p.flow_name: p for p in profile_flow_compilation(config)}
+
+        # Assert
+        assert set(profiles) == {"small", "large"}
+        assert profiles["small"].nodes == 1
+        assert profiles["large"].nodes == 4
+        # START -> 4 nodes -> END
+        assert profiles["large"].edges == 5
+        assert all(isinstance(p, FlowCompileProfile) and p.seconds >= 0 for p in profiles.values())
+
+    def test_sorted_slowest_first(self):
+        profiles = profile_flow_compilation(_config({"a": 1, "b": 2, "c": 3}))
+        seconds = [p.seconds for p in profiles]
+        assert seconds == sorted(seconds, reverse=True)
+
+
+class TestProfileProcessPool:
+    """Tests for profile_process_pool."""
+
+    def test_times_both_builds(self):
+        # Act
+        profile = profile_process_pool(_config({"a": 2, "b": 3}), workers=2)
+
+        # Assert
+        assert profile.workers == 2
+        assert profile.sequential_seconds > 0
+        assert profile.parallel_seconds > 0
+        assert profile.speedup == profile.sequential_seconds / profile.parallel_seconds
+
+    def test_rejects_zero_workers(self):
+        with pytest.raises(ValueError):
+            profile_process_pool(_config({"a": 1}), workers=0)
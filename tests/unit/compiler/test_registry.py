@@ -0,0 +1,59 @@
+"""Tests for the lazy subgraph registry."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from soni.compiler.registry import LazySubgraphRegistry
+from soni.config.models import FlowConfig, SayStepConfig, SoniConfig
+from soni.core.errors import ConfigError
+
+
+def _config(*names: str) -> SoniConfig:
+    return SoniConfig(
+        flows={name: FlowConfig(steps=[SayStepConfig(step="hi", message=name)]) for name in names}
+    )
+
+
+def _compile_fn() -> MagicMock:
+    return MagicMock(side_effect=lambda config, name: f"compiled:{name}")
+
+
+class TestLazySubgraphRegistry:
+    """Tests for LazySubgraphRegistry."""
+
+    def test_compiles_on_first_use_only(self):
+        compile_fn = _compile_fn()
+        registry = LazySubgraphRegistry(_config("a", "b"), compile_fn)
+
+        assert compile_fn.call_count == 0
+        assert registry.get("a") == "compiled:a"
+        assert registry.get("a") == "compiled:a"
+        assert compile_fn.call_count == 1
+        assert registry.stats() == {"compilations": 1, "hits": 1, "size": 1}
+
+    def test_unknown_flow_returns_none(self):
+        registry = LazySubgraphRegistry(_config("a"), _compile_fn())
+        assert registry.get("missing") is None
+        assert "missing" not in registry
+
+    def test_lru_eviction_keeps_prewarmed_flows(self):
+        compile_fn = _compile_fn()
+        registry = LazySubgraphRegistry(
+            _config("hot", "a", "b"), compile_fn, prewarm=["hot"], max_compiled=1
+        )
+
+        registry.get("a")
+        registry.get("b")  # evicts "a"
+
+        assert sorted(registry.compiled) == ["b", "hot"]
+        registry.get("a")  # recompiled
+        assert compile_fn.call_count == 4
+
+    def test_prewarm_unknown_flow_raises(self):
+        with pytest.raises(ConfigError, match="unknown flows"):
+            LazySubgraphRegistry(_config("a"), _compile_fn(), prewarm=["nope"])
+
+    def test_default_compiles_real_subgraph(self):
+        registry = LazySubgraphRegistry(_config("a"))
+        assert hasattr(registry.get("a"), "astream")
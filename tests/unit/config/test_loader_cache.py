@@ -0,0 +1,120 @@
+"""Tests for the compiled-config cache in ConfigLoader."""
+
+from unittest.mock import patch
+
+from soni.config import loader
+from soni.config.loader import ConfigLoader
+from soni.config.models import SoniConfig
+
+CONFIG_YAML = """
+flows:
+  greet:
+    steps:
+      - step: hi
+        type: say
+        message: {message}
+"""
+
+
+def _write(path, message: str = "Hello") -> None:
+    path.write_text(CONFIG_YAML.format(message=message))
+
+
+class TestConfigLoaderCache:
+    """Tests for ConfigLoader.load with a cache directory."""
+
+    def test_second_load_skips_validation(self, tmp_path):
+        # Arrange
+        config_file = tmp_path / "soni.yaml"
+        _write(config_file)
+        cache_dir = tmp_path / "cache"
+        first = ConfigLoader.load(config_file, cache_dir=cache_dir)
+
+        # Act
+        with patch.object(SoniConfig, "model_validate") as validate:
+            second = ConfigLoader.load(config_file, cache_dir=cache_dir)
+
+        # Assert
+        validate.assert_not_called()
+        assert second == first
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def test_edit_invalidates_cache(self, tmp_path):
+        config_file = tmp_path / "soni.yaml"
+        cache_dir = tmp_path / "cache"
+        _write(config_file, "Hello")
+        ConfigLoader.load(config_file, cache_dir=cache_dir)
+
+        _write(config_file, "Bye")
+        config = ConfigLoader.load(config_file, cache_dir=cache_dir)
+
+        assert config.flows["greet"].steps[0].message == "Bye"
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        # Arrange
+        config_file = tmp_path / "soni.yaml"
+        cache_dir = tmp_path / "cache"
+        _write(config_file)
+        ConfigLoader.load(config_file, cache_dir=cache_dir)
+        for entry in cache_dir.glob("*.pickle"):
+            entry.write_bytes(b"not a pickle")
+
+        # Act
+        config = ConfigLoader.load(config_file, cache_dir=cache_dir)
+
+        # Assert
+        assert "greet" in config.flows
+
+    def test_cache_dir_from_environment(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "soni.yaml"
+        _write(config_file)
+        monkeypatch.setenv("SONI_CONFIG_CACHE_DIR", str(tmp_path / "env_cache"))
+
+        ConfigLoader.load(config_file)
+
+        assert list((tmp_path / "env_cache").glob("*.pickle"))
+
+    def test_directory_of_yaml_files_is_keyed_on_every_file(self, tmp_path):
+        # Arrange
+        domain = tmp_path / "domain"
+        domain.mkdir()
+        _write(domain / "a.yaml")
+        (domain / "b.yaml").write_text("settings:\n  rephrase_responses: false\n")
+        cache_dir = tmp_path / "cache"
+        ConfigLoader.load(domain, cache_dir=cache_dir)
+
+        # Act
+        (domain / "b.yaml").write_text("settings:\n  rephrase_responses: true\n")
+        config = ConfigLoader.load(domain, cache_dir=cache_dir)
+
+        # Assert
+        assert config.settings.rephrase_responses is True
+        assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+    def test_models_change_invalidates_cache(self, tmp_path):
+        # Arrange
+        config_file = tmp_path / "soni.yaml"
+        cache_dir = tmp_path / "cache"
+        _write(config_file)
+        ConfigLoader.load(config_file, cache_dir=cache_dir)
+
+        # Act: same YAML, edited config models
+        with patch.object(loader, "_models_digest", return_value=b"edited models"):
+            ConfigLoader.load(config_file, cache_dir=cache_dir)
+
+        # Assert
+        assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+    def test_unpicklable_config_does_not_fail_load(self, tmp_path):
+        # Arrange
+        config_file = tmp_path / "soni.yaml"
+        cache_dir = tmp_path / "cache"
+        _write(config_file)
+
+        # Act
+        with patch.object(loader.pickle, "dump", side_effect=TypeError("cannot pickle")):
+            config = ConfigLoader.load(config_file, cache_dir=cache_dir)
+
+        # Assert: no cache entry and no leftover temp file
+        assert "greet" in config.flows
+        assert list(cache_dir.iterdir()) == []
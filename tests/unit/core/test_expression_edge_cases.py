@@ -1,6 +1,6 @@
 import pytest
 
-from soni.core.expression import evaluate_expression, matches
+from soni.core.expression import compile_expression, compile_pattern, evaluate_expression, matches
 
 
 class TestExpressionEvaluation:
@@ -32,8 +32,8 @@ class TestExpressionEvaluation:
         """Should handle expressions in parentheses."""
         slots = {"a": 1, "b": 2, "c": 3}
         assert evaluate_expression("(a == 1)", slots) is True
-        # Parentheses are only handled at root currently in implementation
-        # evaluate_expression("(a == 1 AND b == 2) OR c == 3", slots)
+        assert evaluate_expression("(a == 2 AND b == 2) OR c == 3", slots) is True
+        assert evaluate_expression("a == 2 AND (b == 2 OR c == 3)", slots) is False
 
     def test_numeric_coercion(self):
         """Should coerce strings to numbers ONLY for ordering operators."""
@@ -43,6 +43,42 @@ class TestExpressionEvaluation:
         assert evaluate_expression("count > 40", slots) is True
 
 
+class TestCompiledExpressions:
+    """Tests for compile_expression."""
+
+    def test_and_binds_tighter_than_or(self):
+        """Should evaluate AND before OR regardless of position."""
+        predicate = compile_expression("a == 1 OR b == 1 AND c == 1")
+        assert predicate({"a": 1, "b": 0, "c": 0}) is True
+        assert predicate({"a": 0, "b": 1, "c": 0}) is False
+
+    def test_compiled_once(self):
+        """Should return the cached predicate for the same expression."""
+        assert compile_expression("counter < 3") is compile_expression("counter < 3")
+
+    def test_operators_without_spaces_and_quoted_spaces(self):
+        """Should tokenize operators and quoted strings correctly."""
+        assert compile_expression("count>=2")({"count": 2}) is True
+        assert compile_expression("status == 'in progress'")({"status": "in progress"}) is True
+
+    def test_slot_reference_on_right(self):
+        """Should compare against another slot when right side is not a literal."""
+        assert compile_expression("index < total")({"index": 1, "total": 3}) is True
+
+    @pytest.mark.parametrize("expr", ["(a == 1", "a == 1)", "a ==", "AND b", ""])
+    def test_malformed_expression_raises(self, expr):
+        """Should reject malformed expressions at compile time."""
+        with pytest.raises(ValueError, match="Invalid expression"):
+            compile_expression(expr)
+
+    def test_compiled_pattern(self):
+        """Should compile branch case patterns into predicates."""
+        over_1000 = compile_pattern(">1000")
+        assert over_1000(1500) is True
+        assert over_1000("abc") is False
+        assert compile_pattern("approved")("approved") is True
+
+
 class TestMatchPatterns:
     """Tests for branch pattern matching."""
 
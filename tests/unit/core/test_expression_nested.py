@@ -31,3 +31,8 @@ class TestValueEvaluation:
         """Should return original string if no placeholders."""
         template = "Plain text"
         assert evaluate_value(template, {}) == template
+
+    def test_missing_slot_keeps_placeholder(self):
+        """Should render known slots and keep placeholders of missing ones."""
+        template = "Transfer {amount} to {recipient}"
+        assert evaluate_value(template, {"amount": 50}) == "Transfer 50 to {recipient}"
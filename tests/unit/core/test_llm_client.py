@@ -0,0 +1,213 @@
+"""Tests for the rate-limit-aware LM client."""
+
+import asyncio
+import copy
+
+import pytest
+
+from soni.config.models import LLMConfig
+from soni.core.dspy_service import DSPyBootstrapper
+from soni.core.llm_client import LMThrottle, ResilientLM, RetryPolicy, TokenBucket
+
+NO_BACKOFF = RetryPolicy(max_retries=2, base_delay=0.0001, max_delay=0.0001)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_allows_burst_then_spaces_requests(self):
+        # Arrange: 2 requests/second, burst of 2
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        # Act
+        delays = [bucket.reserve() for _ in range(4)]
+
+        # Assert
+        assert delays == [0.0, 0.0, 0.5, 1.0]
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=1, clock=clock)
+        bucket.reserve()
+
+        clock.now = 1.0
+
+        assert bucket.reserve() == 0.0
+
+    def test_rejects_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_delay_is_jittered_and_capped(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        for attempt in range(6):
+            assert 0 <= policy.delay(attempt) <= min(4.0, 2**attempt)
+
+
+class TestLMThrottle:
+    """Tests for LMThrottle."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        # Arrange
+        attempts = 0
+
+        async def flaky() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise ConnectionError("reset")
+            return "ok"
+
+        throttle = LMThrottle(retry=NO_BACKOFF, is_retryable=lambda e: True)
+
+        # Act
+        result = await throttle.call(flaky)
+
+        # Assert
+        assert result == "ok"
+        assert throttle.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        async def failing() -> str:
+            raise ConnectionError("down")
+
+        throttle = LMThrottle(retry=NO_BACKOFF, is_retryable=lambda e: True)
+
+        with pytest.raises(ConnectionError):
+            await throttle.call(failing)
+        assert throttle.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_non_transient_errors_are_not_retried(self):
+        async def invalid() -> str:
+            raise ValueError("bad request")
+
+        throttle = LMThrottle(retry=NO_BACKOFF, is_retryable=lambda e: False)
+
+        with pytest.raises(ValueError):
+            await throttle.call(invalid)
+        assert throttle.retries == 0
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_requests(self):
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def request() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        throttle = LMThrottle(max_concurrent=2)
+
+        # Act
+        await asyncio.gather(*(throttle.call(request) for _ in range(6)))
+
+        # Assert
+        assert peak == 2
+
+    def test_sync_call_retries(self):
+        attempts = []
+
+        def flaky() -> int:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise TimeoutError()
+            return len(attempts)
+
+        throttle = LMThrottle(max_concurrent=1, retry=NO_BACKOFF, is_retryable=lambda e: True)
+
+        assert throttle.call_sync(flaky) == 2
+
+    def test_copies_share_limits(self):
+        throttle = LMThrottle(max_concurrent=2)
+        assert copy.deepcopy(throttle) is throttle
+
+
+class TestCreateLM:
+    """Tests for DSPyBootstrapper.create_lm."""
+
+    def test_builds_resilient_lm_from_config(self):
+        # Arrange
+        llm_cfg = LLMConfig(
+            provider="anthropic",
+            model="claude-haiku",
+            api_key="key",
+            timeout_seconds=12,
+            max_concurrent_requests=4,
+            requests_per_minute=120,
+            max_retries=5,
+        )
+
+        # Act
+        lm = DSPyBootstrapper.create_lm(llm_cfg)
+
+        # Assert
+        assert isinstance(lm, ResilientLM)
+        assert lm.model == "anthropic/claude-haiku"
+        assert lm.kwargs["timeout"] == 12
+        assert lm.kwargs["api_key"] == "key"
+        assert lm.throttle.max_concurrent == 4
+        assert lm.throttle.bucket is not None
+        assert lm.throttle.bucket.rate == 2
+        assert lm.throttle.retry.max_retries == 5
+        # The throttle retries, so litellm must not retry as well
+        assert lm.num_retries == 0
+
+
+class TestModuleLMs:
+    """Tests for per-module LM tiers in DSPyBootstrapper."""
+
+    def _config(self, **module_llms):
+        from soni.config.models import Settings, SoniConfig
+
+        return SoniConfig(
+            settings=Settings(
+                llm=LLMConfig(provider="anthropic", model="big", max_concurrent_requests=8),
+                module_llms=module_llms,
+            )
+        )
+
+    def test_unset_module_uses_global_lm(self):
+        bootstrapper = DSPyBootstrapper(self._config())
+        assert bootstrapper.module_lm("command_generator") is None
+
+    def test_override_inherits_unset_fields(self):
+        # Arrange
+        bootstrapper = DSPyBootstrapper(self._config(slot_extractor={"model": "small"}))
+
+        # Act
+        llm_cfg = bootstrapper.module_llm_config("slot_extractor")
+        lm = bootstrapper.module_lm("slot_extractor")
+
+        # Assert
+        assert llm_cfg is not None
+        assert (llm_cfg.provider, llm_cfg.model) == ("anthropic", "small")
+        assert llm_cfg.max_concurrent_requests == 8
+        assert lm is not None
+        assert lm.model == "anthropic/small"
+
+    def test_identical_tiers_share_one_lm(self):
+        bootstrapper = DSPyBootstrapper(
+            self._config(slot_extractor={"model": "small"}, rephraser={"model": "small"})
+        )
+
+        assert bootstrapper.module_lm("slot_extractor") is bootstrapper.module_lm("rephraser")
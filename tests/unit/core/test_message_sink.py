@@ -45,3 +45,27 @@ class TestBufferedMessageSink:
 
         # Assert
         assert sink.messages == []
+
+
+class TestQueueMessageSink:
+    """Tests for QueueMessageSink (streaming endpoint sink)."""
+
+    @pytest.mark.asyncio
+    async def test_queues_chunks_and_messages_in_order(self):
+        # Arrange
+        from soni.core.message_sink import QueueMessageSink, StreamingMessageSink
+
+        sink = QueueMessageSink()
+
+        # Act
+        await sink.send_chunk("Hel")
+        await sink.send_chunk("lo")
+        await sink.send_chunk("")
+        await sink.send("Hello!")
+
+        # Assert
+        assert isinstance(sink, StreamingMessageSink)
+        events = [sink.events.get_nowait() for _ in range(sink.events.qsize())]
+        assert events == [("delta", "Hel"), ("delta", "lo"), ("message", "Hello!")]
+        # Only complete messages are buffered
+        assert sink.messages == ["Hello!"]
@@ -69,6 +69,15 @@ class TestDeepMergeFlowSlots:
         result = deep_merge_flow_slots(base, new)
         assert result["flow1"]["slot"] is None
 
+    def test_unchanged_flows_are_shared(self):
+        """Test copy-on-write: untouched flows share their slot dicts."""
+        transactions = [{"id": i} for i in range(100)]
+        base = {"flow1": {"transactions": transactions}, "flow2": {"slot": "a"}}
+        result = deep_merge_flow_slots(base, {"flow2": {"slot": "b"}})
+        assert result["flow1"] is base["flow1"]
+        assert result["flow2"] is not base["flow2"]
+        assert base["flow2"] == {"slot": "a"}
+
 
 class TestGetSlotValue:
     """Tests for get_slot_value function."""
@@ -109,3 +118,9 @@ class TestSetSlotValue:
         original = {"flow1": {"slot": "old"}}
         set_slot_value(original, "flow1", "slot", "new")
         assert original["flow1"]["slot"] == "old"
+
+    def test_shares_other_flows(self):
+        """Test copy-on-write: only the target flow's slot dict is replaced."""
+        original = {"flow1": {"slot": "old"}, "flow2": {"items": [1, 2, 3]}}
+        result = set_slot_value(original, "flow1", "slot", "new")
+        assert result["flow2"] is original["flow2"]
@@ -0,0 +1,38 @@
+"""Tests for compiled prompt templates."""
+
+from soni.core.template import compile_template
+
+
+class TestCompiledTemplate:
+    """Tests for compile_template and Template."""
+
+    def test_renders_slots(self):
+        """Should substitute plain slot placeholders."""
+        template = compile_template("Hello {name}, your balance is {balance}")
+        assert template.render({"name": "Alice", "balance": 1000}) == (
+            "Hello Alice, your balance is 1000"
+        )
+
+    def test_reports_required_and_missing_slots(self):
+        """Should know which slots it needs and which are missing."""
+        template = compile_template("Send {amount} to {user.name} on {dates[0]}")
+        assert template.slots == {"amount", "user", "dates"}
+        assert template.missing({"amount": 1}) == {"user", "dates"}
+
+    def test_missing_slots_keep_placeholder(self):
+        """Should leave placeholders (with spec) of missing slots untouched."""
+        template = compile_template("{amount:.2f} to {recipient!r}")
+        assert template.render({"amount": 3.14159}) == "3.14 to {recipient!r}"
+
+    def test_format_spec_conversion_and_escaped_braces(self):
+        """Should support format specs, conversions and escaped braces."""
+        template = compile_template("{{x}} {amount:,} {name!r}")
+        assert template.render({"amount": 1500, "name": "Bo"}) == "{x} 1,500 'Bo'"
+
+    def test_malformed_template_renders_verbatim(self):
+        """Should render malformed templates as-is."""
+        assert compile_template("Price: {").render({}) == "Price: {"
+
+    def test_compiled_once(self):
+        """Should cache compiled templates per string."""
+        assert compile_template("Hi {name}") is compile_template("Hi {name}")
@@ -0,0 +1,69 @@
+"""Unit tests for DialogueContextBuilder flow shortlisting."""
+
+from unittest.mock import MagicMock
+
+from soni.config.models import FlowConfig, Settings, SoniConfig, TriggerConfig
+from soni.core.message_sink import BufferedMessageSink
+from soni.core.state import create_empty_state
+from soni.dm.nodes.context_builder import DialogueContextBuilder
+from soni.du.flow_index import FlowIndex
+from soni.flow.manager import FlowManager
+from soni.runtime.context import RuntimeContext
+
+
+def _context(shortlist_size: int, with_index: bool = True) -> RuntimeContext:
+    config = SoniConfig(
+        settings=Settings(flow_shortlist_size=shortlist_size),
+        flows={
+            "check_balance": FlowConfig(
+                description="Check account balance",
+                trigger=TriggerConfig(intents=["what is my balance"]),
+            ),
+            "transfer_funds": FlowConfig(
+                description="Transfer money",
+                trigger=TriggerConfig(intents=["send money"]),
+            ),
+            "block_card": FlowConfig(description="Block a lost or stolen card"),
+        },
+    )
+    return RuntimeContext(
+        config=config,
+        flow_manager=FlowManager(),
+        subgraph_registry=MagicMock(),
+        message_sink=BufferedMessageSink(),
+        nlu_provider=MagicMock(),
+        slot_extractor=MagicMock(),
+        action_registry=MagicMock(),
+        flow_index=FlowIndex(config.flows) if with_index else None,
+    )
+
+
+def _build(ctx: RuntimeContext, message: str, active_flow: str | None = None) -> list[str]:
+    state = create_empty_state()
+    state["user_message"] = message
+    if active_flow:
+        _, delta = ctx.flow_manager.push_flow(state, active_flow)
+        state["flow_stack"] = delta.flow_stack or []
+        state["flow_slots"] = delta.flow_slots or {}
+    return [f.name for f in DialogueContextBuilder(ctx).build(state).available_flows]
+
+
+class TestFlowShortlist:
+    """Tests for top-K flow shortlisting."""
+
+    def test_disabled_passes_every_flow(self):
+        assert len(_build(_context(shortlist_size=0), "send money")) == 3
+
+    def test_top_k_flows_only(self):
+        assert _build(_context(shortlist_size=1), "please send money") == ["transfer_funds"]
+
+    def test_active_flow_always_included(self):
+        ctx = _context(shortlist_size=1)
+        flows = _build(ctx, "my card was stolen", active_flow="transfer_funds")
+        assert flows == ["block_card", "transfer_funds"]
+
+    def test_no_match_falls_back_to_all_flows(self):
+        assert len(_build(_context(shortlist_size=1), "hello there")) == 3
+
+    def test_missing_index_falls_back_to_all_flows(self):
+        assert len(_build(_context(shortlist_size=1, with_index=False), "send money")) == 3
@@ -0,0 +1,141 @@
+"""Tests for HistoryPolicy (bounded message history)."""
+
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
+from langgraph.graph.message import add_messages
+
+from soni.config.models import HistoryConfig
+from soni.core.state import create_empty_state
+from soni.core.types import _last_value_keep_none
+from soni.dm.nodes.history_policy import SUMMARY_PREFIX, HistoryPolicy, roll_summary
+
+
+def _state_with(count: int):
+    state = create_empty_state()
+    state["messages"] = add_messages(
+        [], [HumanMessage(content=f"msg {i}", id=f"m{i}") for i in range(count)]
+    )
+    return state
+
+
+class TestAppend:
+    def test_unbounded_by_default(self):
+        """With max_messages=0 the message is simply appended."""
+        # Arrange
+        policy = HistoryPolicy(HistoryConfig())
+        state = _state_with(50)
+        new = HumanMessage(content="hi")
+
+        # Act
+        update = policy.append(state, new)
+
+        # Assert
+        assert update == {"messages": [new]}
+
+    def test_no_trim_below_limit(self):
+        # Arrange
+        policy = HistoryPolicy(HistoryConfig(max_messages=5))
+        state = _state_with(4)
+
+        # Act
+        update = policy.append(state, HumanMessage(content="hi"))
+
+        # Assert
+        assert len(update["messages"]) == 1
+        assert "conversation_summary" not in update
+
+    def test_trims_oldest_messages(self):
+        """Applying the update through add_messages keeps exactly max_messages."""
+        # Arrange
+        policy = HistoryPolicy(HistoryConfig(max_messages=3))
+        state = _state_with(5)
+
+        # Act
+        update = policy.append(state, HumanMessage(content="new", id="new"))
+        result = add_messages(state["messages"], update["messages"])
+
+        # Assert
+        removed = [m.id for m in update["messages"] if isinstance(m, RemoveMessage)]
+        assert removed == ["m0", "m1", "m2"]
+        assert [m.id for m in result] == ["m3", "m4", "new"]
+
+    def test_history_stays_bounded_over_many_turns(self):
+        # Arrange
+        policy = HistoryPolicy(HistoryConfig(max_messages=4))
+        state = create_empty_state()
+
+        # Act
+        for i in range(20):
+            update = policy.append(state, HumanMessage(content=f"turn {i}"))
+            state["messages"] = add_messages(state["messages"], update["messages"])
+
+        # Assert
+        assert [m.content for m in state["messages"]] == [f"turn {i}" for i in range(16, 20)]
+
+    def test_summarizes_dropped_messages(self):
+        # Arrange
+        policy = HistoryPolicy(HistoryConfig(max_messages=2, summarize=True))
+        state = _state_with(3)
+        state["conversation_summary"] = "user: earlier"
+
+        # Act
+        update = policy.append(state, HumanMessage(content="new"))
+
+        # Assert
+        assert update["conversation_summary"] == "user: earlier\nuser: msg 0\nuser: msg 1"
+
+
+class TestRollSummary:
+    def test_labels_roles(self):
+        # Act
+        summary = roll_summary(None, [HumanMessage(content="hi"), AIMessage(content="hello")], 100)
+
+        # Assert
+        assert summary == "user: hi\nassistant: hello"
+
+    def test_keeps_most_recent_text_within_limit(self):
+        # Arrange
+        dropped = [HumanMessage(content=f"message number {i}") for i in range(50)]
+
+        # Act
+        summary = roll_summary(None, dropped, 60)
+
+        # Assert
+        assert len(summary) <= 60
+        assert summary.endswith("user: message number 49")
+        assert summary.startswith("user: ")
+
+
+class TestNluHistory:
+    def test_uses_window(self):
+        # Arrange
+        policy = HistoryPolicy(HistoryConfig(nlu_window=2))
+        state = _state_with(5)
+
+        # Act
+        history = policy.nlu_history(state)
+
+        # Assert
+        assert history == [
+            {"role": "user", "content": "msg 3"},
+            {"role": "user", "content": "msg 4"},
+        ]
+
+    def test_prepends_summary(self):
+        # Arrange
+        policy = HistoryPolicy(HistoryConfig(nlu_window=1))
+        state = _state_with(2)
+        state["conversation_summary"] = "user: msg 0"
+
+        # Act
+        history = policy.nlu_history(state)
+
+        # Assert
+        assert history[0] == {"role": "system", "content": f"{SUMMARY_PREFIX}\nuser: msg 0"}
+        assert history[1] == {"role": "user", "content": "msg 1"}
+
+
+class TestSummaryReducer:
+    def test_none_keeps_persisted_summary(self):
+        """create_empty_state() input on a new turn must not erase the summary."""
+        assert _last_value_keep_none("kept", None) == "kept"
+        assert _last_value_keep_none("old", "new") == "new"
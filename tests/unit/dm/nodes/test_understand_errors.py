@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from soni.config.models import SoniConfig
 from soni.core.errors import NLUProviderError
 from soni.dm.nodes.understand import understand_node
 from soni.runtime.context import RuntimeContext
@@ -16,9 +17,11 @@ def mock_runtime() -> MagicMock:
     runtime.context = MagicMock(spec=RuntimeContext)
     # Setup default mocks to avoid unrelated errors
     runtime.context.flow_manager = MagicMock()
-    runtime.context.config = MagicMock()
+    runtime.context.config = SoniConfig()
     runtime.context.nlu_provider = AsyncMock()
     runtime.context.slot_extractor = AsyncMock()
+    runtime.context.rule_nlu = None
+    runtime.context.flow_index = None
     return runtime
 
 
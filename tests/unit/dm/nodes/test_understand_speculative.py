@@ -0,0 +1,110 @@
+"""Unit tests for speculative slot extraction in understand_node."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from soni.config.models import (
+    CollectStepConfig,
+    FlowConfig,
+    Settings,
+    SoniConfig,
+    TriggerConfig,
+)
+from soni.core.commands import SetSlot, StartFlow
+from soni.core.message_sink import BufferedMessageSink
+from soni.core.state import create_empty_state
+from soni.dm.nodes.understand import understand_node
+from soni.du.flow_index import FlowIndex
+from soni.du.models import NLUOutput
+from soni.flow.manager import FlowManager
+from soni.runtime.context import RuntimeContext
+
+
+def _runtime(nlu_flow: str, settings: Settings | None = None) -> MagicMock:
+    config = SoniConfig(
+        settings=settings or Settings(speculative_slot_extraction=True, speculative_max_flows=2),
+        flows={
+            "transfer": FlowConfig(
+                description="Transfer money",
+                trigger=TriggerConfig(intents=["send money"]),
+                steps=[CollectStepConfig(step="ask", slot="amount", message="Amount?")],
+            ),
+            "balance": FlowConfig(
+                description="Check balance",
+                steps=[CollectStepConfig(step="ask", slot="account", message="Account?")],
+            ),
+        },
+    )
+    nlu = AsyncMock()
+
+    async def slow_nlu(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return NLUOutput(commands=[StartFlow(flow_name=nlu_flow)])
+
+    nlu.acall.side_effect = slow_nlu
+    slot_extractor = AsyncMock()
+    slot_extractor.acall.return_value = [SetSlot(slot="amount", value=50)]
+
+    runtime = MagicMock()
+    runtime.context = RuntimeContext(
+        config=config,
+        flow_manager=FlowManager(),
+        subgraph_registry=MagicMock(),
+        message_sink=BufferedMessageSink(),
+        nlu_provider=nlu,
+        slot_extractor=slot_extractor,
+        action_registry=MagicMock(),
+        flow_index=FlowIndex(config.flows),
+    )
+    return runtime
+
+
+@pytest.mark.asyncio
+async def test_speculative_result_is_used_for_started_flow():
+    """Slot extraction starts before Pass 1 returns and its result is reused."""
+    # Arrange
+    runtime = _runtime(nlu_flow="transfer")
+    state = create_empty_state()
+    state["user_message"] = "send money 50"
+
+    # Act
+    result = await understand_node(state, runtime)
+
+    # Assert
+    assert runtime.context.slot_extractor.acall.await_count == 1
+    slot_commands = [c for c in result["commands"] if c["type"] == "set_slot"]
+    assert [(c["slot"], c["value"]) for c in slot_commands] == [("amount", 50)]
+
+
+@pytest.mark.asyncio
+async def test_falls_back_when_prediction_misses():
+    """If Pass 1 starts a different flow, slot extraction runs for that flow."""
+    # Arrange
+    runtime = _runtime(nlu_flow="balance")
+    state = create_empty_state()
+    state["user_message"] = "send money"
+
+    # Act
+    await understand_node(state, runtime)
+
+    # Assert: speculative call for "transfer" + regular call for "balance"
+    calls = runtime.context.slot_extractor.acall.await_args_list
+    assert [c.args[1][0].name for c in calls] == ["amount", "account"]
+
+
+@pytest.mark.asyncio
+async def test_flow_shortlist_alone_does_not_speculate():
+    """A FlowIndex built for shortlisting doesn't turn on speculative extraction."""
+    # Arrange
+    runtime = _runtime(nlu_flow="balance", settings=Settings(flow_shortlist_size=2))
+    state = create_empty_state()
+    state["user_message"] = "send money"
+
+    # Act
+    await understand_node(state, runtime)
+
+    # Assert: only the regular call for the started flow
+    calls = runtime.context.slot_extractor.acall.await_args_list
+    assert [c.args[1][0].name for c in calls] == ["account"]
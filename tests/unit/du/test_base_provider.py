@@ -187,6 +187,14 @@ class TestCommandGenerator:
         instance = CommandGenerator.create_with_best_model(use_cot=False)
         assert isinstance(instance, CommandGenerator)
 
+    def test_create_with_best_model_sets_module_lm(self):
+        """Should bind a per-module LM to every predictor."""
+        lm = dspy.LM("openai/gpt-4o-mini")
+
+        instance = CommandGenerator.create_with_best_model(use_cot=False, lm=lm)
+
+        assert all(predictor.lm is lm for _, predictor in instance.named_predictors())
+
 
 class TestRephraseResponse:
     """Tests for ResponseRephraser specialized logic."""
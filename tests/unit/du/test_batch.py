@@ -0,0 +1,128 @@
+"""Tests for batched NLU inference."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from soni.core.commands import StartFlow
+from soni.du.batch import input_key, run_batch
+from soni.du.cache import CachedCommandGenerator, NLUResultCache
+from soni.du.models import DialogueContext, FlowInfo, NLUOutput
+
+
+def _context(active_flow: str | None = None) -> DialogueContext:
+    return DialogueContext(
+        available_flows=[FlowInfo(name="check_balance", description="Check balance")],
+        available_commands=[],
+        active_flow=active_flow,
+    )
+
+
+async def _collect(stream) -> list:
+    return [item async for item in stream]
+
+
+class TestInputKey:
+    """Tests for input_key."""
+
+    def test_equal_models_share_key(self):
+        assert input_key(("hi", _context(), [])) == input_key(("hi", _context(), []))
+
+    def test_model_content_changes_key(self):
+        assert input_key(("hi", _context())) != input_key(("hi", _context("check_balance")))
+
+
+class TestRunBatch:
+    """Tests for run_batch."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_for_every_index(self):
+        async def double(x: int) -> int:
+            return x * 2
+
+        results = await _collect(run_batch(double, [(1,), (2,), (3,)]))
+
+        assert sorted((r.index, r.result) for r in results) == [(0, 2), (1, 4), (2, 6)]
+        assert all(r.ok for r in results)
+
+    @pytest.mark.asyncio
+    async def test_duplicates_run_once(self):
+        # Arrange
+        call = AsyncMock(side_effect=lambda msg: msg.upper())
+        inputs = [("hi",), ("bye",), ("hi",), ("hi",)]
+
+        # Act
+        results = await _collect(run_batch(call, inputs))
+
+        # Assert
+        assert call.await_count == 2
+        assert {r.index: r.result for r in results} == {0: "HI", 1: "BYE", 2: "HI", 3: "HI"}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def slow(x: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return x
+
+        # Act
+        results = await _collect(run_batch(slow, [(i,) for i in range(10)], max_concurrency=3))
+
+        # Assert
+        assert len(results) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_streams_results_as_they_complete(self):
+        async def wait(delay: float) -> float:
+            await asyncio.sleep(delay)
+            return delay
+
+        results = await _collect(run_batch(wait, [(0.05,), (0.0,)], max_concurrency=2))
+
+        assert [r.index for r in results] == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_per_item(self):
+        async def parse(x: str) -> int:
+            return int(x)
+
+        results = {r.index: r for r in await _collect(run_batch(parse, [("1",), ("x",)]))}
+
+        assert results[0].result == 1
+        assert not results[1].ok
+        assert isinstance(results[1].error, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_rejected(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await _collect(run_batch(AsyncMock(), [("a",)], max_concurrency=0))
+
+
+class TestCachedBatch:
+    """Tests for CachedCommandGenerator.abatch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_goes_through_cache(self):
+        # Arrange
+        inner = AsyncMock()
+        inner.acall.return_value = NLUOutput(commands=[StartFlow(flow_name="check_balance")])
+        cached = CachedCommandGenerator(inner, NLUResultCache())
+        await cached.acall("check my balance", _context())
+
+        # Act
+        results = await _collect(
+            cached.abatch([("Check my balance!", _context(), None), ("hello", _context(), None)])
+        )
+
+        # Assert
+        assert len(results) == 2
+        assert inner.acall.await_count == 2  # warm-up + "hello"
@@ -0,0 +1,121 @@
+"""Tests for the NLU result cache."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from soni.core.commands import SetSlot, StartFlow
+from soni.du.cache import CachedCommandGenerator, NLUResultCache, make_cache_key
+from soni.du.models import DialogueContext, FlowInfo, NLUOutput
+
+
+def _context(**kwargs) -> DialogueContext:
+    flows = kwargs.pop(
+        "available_flows", [FlowInfo(name="check_balance", description="Check balance")]
+    )
+    return DialogueContext(available_flows=flows, available_commands=[], **kwargs)
+
+
+def _output() -> NLUOutput:
+    return NLUOutput(commands=[StartFlow(flow_name="check_balance")])
+
+
+class TestMakeCacheKey:
+    """Tests for cache key construction."""
+
+    def test_normalizes_message(self):
+        ctx = _context()
+        assert make_cache_key("Check my balance!", ctx) == make_cache_key("check my  balance", ctx)
+
+    def test_slot_values_are_kept_inside_a_flow(self):
+        ctx = _context(active_flow="transfer", expected_slot="amount")
+
+        assert make_cache_key("-50", ctx) != make_cache_key("50", ctx)
+        assert make_cache_key("12-34", ctx) != make_cache_key("1234", ctx)
+        assert make_cache_key("Bob", ctx) != make_cache_key("bob", ctx)
+        assert make_cache_key(" 50 ", ctx) == make_cache_key("50", ctx)
+
+    def test_depends_on_dialogue_state(self):
+        idle = make_cache_key("yes", _context())
+        confirming = make_cache_key(
+            "yes", _context(active_flow="transfer", conversation_state="confirming")
+        )
+        assert idle != confirming
+
+    def test_depends_on_flow_catalog(self):
+        other_flows = [FlowInfo(name="transfer", description="Transfer money")]
+        assert make_cache_key("hi", _context()) != make_cache_key(
+            "hi", _context(available_flows=other_flows)
+        )
+
+
+class TestNLUResultCache:
+    """Tests for NLUResultCache."""
+
+    def test_miss_then_hit(self):
+        cache = NLUResultCache()
+        assert cache.get(("k",)) is None
+        cache.set(("k",), _output())
+        assert cache.get(("k",)) == _output()
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_returns_copies(self):
+        cache = NLUResultCache()
+        cache.set(("k",), _output())
+        first = cache.get(("k",))
+        assert first is not None
+        first.commands.clear()
+        assert cache.get(("k",)) == _output()
+
+    def test_does_not_cache_fallback_results(self):
+        cache = NLUResultCache()
+        cache.set(("k",), NLUOutput(commands=[], confidence=0.0))
+        assert cache.stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        cache = NLUResultCache(max_size=1)
+        cache.set(("a",), _output())
+        cache.set(("b",), _output())
+        assert cache.get(("a",)) is None
+        assert cache.get(("b",)) is not None
+
+
+class TestCachedCommandGenerator:
+    """Tests for CachedCommandGenerator."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_message_skips_generator(self):
+        # Arrange
+        generator = AsyncMock()
+        generator.acall.return_value = _output()
+        cached = CachedCommandGenerator(generator, NLUResultCache())
+        ctx = _context()
+
+        # Act
+        first = await cached.acall("Check my balance", ctx, [])
+        second = await cached.acall("check my balance.", ctx, [])
+
+        # Assert
+        assert first == second == _output()
+        assert generator.acall.await_count == 1
+        assert cached.cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_negative_amount_does_not_reuse_positive_entry(self):
+        # Arrange
+        generator = AsyncMock()
+        generator.acall.side_effect = [
+            NLUOutput(commands=[SetSlot(slot="amount", value="50")]),
+            NLUOutput(commands=[SetSlot(slot="amount", value="-50")]),
+        ]
+        cached = CachedCommandGenerator(generator, NLUResultCache())
+        ctx = _context(active_flow="transfer", expected_slot="amount")
+
+        # Act
+        first = await cached.acall("50", ctx, [])
+        second = await cached.acall("-50", ctx, [])
+
+        # Assert
+        assert first.commands[0].value == "50"
+        assert second.commands[0].value == "-50"
+        assert generator.acall.await_count == 2
@@ -0,0 +1,59 @@
+"""Tests for the precomputed NLU catalog."""
+
+from soni.config.models import (
+    CollectStepConfig,
+    FlowConfig,
+    SlotDefinition,
+    SoniConfig,
+    TriggerConfig,
+)
+from soni.du.catalog import NLUCatalog
+
+
+def _config() -> SoniConfig:
+    return SoniConfig(
+        flows={
+            "transfer": FlowConfig(
+                description="Transfer money",
+                trigger=TriggerConfig(intents=["send money"]),
+                slots=[SlotDefinition(name="amount", type="number")],
+                steps=[
+                    CollectStepConfig(step="ask_amount", slot="amount", message="How much?"),
+                    CollectStepConfig(step="ask_to", slot="recipient", message="To whom?"),
+                ],
+            ),
+            "greet": FlowConfig(description=""),
+        }
+    )
+
+
+class TestNLUCatalog:
+    """Tests for NLUCatalog."""
+
+    def test_flows_info_includes_trigger_intents(self):
+        catalog = NLUCatalog(_config())
+        flows = {f.name: f for f in catalog.flows_info()}
+        assert flows["transfer"].trigger_intents == ["send money"]
+        # Empty descriptions fall back to the flow name
+        assert flows["greet"].description == "greet"
+
+    def test_slot_definitions_prefer_explicit_slots(self):
+        catalog = NLUCatalog(_config())
+        slots = catalog.slot_inputs("transfer")
+        assert [(s.name, s.slot_type) for s in slots] == [
+            ("amount", "number"),
+            ("recipient", "string"),
+        ]
+        assert [s.name for s in catalog.flow_slots("transfer")] == ["amount", "recipient"]
+
+    def test_unknown_flow_has_no_slots(self):
+        catalog = NLUCatalog(_config())
+        assert catalog.slot_inputs("missing") == []
+        assert catalog.flow_slots("missing") == []
+
+    def test_accessors_return_fresh_lists(self):
+        catalog = NLUCatalog(_config())
+        catalog.flows_info().clear()
+        catalog.commands_info().clear()
+        assert len(catalog.flows_info()) == 2
+        assert len(catalog.commands_info()) == 6
@@ -0,0 +1,50 @@
+"""Tests for the lexical flow index."""
+
+from soni.config.models import FlowConfig, SoniConfig, TriggerConfig
+from soni.du.flow_index import FlowIndex, tokenize
+
+
+def _flows() -> dict[str, FlowConfig]:
+    return SoniConfig(
+        flows={
+            "check_balance": FlowConfig(
+                description="Check the balance of an account",
+                trigger=TriggerConfig(intents=["what is my balance", "how much money do I have"]),
+            ),
+            "transfer_funds": FlowConfig(
+                description="Transfer money to another account",
+                trigger=TriggerConfig(intents=["send money", "make a transfer"]),
+            ),
+            "greet": FlowConfig(description="Say hello"),
+        }
+    ).flows
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_drops_stopwords_and_punctuation(self):
+        assert tokenize("I want to send money!") == ["send", "money"]
+
+
+class TestFlowIndex:
+    """Tests for FlowIndex."""
+
+    def test_ranks_best_flow_first(self):
+        index = FlowIndex(_flows())
+        ranked = index.rank("I'd like to make a transfer to my sister")
+        assert ranked[0][0] == "transfer_funds"
+
+    def test_trigger_phrase_bonus(self):
+        index = FlowIndex(_flows())
+        assert index.score("what is my balance", "check_balance") > index.score(
+            "balance", "check_balance"
+        )
+
+    def test_no_overlap_returns_empty(self):
+        index = FlowIndex(_flows())
+        assert index.rank("zzz qqq") == []
+
+    def test_top_k_limits_results(self):
+        index = FlowIndex(_flows())
+        assert len(index.rank("money account balance transfer", top_k=1)) == 1
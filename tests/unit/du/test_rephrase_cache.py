@@ -0,0 +1,151 @@
+"""Tests for the rephrase result cache."""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from soni.config.models import (
+    CollectStepConfig,
+    FlowConfig,
+    SayStepConfig,
+    SetStepConfig,
+    SoniConfig,
+    WhileStepConfig,
+)
+from soni.core.state import create_empty_state
+from soni.core.types import DialogueState
+from soni.du.rephrase_cache import (
+    RephraseCache,
+    context_bucket,
+    read_precomputed,
+    save_precomputed,
+    static_templates,
+)
+
+
+def _state(*user_messages: str) -> DialogueState:
+    state = create_empty_state()
+    state["messages"] = [HumanMessage(content=text) for text in user_messages]
+    return state
+
+
+class TestContextBucket:
+    """Tests for context_bucket."""
+
+    def test_opening_during_first_user_turn(self):
+        assert context_bucket(_state()) == "opening"
+        assert context_bucket(_state("hi")) == "opening"
+        assert context_bucket(_state("hi", "send money")) == "ongoing"
+
+    def test_assistant_messages_do_not_count_as_turns(self):
+        state = _state("hi")
+        state["messages"].append(AIMessage(content="hey"))
+
+        assert context_bucket(state) == "opening"
+
+    def test_summarized_history_is_ongoing(self):
+        state = _state("send money")
+        state["conversation_summary"] = "User greeted the assistant."
+
+        assert context_bucket(state) == "ongoing"
+
+
+class TestRephraseCache:
+    """Tests for RephraseCache."""
+
+    def test_hit_after_set(self):
+        # Arrange
+        cache = RephraseCache()
+        key = cache.make_key("What is the amount?", "friendly", _state())
+
+        # Act
+        miss = cache.get(key)
+        cache.set(key, "How much would you like to send?")
+        hit = cache.get(key)
+
+        # Assert
+        assert miss is None
+        assert hit == "How much would you like to send?"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_tone_is_part_of_key(self):
+        cache = RephraseCache()
+        cache.set(cache.make_key("Hi", "friendly", _state()), "Hey there!")
+
+        assert cache.get(cache.make_key("Hi", "formal", _state())) is None
+
+    def test_context_bucket_only_when_context_aware(self):
+        opening, ongoing = _state("hi"), _state("hi", "send money")
+        plain = RephraseCache()
+        aware = RephraseCache(context_aware=True)
+
+        assert plain.make_key("Hi", "friendly", opening) == plain.make_key(
+            "Hi", "friendly", ongoing
+        )
+        assert aware.make_key("Hi", "friendly", opening) != aware.make_key(
+            "Hi", "friendly", ongoing
+        )
+
+    def test_empty_results_not_cached(self):
+        cache = RephraseCache()
+        key = cache.make_key("Hi", "friendly", _state())
+        cache.set(key, "")
+        assert cache.get(key) is None
+
+    def test_precomputed_entries_serve_every_bucket(self, tmp_path):
+        # Arrange
+        path = tmp_path / "rephrase.json"
+        save_precomputed(path, [("Welcome!", "friendly", "Hi, welcome aboard!")])
+        cache = RephraseCache(context_aware=True)
+
+        # Act
+        loaded = cache.load_precomputed(path)
+        cache.clear()
+
+        # Assert
+        assert loaded == 1
+        for state in (_state("hi"), _state("hi", "again")):
+            assert cache.get(cache.make_key("Welcome!", "friendly", state)) == (
+                "Hi, welcome aboard!"
+            )
+
+    def test_precomputed_roundtrip(self, tmp_path):
+        path = tmp_path / "rephrase.json"
+        entries = [("A", "friendly", "a!"), ("B", "formal", "b.")]
+
+        save_precomputed(path, entries)
+
+        assert read_precomputed(path) == entries
+
+
+class TestStaticTemplates:
+    """Tests for static_templates."""
+
+    def test_collects_slot_free_rephrasable_say_messages(self):
+        # Arrange
+        config = SoniConfig(
+            flows={
+                "transfer": FlowConfig(
+                    steps=[
+                        SayStepConfig(step="hello", message="Welcome!"),
+                        SayStepConfig(step="raw", message="Terms apply.", rephrase=False),
+                        CollectStepConfig(step="ask", slot="amount", message="Amount?"),
+                        SayStepConfig(step="done", message="Sent {amount}"),
+                        WhileStepConfig(
+                            step="loop",
+                            condition="x < 1",
+                            do=[
+                                SetStepConfig(step="inc", slots={"x": 1}),
+                                SayStepConfig(step="again", message="Trying {{again}}"),
+                            ],
+                        ),
+                    ]
+                ),
+                "other": FlowConfig(steps=[SayStepConfig(step="hello", message="Welcome!")]),
+            }
+        )
+
+        # Act
+        templates = static_templates(config)
+
+        # Assert
+        assert templates == ["Welcome!", "Trying {again}"]
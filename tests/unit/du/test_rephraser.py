@@ -114,3 +114,50 @@ def test_rephraser_tone_types():
     assert rephraser_friendly.tone == "friendly"
     assert rephraser_professional.tone == "professional"
     assert rephraser_formal.tone == "formal"
+
+
+@pytest.mark.asyncio
+async def test_rephraser_astream_forwards_chunks():
+    """astream passes streamed chunks to the callback and returns the final text."""
+    # Arrange
+    from unittest.mock import MagicMock, patch
+
+    from soni.du import ResponseRephraser
+
+    chunks = [MagicMock(spec=dspy.streaming.StreamResponse, chunk=c) for c in ("Hi ", "there")]
+
+    async def fake_stream(**kwargs):
+        for chunk in chunks:
+            yield chunk
+        yield dspy.Prediction(polished_response="Hi there")
+
+    rephraser = ResponseRephraser(tone="friendly", use_cot=False)
+    received: list[str] = []
+
+    async def on_chunk(chunk: str) -> None:
+        received.append(chunk)
+
+    # Act
+    with patch("dspy.streamify", return_value=fake_stream):
+        result = await rephraser.astream("Hello", "", on_chunk=on_chunk)
+
+    # Assert
+    assert received == ["Hi ", "there"]
+    assert result == "Hi there"
+
+
+@pytest.mark.asyncio
+async def test_rephraser_astream_without_streaming_lm():
+    """With an LM that doesn't stream, astream still returns the full response."""
+    from soni.du import ResponseRephraser
+
+    rephraser = ResponseRephraser(tone="friendly", use_cot=False)
+    received: list[str] = []
+
+    async def on_chunk(chunk: str) -> None:
+        received.append(chunk)
+
+    result = await rephraser.astream("Your balance is $1234.56", "", on_chunk=on_chunk)
+
+    assert isinstance(result, str)
+    assert len(result) > 0
@@ -0,0 +1,127 @@
+"""Tests for the rule-based NLU fast path."""
+
+from datetime import date
+
+import pytest
+
+from soni.core.commands import AffirmConfirmation, CancelFlow, DenyConfirmation, SetSlot
+from soni.du.models import DialogueContext, SlotDefinition
+from soni.du.rules import (
+    AffirmDenyMatcher,
+    CancelMatcher,
+    OptionMatcher,
+    RuleBasedNLU,
+    TypedSlotMatcher,
+    normalize_message,
+)
+
+
+def _context(**kwargs) -> DialogueContext:
+    return DialogueContext(available_flows=[], available_commands=[], **kwargs)
+
+
+class TestNormalizeMessage:
+    """Tests for normalize_message."""
+
+    def test_strips_case_punctuation_and_whitespace(self):
+        assert normalize_message("  Yes!  ") == "yes"
+        assert normalize_message("Never   mind.") == "never mind"
+
+    def test_keeps_email_characters(self):
+        assert normalize_message("Bob@Example.com") == "bob@example.com"
+
+
+class TestAffirmDenyMatcher:
+    """Tests for AffirmDenyMatcher."""
+
+    @pytest.mark.parametrize("message", ["yes", "Yes.", "OK", "sure!"])
+    def test_affirm_while_confirming(self, message):
+        ctx = _context(active_flow="transfer", conversation_state="confirming")
+        assert AffirmDenyMatcher().match(message, ctx, None) == [AffirmConfirmation()]
+
+    def test_deny_while_confirming(self):
+        ctx = _context(active_flow="transfer", conversation_state="confirming")
+        assert AffirmDenyMatcher().match("no", ctx, None) == [DenyConfirmation()]
+
+    def test_ignored_when_not_confirming(self):
+        ctx = _context(active_flow="transfer", conversation_state="collecting")
+        assert AffirmDenyMatcher().match("yes", ctx, None) is None
+
+    def test_longer_replies_defer_to_llm(self):
+        ctx = _context(active_flow="transfer", conversation_state="confirming")
+        assert AffirmDenyMatcher().match("yes but change the amount", ctx, None) is None
+
+
+class TestOptionMatcher:
+    """Tests for OptionMatcher."""
+
+    def test_exact_option_sets_slot(self):
+        task = {"type": "collect", "slot": "account", "prompt": "?", "options": ["Checking"]}
+        result = OptionMatcher().match("checking", _context(), task)
+        assert result == [SetSlot(slot="account", value="Checking")]
+
+    def test_non_option_defers(self):
+        task = {"type": "collect", "slot": "account", "prompt": "?", "options": ["Checking"]}
+        assert OptionMatcher().match("savings", _context(), task) is None
+
+
+class TestCancelMatcher:
+    """Tests for CancelMatcher."""
+
+    def test_cancel_with_active_flow(self):
+        ctx = _context(active_flow="transfer", conversation_state="collecting")
+        assert CancelMatcher().match("Cancel", ctx, None) == [CancelFlow()]
+
+    def test_no_active_flow_defers(self):
+        assert CancelMatcher().match("cancel", _context(), None) is None
+
+
+class TestTypedSlotMatcher:
+    """Tests for TypedSlotMatcher."""
+
+    def _ctx(self, slot_type: str) -> DialogueContext:
+        return _context(
+            active_flow="transfer",
+            conversation_state="collecting",
+            expected_slot="value",
+            flow_slots=[SlotDefinition(name="value", slot_type=slot_type)],
+        )
+
+    @pytest.mark.parametrize(
+        ("message", "expected"), [("250", 250), ("1,500", 1500), ("99.90", 99.9)]
+    )
+    def test_numbers(self, message, expected):
+        result = TypedSlotMatcher().match(message, self._ctx("number"), None)
+        assert result == [SetSlot(slot="value", value=expected)]
+
+    def test_iso_and_relative_dates(self):
+        matcher = TypedSlotMatcher()
+        assert matcher.match("2025-03-01", self._ctx("date"), None) == [
+            SetSlot(slot="value", value="2025-03-01")
+        ]
+        assert matcher.match("today", self._ctx("date"), None) == [
+            SetSlot(slot="value", value=date.today().isoformat())
+        ]
+
+    def test_email(self):
+        result = TypedSlotMatcher().match("bob@example.com", self._ctx("email"), None)
+        assert result == [SetSlot(slot="value", value="bob@example.com")]
+
+    def test_free_text_slot_defers(self):
+        assert TypedSlotMatcher().match("250", self._ctx("string"), None) is None
+
+    def test_sentence_defers(self):
+        assert TypedSlotMatcher().match("send 250 to mom", self._ctx("number"), None) is None
+
+
+class TestRuleBasedNLU:
+    """Tests for RuleBasedNLU."""
+
+    def test_returns_none_when_no_rule_matches(self):
+        assert RuleBasedNLU().match("I want to transfer money", _context()) is None
+
+    def test_custom_matchers(self):
+        nlu = RuleBasedNLU([CancelMatcher()])
+        ctx = _context(active_flow="transfer", conversation_state="confirming")
+        assert nlu.match("yes", ctx) is None
+        assert nlu.match("stop", ctx) == [CancelFlow()]
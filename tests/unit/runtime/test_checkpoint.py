@@ -0,0 +1,372 @@
+"""Tests for the compact checkpoint representation."""
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.memory import MemorySaver
+
+from soni.config.models import (
+    CollectStepConfig,
+    FlowConfig,
+    PersistenceConfig,
+    SayStepConfig,
+    SetStepConfig,
+    Settings,
+    SoniConfig,
+    WhileStepConfig,
+)
+from soni.core.errors import StateError
+from soni.runtime import checkpoint as checkpoint_module
+from soni.runtime.checkpoint import (
+    EXECUTED_STEPS,
+    STEP_ORDERS_THREAD,
+    CompactCheckpointSaver,
+    StepIndex,
+    compact_values,
+    compact_writes,
+    expand_values,
+    order_key,
+)
+from soni.runtime.loop import RuntimeLoop
+
+
+def _config(steps: list[str] | None = None) -> SoniConfig:
+    names = steps or ["ask_amount", "ask_target", "confirm"]
+    return SoniConfig(
+        flows={
+            "transfer": FlowConfig(
+                description="Transfer",
+                steps=[CollectStepConfig(step=name, slot=name, message="?") for name in names],
+            )
+        }
+    )
+
+
+def _values() -> dict:
+    return {
+        "flow_stack": [
+            {
+                "flow_id": "f1",
+                "flow_name": "transfer",
+                "flow_state": "active",
+                "current_step": "confirm",
+                "step_index": 2,
+            }
+        ],
+        "flow_slots": {"f1": {"ask_amount": 10}},
+        "_executed_steps": {"f1": {"ask_amount", "ask_target"}},
+        "commands": [{"type": "set_slot", "slot": "ask_amount", "value": 10}],
+        "_branch_target": None,
+        "_pending_responses": ["Done"],
+        "_loop_flag": None,
+        "_flow_changed": None,
+    }
+
+
+def _loop_config() -> SoniConfig:
+    return SoniConfig(
+        flows={
+            "loop": FlowConfig(
+                description="Loop",
+                steps=[
+                    WhileStepConfig(
+                        step="guard",
+                        condition="n < 3",
+                        do=[SetStepConfig(step="inc", slots={"n": 1})],
+                    ),
+                    SayStepConfig(step="done", message="Done"),
+                ],
+            )
+        }
+    )
+
+
+def _executed(flow_name: str, steps: set[str]) -> dict:
+    return {
+        "flow_stack": [{"flow_id": "f1", "flow_name": flow_name}],
+        EXECUTED_STEPS: {"f1": steps},
+    }
+
+
+async def _aput_values(saver: CompactCheckpointSaver, thread_id: str) -> dict:
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = _values()
+    versions = {key: saver.get_next_version(None, None) for key in _values()}
+    checkpoint["channel_versions"] = versions
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    return await saver.aput(config, checkpoint, {}, versions)
+
+
+class TestStepIndex:
+    def test_order_of_known_flow(self):
+        index = StepIndex(_config())
+
+        assert index.order("transfer") == ("ask_amount", "ask_target", "confirm")
+        assert index.order("missing") is None
+        assert index.order(None) is None
+
+    def test_includes_inline_while_steps(self):
+        index = StepIndex(_loop_config())
+
+        assert index.order("loop") == ("guard", "inc", "done")
+
+    def test_update_replaces_orders(self):
+        # Arrange
+        index = StepIndex(_config())
+
+        # Act
+        index.update(_config(["confirm", "ask_target", "ask_amount"]))
+
+        # Assert
+        assert index.order("transfer") == ("confirm", "ask_target", "ask_amount")
+
+
+class TestCompactValues:
+    def test_drops_transient_fields(self):
+        # Act
+        compact = compact_values(_values(), StepIndex(_config()))
+
+        # Assert
+        for key in ("commands", "_branch_target", "_pending_responses", "_loop_flag"):
+            assert key not in compact
+        assert compact["flow_slots"] == {"f1": {"ask_amount": 10}}
+
+    def test_executed_steps_stored_as_bitset(self):
+        # Arrange
+        values = _executed("transfer", {"ask_amount", "confirm"})
+
+        # Act
+        compact = compact_values(values, StepIndex(_config()))
+
+        # Assert
+        entry = compact[EXECUTED_STEPS]["__bitsets__"]["f1"]
+        assert entry["b"] == 0b101
+        assert expand_values(compact)[EXECUTED_STEPS] == {"f1": {"ask_amount", "confirm"}}
+
+    def test_executed_steps_roundtrip(self):
+        # Arrange
+        index = StepIndex(_config())
+
+        # Act
+        expanded = expand_values(compact_values(_values(), index))
+
+        # Assert
+        assert expanded[EXECUTED_STEPS] == {"f1": {"ask_amount", "ask_target"}}
+
+    def test_inline_while_steps_roundtrip(self):
+        # Act
+        compact = compact_values(_executed("loop", {"inc", "done"}), StepIndex(_loop_config()))
+
+        # Assert
+        assert expand_values(compact)[EXECUTED_STEPS] == {"f1": {"inc", "done"}}
+
+    def test_unknown_flow_or_step_keeps_step_names(self):
+        # Arrange
+        index = StepIndex(_config())
+
+        # Act
+        unknown_flow = compact_values(_executed("missing", {"ask_amount"}), index)
+        unknown_step = compact_values(_executed("transfer", {"not_a_step"}), index)
+
+        # Assert
+        assert unknown_flow[EXECUTED_STEPS]["__bitsets__"]["f1"] == ["ask_amount"]
+        assert expand_values(unknown_step)[EXECUTED_STEPS] == {"f1": {"not_a_step"}}
+
+    def test_flow_not_on_stack_keeps_step_names(self):
+        # Arrange
+        index = StepIndex(_config())
+        values = _values()
+        values[EXECUTED_STEPS]["orphan"] = {"x", "y"}
+
+        # Act
+        expanded = expand_values(compact_values(values, index))
+
+        # Assert
+        assert expanded[EXECUTED_STEPS]["orphan"] == {"x", "y"}
+
+    def test_decodes_after_flow_edit(self):
+        # Arrange: written before the flow's steps were reordered
+        index = StepIndex(_config())
+        compact = compact_values(_values(), index)
+
+        # Act: the edited flow is all a restarted process knows about
+        index.update(_config(["confirm", "ask_target", "ask_amount"]))
+        expanded = expand_values(compact)
+
+        # Assert
+        assert expanded[EXECUTED_STEPS] == {"f1": {"ask_amount", "ask_target"}}
+        assert compact_values(_values(), index) != compact
+
+    def test_bitsets_carry_order_fingerprint(self):
+        # Arrange
+        values = _values()
+        values["flow_stack"].append({**values["flow_stack"][0], "flow_id": "f2"})
+        values[EXECUTED_STEPS]["f2"] = {"confirm"}
+        key = order_key(("ask_amount", "ask_target", "confirm"))
+
+        # Act
+        compact = compact_values(values, StepIndex(_config()))
+
+        # Assert
+        assert compact[EXECUTED_STEPS] == {
+            "__bitsets__": {"f1": {"o": key, "b": 0b011}, "f2": {"o": key, "b": 0b100}}
+        }
+        assert len(key) == 12
+
+    def test_unknown_order_raises(self):
+        # Arrange
+        compact = compact_values(_values(), StepIndex(_config()))
+
+        # Act & Assert
+        with pytest.raises(StateError):
+            expand_values(compact, orders={})
+
+    def test_uncompacted_values_pass_through(self):
+        values = {"flow_slots": {}, EXECUTED_STEPS: {"f1": {"a"}}}
+
+        assert expand_values(values) == values
+
+
+class TestCompactWrites:
+    def test_drops_transient_writes(self):
+        writes = [("commands", []), ("flow_slots", {}), ("__interrupt__", "x")]
+
+        assert compact_writes(writes) == [("flow_slots", {}), ("__interrupt__", "x")]
+
+
+class TestCompactCheckpointSaver:
+    @pytest.mark.asyncio
+    async def test_put_and_get_roundtrip(self):
+        # Arrange
+        inner = MemorySaver()
+        saver = CompactCheckpointSaver(inner, _config())
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = _values()
+        versions = {key: saver.get_next_version(None, None) for key in _values()}
+        checkpoint["channel_versions"] = versions
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+
+        # Act
+        saved = await saver.aput(config, checkpoint, {}, versions)
+        stored = await inner.aget_tuple(saved)
+        loaded = await saver.aget_tuple(saved)
+
+        # Assert
+        assert stored is not None and loaded is not None
+        assert "commands" not in stored.checkpoint["channel_values"]
+        assert "commands" not in loaded.checkpoint["channel_values"]
+        assert loaded.checkpoint["channel_values"][EXECUTED_STEPS] == {
+            "f1": {"ask_amount", "ask_target"}
+        }
+        assert checkpoint["channel_values"]["commands"]  # input not mutated
+
+    @pytest.mark.asyncio
+    async def test_put_writes_drops_transient_writes(self):
+        # Arrange
+        inner = MemorySaver()
+        saver = CompactCheckpointSaver(inner, _config())
+        checkpoint = empty_checkpoint()
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        saved = await saver.aput(config, checkpoint, {}, {})
+
+        # Act
+        await saver.aput_writes(saved, [("commands", []), ("flow_slots", {"f1": {}})], "task-1")
+        loaded = await saver.aget_tuple(saved)
+
+        # Assert
+        assert loaded is not None
+        assert [(w[1], w[2]) for w in loaded.pending_writes or []] == [("flow_slots", {"f1": {}})]
+
+    @pytest.mark.asyncio
+    async def test_order_record_written_once(self):
+        # Arrange
+        inner = MemorySaver()
+        saver = CompactCheckpointSaver(inner, _config())
+
+        # Act
+        for thread_id in ("t1", "t2"):
+            await _aput_values(saver, thread_id)
+
+        # Assert
+        key = order_key(("ask_amount", "ask_target", "confirm"))
+        assert list(inner.storage[STEP_ORDERS_THREAD]) == [key]
+        assert len(inner.storage[STEP_ORDERS_THREAD][key]) == 1
+
+    @pytest.mark.asyncio
+    async def test_decodes_from_order_record_after_restart(self, monkeypatch):
+        # Arrange
+        inner = MemorySaver()
+        saved = await _aput_values(CompactCheckpointSaver(inner, _config()), "t1")
+
+        # Act: a new process, started after the flow's steps were reordered
+        monkeypatch.setattr(checkpoint_module, "_STEP_ORDERS", {})
+        restarted = CompactCheckpointSaver(inner, _config(["confirm", "ask_target", "ask_amount"]))
+        loaded = await restarted.aget_tuple(saved)
+
+        # Assert
+        assert loaded is not None
+        assert loaded.checkpoint["channel_values"][EXECUTED_STEPS] == {
+            "f1": {"ask_amount", "ask_target"}
+        }
+
+    def test_sync_put_and_get_use_order_record(self, monkeypatch):
+        # Arrange
+        inner = MemorySaver()
+        saver = CompactCheckpointSaver(inner, _config())
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = _values()
+        versions = {key: saver.get_next_version(None, None) for key in _values()}
+        checkpoint["channel_versions"] = versions
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        saved = saver.put(config, checkpoint, {}, versions)
+
+        # Act
+        monkeypatch.setattr(checkpoint_module, "_STEP_ORDERS", {})
+        loaded = CompactCheckpointSaver(inner, SoniConfig()).get_tuple(saved)
+
+        # Assert
+        assert loaded is not None
+        assert loaded.checkpoint["channel_values"][EXECUTED_STEPS] == {
+            "f1": {"ask_amount", "ask_target"}
+        }
+
+    @pytest.mark.asyncio
+    async def test_missing_order_record_raises(self, monkeypatch):
+        # Arrange
+        inner = MemorySaver()
+        saved = await _aput_values(CompactCheckpointSaver(inner, _config()), "t1")
+        await inner.adelete_thread(STEP_ORDERS_THREAD)
+        monkeypatch.setattr(checkpoint_module, "_STEP_ORDERS", {})
+
+        # Act & Assert
+        with pytest.raises(StateError):
+            await CompactCheckpointSaver(inner, SoniConfig()).aget_tuple(saved)
+
+    def test_compact_form_is_smaller(self):
+        # Arrange
+        saver = CompactCheckpointSaver(MemorySaver(), _config())
+        values = _values()
+
+        # Act
+        full = saver.serde.dumps_typed(values)[1]
+        compact = saver.serde.dumps_typed(compact_values(values, saver.step_index))[1]
+
+        # Assert
+        assert len(compact) < len(full)
+
+
+class TestRuntimeLoopWiring:
+    def test_disabled_by_default(self):
+        inner = MemorySaver()
+
+        assert RuntimeLoop(_config(), checkpointer=inner).checkpointer is inner
+
+    def test_wraps_checkpointer_when_enabled(self):
+        # Arrange
+        config = _config()
+        config.settings = Settings(persistence=PersistenceConfig(compact_checkpoints=True))
+
+        # Act
+        loop = RuntimeLoop(config, checkpointer=MemorySaver())
+
+        # Assert
+        assert isinstance(loop.checkpointer, CompactCheckpointSaver)
@@ -0,0 +1,81 @@
+"""Tests for the polling config watcher."""
+
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+
+from soni.runtime.config_watcher import ConfigWatcher
+
+
+def _touch(path, content: str) -> None:
+    path.write_text(content)
+    # Bump mtime explicitly: writes within the same tick may keep it unchanged
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestConfigWatcher:
+    """Tests for ConfigWatcher."""
+
+    @pytest.mark.asyncio
+    async def test_no_change_does_not_trigger(self, tmp_path):
+        config_file = tmp_path / "soni.yaml"
+        config_file.write_text("flows: {}")
+        on_change = AsyncMock()
+
+        watcher = ConfigWatcher(config_file, on_change)
+
+        assert await watcher.check() is False
+        on_change.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_file_edit_triggers_once(self, tmp_path):
+        # Arrange
+        config_file = tmp_path / "soni.yaml"
+        config_file.write_text("flows: {}")
+        on_change = AsyncMock()
+        watcher = ConfigWatcher(config_file, on_change)
+
+        # Act
+        _touch(config_file, "flows: {a: {steps: []}}")
+        first = await watcher.check()
+        second = await watcher.check()
+
+        # Assert
+        assert (first, second) == (True, False)
+        on_change.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_directory_watches_new_yaml_files(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("flows: {}")
+        on_change = AsyncMock()
+        watcher = ConfigWatcher(tmp_path, on_change)
+
+        (tmp_path / "b.yaml").write_text("flows: {}")
+
+        assert await watcher.check() is True
+
+    @pytest.mark.asyncio
+    async def test_failed_reload_is_logged_not_raised(self, tmp_path):
+        config_file = tmp_path / "soni.yaml"
+        config_file.write_text("flows: {}")
+        watcher = ConfigWatcher(config_file, AsyncMock(side_effect=ValueError("bad yaml")))
+
+        _touch(config_file, "flows: [")
+
+        assert await watcher.check() is True
+
+    @pytest.mark.asyncio
+    async def test_directory_with_master_file_ignores_other_yaml(self, tmp_path):
+        # Arrange
+        (tmp_path / "soni.yaml").write_text("flows: {}")
+        on_change = AsyncMock()
+        watcher = ConfigWatcher(tmp_path, on_change)
+
+        # Act: not loaded by ConfigLoader when soni.yaml exists
+        (tmp_path / "notes.yaml").write_text("x: 1")
+
+        # Assert
+        assert await watcher.check() is False
+        on_change.assert_not_awaited()
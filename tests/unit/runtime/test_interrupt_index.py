@@ -0,0 +1,50 @@
+"""Tests for the in-memory interrupt index."""
+
+from soni.runtime.interrupt_index import InterruptIndex
+
+
+class TestInterruptIndex:
+    """Tests for InterruptIndex."""
+
+    def test_unknown_thread_returns_none(self):
+        """Unknown threads are a cache miss."""
+        index = InterruptIndex()
+        assert index.get("t1") is None
+        assert index.misses == 1
+
+    def test_records_and_returns_status(self):
+        """Recorded status is returned as a hit."""
+        index = InterruptIndex()
+        index.record("t1", True)
+        index.record("t2", False)
+        assert index.get("t1") is True
+        assert index.get("t2") is False
+        assert index.hits == 2
+
+    def test_invalidate_forgets_thread(self):
+        """Invalidated threads fall back to a miss."""
+        index = InterruptIndex()
+        index.record("t1", True)
+        index.invalidate("t1")
+        assert index.get("t1") is None
+
+    def test_evicts_least_recently_used(self):
+        """Index is bounded by maxsize."""
+        index = InterruptIndex(maxsize=2)
+        index.record("t1", True)
+        index.record("t2", True)
+        index.record("t3", True)
+        assert index.get("t1") is None
+        assert index.get("t3") is True
+
+    def test_disabled_when_size_zero(self):
+        """Size 0 disables caching entirely."""
+        index = InterruptIndex(maxsize=0)
+        index.record("t1", True)
+        assert index.get("t1") is None
+
+    def test_is_interrupted_detects_pending_task(self):
+        """Results with an interrupt or pending task are interrupted."""
+        assert InterruptIndex.is_interrupted({"__interrupt__": [object()]})
+        assert InterruptIndex.is_interrupted({"_pending_task": {"type": "collect"}})
+        assert not InterruptIndex.is_interrupted({"_pending_task": None, "response": "Hi"})
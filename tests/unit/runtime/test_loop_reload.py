@@ -0,0 +1,52 @@
+"""Tests for RuntimeLoop hot reload."""
+
+import pytest
+
+from soni.config.models import FlowConfig, SayStepConfig, SoniConfig
+from soni.runtime.loop import RuntimeLoop
+
+
+def _config(**messages: str) -> SoniConfig:
+    return SoniConfig(
+        flows={
+            name: FlowConfig(description=name, steps=[SayStepConfig(step="hi", message=message)])
+            for name, message in messages.items()
+        }
+    )
+
+
+class TestRuntimeLoopReload:
+    """Tests for RuntimeLoop.reload."""
+
+    @pytest.mark.asyncio
+    async def test_reload_without_init_fails(self):
+        loop = RuntimeLoop(_config(a="x"))
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await loop.reload(_config(a="y"))
+
+    @pytest.mark.asyncio
+    async def test_reload_swaps_context_and_reuses_unchanged_flows(self):
+        # Arrange
+        async with RuntimeLoop(_config(keep="same", edit="before")) as loop:
+            old_context = loop._context
+            assert old_context is not None
+            old_keep = old_context.subgraph_registry.get("keep")
+            new_config = _config(keep="same", edit="after", added="new")
+
+            # Act
+            diff = await loop.reload(new_config)
+
+            # Assert
+            new_context = loop._context
+            assert new_context is not None
+            assert diff.unchanged == ["keep"]
+            assert diff.changed == ["edit"]
+            assert diff.added == ["added"]
+            assert loop.config is new_config
+            assert new_context.config is new_config
+            assert new_context.subgraph_registry.get("keep") is old_keep
+            assert new_context.nlu_catalog is not None
+            assert new_context.nlu_catalog.flow_info("added") is not None
+            # The previous context (held by in-flight turns) is untouched
+            assert old_context.subgraph_registry.get("added") is None
+            assert old_context.nlu_catalog.flow_info("added") is None
@@ -0,0 +1,66 @@
+"""Tests for checkpointer construction from PersistenceConfig."""
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from soni.config.models import PersistenceConfig, Settings, SoniConfig
+from soni.core.errors import ConfigError
+from soni.runtime.loop import RuntimeLoop
+from soni.runtime.persistence import open_checkpointer, postgres_pool_kwargs
+
+
+class TestOpenCheckpointer:
+    @pytest.mark.asyncio
+    async def test_memory_backend(self):
+        async with open_checkpointer(PersistenceConfig()) as saver:
+            assert isinstance(saver, MemorySaver)
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend(self, tmp_path):
+        # Arrange
+        config = PersistenceConfig(backend="sqlite", path=str(tmp_path / "state.db"))
+
+        # Act & Assert
+        async with open_checkpointer(config) as saver:
+            assert isinstance(saver, AsyncSqliteSaver)
+
+    @pytest.mark.asyncio
+    async def test_postgres_requires_connection_string(self):
+        # Arrange
+        pytest.importorskip("langgraph.checkpoint.postgres")
+        config = PersistenceConfig(backend="postgres")
+
+        # Act & Assert
+        with pytest.raises(ConfigError, match="connection string"):
+            async with open_checkpointer(config):
+                pass
+
+
+class TestPostgresPoolKwargs:
+    def test_settings_required_by_saver(self):
+        # Arrange
+        pytest.importorskip("psycopg")
+        config = PersistenceConfig(backend="postgres", prepare_threshold=None)
+
+        # Act
+        kwargs = postgres_pool_kwargs(config)
+
+        # Assert
+        assert kwargs["autocommit"] is True
+        assert kwargs["prepare_threshold"] is None
+        assert kwargs["row_factory"] is not None
+
+
+class TestInterruptIndexWithPostgres:
+    def test_index_disabled_for_shared_backend(self):
+        """Workers sharing Postgres must not trust a per-process interrupt cache."""
+        # Arrange
+        persistence = PersistenceConfig(backend="postgres", path="postgresql://localhost/soni")
+        loop = RuntimeLoop(SoniConfig(settings=Settings(persistence=persistence)))
+
+        # Act
+        loop._interrupt_index.record("thread_u1", True)
+
+        # Assert
+        assert loop._interrupt_index.get("thread_u1") is None
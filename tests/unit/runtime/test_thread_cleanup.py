@@ -0,0 +1,199 @@
+"""Tests for idle-thread eviction (ThreadJanitor)."""
+
+import asyncio
+from typing import TypedDict
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph import END, StateGraph
+
+from soni.config.models import SoniConfig
+from soni.runtime.checkpoint import STEP_ORDERS_THREAD, CompactCheckpointSaver
+from soni.runtime.thread_cleanup import ThreadJanitor
+
+
+class CounterState(TypedDict):
+    value: int
+
+
+def _graph(checkpointer):
+    builder = StateGraph(CounterState)
+    builder.add_node("inc", lambda state: {"value": state["value"] + 1})
+    builder.set_entry_point("inc")
+    builder.add_edge("inc", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+async def _touch(graph, thread_id: str) -> None:
+    await graph.ainvoke({"value": 0}, config={"configurable": {"thread_id": thread_id}})
+
+
+async def _threads(saver) -> set[str]:
+    return {item.config["configurable"]["thread_id"] async for item in saver.alist(None)}
+
+
+class TestThreadJanitor:
+    @pytest.mark.asyncio
+    async def test_evicts_only_idle_threads(self):
+        # Arrange
+        saver = MemorySaver()
+        graph = _graph(saver)
+        await _touch(graph, "old")
+        await asyncio.sleep(0.3)
+        await _touch(graph, "recent")
+        evicted: list[str] = []
+        janitor = ThreadJanitor(saver, ttl_seconds=0.15, on_evict=evicted.append)
+
+        # Act
+        count = await janitor.run_once()
+
+        # Assert
+        assert count == 1
+        assert evicted == ["old"]
+        assert await _threads(saver) == {"recent"}
+
+    @pytest.mark.asyncio
+    async def test_skips_threads_with_a_turn_in_progress(self):
+        # Arrange
+        saver = MemorySaver()
+        graph = _graph(saver)
+        for thread_id in ("idle", "busy"):
+            await _touch(graph, thread_id)
+        await asyncio.sleep(0.05)
+        evicted: list[str] = []
+        janitor = ThreadJanitor(
+            saver,
+            ttl_seconds=0.01,
+            on_evict=evicted.append,
+            is_busy=lambda thread_id: thread_id == "busy",
+        )
+
+        # Act
+        count = await janitor.run_once()
+
+        # Assert
+        assert count == 1
+        assert evicted == ["idle"]
+        assert await _threads(saver) == {"busy"}
+
+    @pytest.mark.asyncio
+    async def test_thread_busy_after_scan_is_not_counted_as_reclaimed(self):
+        # Arrange
+        saver = MemorySaver()
+        graph = _graph(saver)
+        for thread_id in ("idle", "late"):
+            await _touch(graph, thread_id)
+        await asyncio.sleep(0.05)
+        checks: list[str] = []
+
+        def is_busy(thread_id: str) -> bool:
+            # "late" gets a turn between the scan and its delete
+            checks.append(thread_id)
+            return thread_id == "late" and checks.count("late") > 1
+
+        janitor = ThreadJanitor(saver, ttl_seconds=0.01, is_busy=is_busy)
+        expected = (await janitor._store.sizes(["idle"]))["idle"]
+
+        # Act
+        count = await janitor.run_once()
+
+        # Assert
+        assert count == 1
+        assert await _threads(saver) == {"late"}
+        assert janitor.stats.bytes_reclaimed == expected
+
+    @pytest.mark.asyncio
+    async def test_records_metrics(self):
+        # Arrange
+        saver = MemorySaver()
+        graph = _graph(saver)
+        for thread_id in ("a", "b", "c"):
+            await _touch(graph, thread_id)
+        await asyncio.sleep(0.05)
+        janitor = ThreadJanitor(saver, ttl_seconds=0.01, batch_size=2, batch_pause=0)
+
+        # Act
+        await janitor.run_once()
+
+        # Assert
+        stats = janitor.stats
+        assert stats.runs == 1
+        assert stats.threads_scanned == 3
+        assert stats.threads_evicted == 3
+        assert stats.last_run_evicted == 3
+        assert stats.bytes_reclaimed > 0
+        assert stats.last_run_at is not None
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_evict(self):
+        # Arrange
+        saver = MemorySaver()
+        await _touch(_graph(saver), "fresh")
+        janitor = ThreadJanitor(saver, ttl_seconds=3600)
+
+        # Act & Assert
+        assert await janitor.run_once() == 0
+        assert janitor.stats.bytes_reclaimed == 0
+        assert await _threads(saver) == {"fresh"}
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend(self, tmp_path):
+        # Arrange
+        async with AsyncSqliteSaver.from_conn_string(str(tmp_path / "state.db")) as saver:
+            graph = _graph(saver)
+            await _touch(graph, "old")
+            await asyncio.sleep(0.05)
+            janitor = ThreadJanitor(saver, ttl_seconds=0.01)
+
+            # Act
+            count = await janitor.run_once()
+
+            # Assert
+            assert count == 1
+            assert janitor.stats.bytes_reclaimed > 0
+            assert await _threads(saver) == set()
+
+    @pytest.mark.asyncio
+    async def test_keeps_step_order_record(self):
+        # Arrange: the record has no root checkpoint, like an empty thread
+        saver = MemorySaver()
+        record = {"configurable": {"thread_id": STEP_ORDERS_THREAD, "checkpoint_ns": "k"}}
+        await saver.aput(record, empty_checkpoint(), {}, {})
+        await asyncio.sleep(0.05)
+        janitor = ThreadJanitor(saver, ttl_seconds=0.01)
+
+        # Act
+        count = await janitor.run_once()
+
+        # Assert
+        assert count == 0
+        assert await saver.aget_tuple(record) is not None
+
+    def test_unwraps_compact_checkpointer(self):
+        inner = MemorySaver()
+        janitor = ThreadJanitor(CompactCheckpointSaver(inner, SoniConfig()), ttl_seconds=60)
+
+        assert janitor.checkpointer is inner
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            ThreadJanitor(MemorySaver(), ttl_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        # Arrange
+        saver = MemorySaver()
+        await _touch(_graph(saver), "old")
+        await asyncio.sleep(0.02)
+        janitor = ThreadJanitor(saver, ttl_seconds=0.01, interval=0.01)
+
+        # Act
+        janitor.start()
+        await asyncio.sleep(0.1)
+        await janitor.stop()
+
+        # Assert
+        assert janitor.stats.runs >= 1
+        assert await _threads(saver) == set()
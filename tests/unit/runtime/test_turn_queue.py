@@ -0,0 +1,125 @@
+"""Tests for per-thread turn serialization."""
+
+import asyncio
+
+import pytest
+
+from soni.core.errors import TurnQueueFullError
+from soni.runtime.turn_queue import TurnQueue
+
+
+class TestTurnQueue:
+    """Tests for TurnQueue."""
+
+    @pytest.mark.asyncio
+    async def test_same_thread_turns_run_in_order(self):
+        """Turns for one thread never overlap and keep arrival order."""
+        # Arrange
+        queue = TurnQueue(max_queued_turns=10)
+        events: list[str] = []
+
+        async def handler(message: str) -> str:
+            events.append(f"start:{message}")
+            await asyncio.sleep(0.01)
+            events.append(f"end:{message}")
+            return message.upper()
+
+        # Act
+        results = await asyncio.gather(
+            queue.run("t1", "a", handler),
+            queue.run("t1", "b", handler),
+            queue.run("t1", "c", handler),
+        )
+
+        # Assert
+        assert results == ["A", "B", "C"]
+        assert events == ["start:a", "end:a", "start:b", "end:b", "start:c", "end:c"]
+        assert not queue.is_busy("t1")
+
+    @pytest.mark.asyncio
+    async def test_different_threads_run_concurrently(self):
+        """Turns for different threads overlap."""
+        # Arrange
+        queue = TurnQueue()
+        running = 0
+        max_running = 0
+
+        async def handler(message: str) -> str:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return message
+
+        # Act
+        await asyncio.gather(*(queue.run(f"t{i}", "hi", handler) for i in range(5)))
+
+        # Assert
+        assert max_running == 5
+
+    @pytest.mark.asyncio
+    async def test_reject_policy_raises_when_full(self):
+        """Messages beyond the queue depth are rejected."""
+        # Arrange
+        queue = TurnQueue(max_queued_turns=1, overflow_policy="reject")
+        release = asyncio.Event()
+
+        async def handler(message: str) -> str:
+            await release.wait()
+            return message
+
+        running = asyncio.create_task(queue.run("t1", "first", handler))
+        waiting = asyncio.create_task(queue.run("t1", "second", handler))
+        await asyncio.sleep(0)
+
+        # Act & Assert
+        with pytest.raises(TurnQueueFullError):
+            await queue.run("t1", "third", handler)
+
+        release.set()
+        assert await running == "first"
+        assert await waiting == "second"
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_merges_into_waiting_turn(self):
+        """Overflowing messages are merged into the newest waiting turn."""
+        # Arrange
+        queue = TurnQueue(max_queued_turns=1, overflow_policy="coalesce")
+        release = asyncio.Event()
+        handled: list[str] = []
+
+        async def handler(message: str) -> str:
+            await release.wait()
+            handled.append(message)
+            return message
+
+        first = asyncio.create_task(queue.run("t1", "first", handler))
+        second = asyncio.create_task(queue.run("t1", "second", handler))
+        third = asyncio.create_task(queue.run("t1", "third", handler))
+        await asyncio.sleep(0)
+
+        # Act
+        release.set()
+        results = await asyncio.gather(first, second, third)
+
+        # Assert
+        assert handled == ["first", "second\nthird"]
+        assert results == ["first", "second\nthird", "second\nthird"]
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_propagate_to_caller(self):
+        """An error in one turn is raised to its caller and doesn't block the thread."""
+        # Arrange
+        queue = TurnQueue()
+
+        async def failing(message: str) -> str:
+            raise ValueError("boom")
+
+        async def ok(message: str) -> str:
+            return message
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="boom"):
+            await queue.run("t1", "x", failing)
+        assert await queue.run("t1", "y", ok) == "y"
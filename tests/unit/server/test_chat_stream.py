@@ -0,0 +1,57 @@
+"""Tests for the /chat/stream SSE endpoint."""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock
+
+from fastapi.testclient import TestClient
+
+from soni.core.errors import TurnQueueFullError
+
+
+def _events(body: str) -> list[tuple[str, dict[str, Any]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestChatStreamEndpoint:
+    """Tests for /chat/stream."""
+
+    def test_streams_deltas_messages_and_done(self, test_client: TestClient, mock_runtime):
+        # Arrange
+        async def process_message(message: str, user_id: str, message_sink: Any) -> str:
+            await message_sink.send_chunk("Hel")
+            await message_sink.send_chunk("lo")
+            await message_sink.send("Hello!")
+            return "Hello!"
+
+        mock_runtime.process_message = AsyncMock(side_effect=process_message)
+
+        # Act
+        response = test_client.post("/chat/stream", json={"message": "hi", "user_id": "u1"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert _events(response.text) == [
+            ("delta", {"content": "Hel"}),
+            ("delta", {"content": "lo"}),
+            ("message", {"content": "Hello!"}),
+            ("done", {"response": "Hello!"}),
+        ]
+
+    def test_queue_full_is_reported_as_error_event(self, test_client: TestClient, mock_runtime):
+        mock_runtime.process_message = AsyncMock(side_effect=TurnQueueFullError("full"))
+
+        response = test_client.post("/chat/stream", json={"message": "hi", "user_id": "u1"})
+
+        assert _events(response.text) == [
+            ("error", {"error": "Too many pending messages", "message": "full"})
+        ]
+
+    def test_validates_request(self, test_client: TestClient):
+        response = test_client.post("/chat/stream", json={"message": "", "user_id": "u1"})
+        assert response.status_code == 422
@@ -0,0 +1,59 @@
+"""Tests for the /admin/cleanup metrics endpoint."""
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from soni.runtime.thread_cleanup import ThreadJanitor
+
+ADMIN_HEADERS = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def admin_token(monkeypatch):
+    monkeypatch.setenv("SONI_ADMIN_TOKEN", "secret")
+
+
+class TestCleanupStatsEndpoint:
+    """Tests for /admin/cleanup."""
+
+    def test_disabled_without_janitor(self, test_client):
+        # Arrange
+        test_client.app.state.janitor = None
+
+        # Act
+        response = test_client.get("/admin/cleanup", headers=ADMIN_HEADERS)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["enabled"] is False
+
+    def test_reports_janitor_stats(self, test_client):
+        # Arrange
+        janitor = ThreadJanitor(MemorySaver(), ttl_seconds=600)
+        janitor.stats.runs = 2
+        janitor.stats.threads_evicted = 5
+        janitor.stats.bytes_reclaimed = 4096
+        test_client.app.state.janitor = janitor
+
+        # Act
+        response = test_client.get("/admin/cleanup", headers=ADMIN_HEADERS)
+
+        # Assert
+        data = response.json()
+        assert data["enabled"] is True
+        assert data["thread_ttl"] == 600
+        assert data["threads_evicted"] == 5
+        assert data["bytes_reclaimed"] == 4096
+        test_client.app.state.janitor = None
+
+    def test_admin_token_required(self, test_client):
+        response = test_client.get("/admin/cleanup")
+
+        assert response.status_code == 403
+
+    def test_disabled_without_admin_token(self, test_client, monkeypatch):
+        monkeypatch.delenv("SONI_ADMIN_TOKEN")
+
+        response = test_client.get("/admin/cleanup", headers=ADMIN_HEADERS)
+
+        assert response.status_code == 403
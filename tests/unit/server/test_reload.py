@@ -0,0 +1,72 @@
+"""Tests for the /admin/reload endpoint."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from soni.compiler.incremental import FlowDiff
+
+ADMIN_HEADERS = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def admin_token(monkeypatch):
+    monkeypatch.setenv("SONI_ADMIN_TOKEN", "secret")
+
+
+class TestReloadEndpoint:
+    """Tests for /admin/reload."""
+
+    def test_reload_reports_flow_diff(self, test_client: TestClient, mock_runtime, tmp_path):
+        # Arrange
+        config_file = tmp_path / "soni.yaml"
+        config_file.write_text(
+            "flows:\n"
+            "  greet:\n"
+            "    steps:\n"
+            "      - step: hi\n"
+            "        type: say\n"
+            "        message: Hi\n"
+        )
+        test_client.app.state.config_path = str(config_file)
+        mock_runtime.reload = AsyncMock(return_value=FlowDiff(changed=["greet"]))
+
+        # Act
+        response = test_client.post("/admin/reload", headers=ADMIN_HEADERS)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["changed"] == ["greet"]
+        mock_runtime.reload.assert_awaited_once()
+        assert "greet" in test_client.app.state.config.flows
+
+    def test_invalid_yaml_keeps_current_config(
+        self, test_client: TestClient, mock_runtime, tmp_path
+    ):
+        config_file = tmp_path / "soni.yaml"
+        config_file.write_text("flows: [")
+        test_client.app.state.config_path = str(config_file)
+        mock_runtime.reload = AsyncMock()
+
+        response = test_client.post("/admin/reload", headers=ADMIN_HEADERS)
+
+        assert response.status_code == 422
+        mock_runtime.reload.assert_not_awaited()
+
+    def test_wrong_admin_token_is_rejected(self, test_client: TestClient, mock_runtime):
+        response = test_client.post("/admin/reload", headers={"X-Admin-Token": "wrong"})
+
+        assert response.status_code == 403
+
+    def test_disabled_without_admin_token(self, test_client: TestClient, mock_runtime, monkeypatch):
+        # Arrange
+        monkeypatch.delenv("SONI_ADMIN_TOKEN")
+        mock_runtime.reload = AsyncMock()
+
+        # Act
+        response = test_client.post("/admin/reload")
+
+        # Assert
+        assert response.status_code == 403
+        mock_runtime.reload.assert_not_awaited()